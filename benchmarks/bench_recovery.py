@@ -0,0 +1,113 @@
+"""
+Tempo di riavvio di un'asta al crescere della storia: replay completo del log
+contro checkpoint + coda. Lo stato (giocatori, rose) resta fisso, cresce solo il
+numero di eventi, come in una stagione di mercati di riparazione.
+
+    python benchmarks/bench_recovery.py --events 1000 10000 100000 --tail 200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from api.checkpoint import capture_state, write_checkpoint  # noqa: E402
+from api.encoding import encode_message  # noqa: E402
+from api.event_log import event_to_record  # noqa: E402
+from api.recovery import replay_auction  # noqa: E402
+from api.routers import auctions as auctions_router  # noqa: E402
+from core.events import (  # noqa: E402
+    AuctionCreated,
+    ParticipantAssigned,
+    ParticipantJoined,
+    ParticipantLeft,
+    PlayerAssigned,
+    PlayerCalled,
+    PlayersAdded,
+)
+
+ROLES = ("GOALKEEPER", "DEFENDER", "MIDFIELDER", "FORWARD")
+PLAYERS = 500
+TEAMS = 8
+
+
+def _history(events: int):
+    yield AuctionCreated(auction_id="bench", name="Bench", max_teams=TEAMS, options={
+        "name": "Bench", "nickname": "host", "budget": 500, "max_teams": TEAMS,
+    })
+    yield PlayersAdded(players=[[1000 + i, f"Player {i}", ROLES[i % 4], f"Club {i % 20}"] for i in range(PLAYERS)])
+    for team_id in range(1, TEAMS + 1):
+        yield ParticipantJoined(participant_id=f"p{team_id}", name=f"Manager {team_id}")
+        yield ParticipantAssigned(participant_id=f"p{team_id}", team_id=team_id)
+    produced = 2 + 2 * TEAMS
+    assigned = 0
+    while produced < events:
+        team_id = produced % TEAMS + 1
+        if assigned < PLAYERS - 100:
+            player_id = 1000 + assigned
+            yield PlayerCalled(player_id=player_id, player_name=f"Player {assigned}", role=ROLES[assigned % 4], caller_id=f"p{team_id}")
+            yield PlayerAssigned(team_id=team_id, team_name=f"Team {team_id}", player_id=player_id, player_name=f"Player {assigned}", price=1)
+            assigned += 1
+        else:
+            # storia senza effetti sulle rose: riconnessioni dei partecipanti
+            yield ParticipantLeft(participant_id=f"p{team_id}")
+            yield ParticipantJoined(participant_id=f"p{team_id}", name=f"Manager {team_id}")
+        produced += 2
+
+
+def _write(path: str, events, start_seq: int) -> int:
+    seq = start_seq
+    with open(path, "ab") as f:
+        for event in events:
+            seq += 1
+            f.write(encode_message(event_to_record(seq, event)).encode() + b"\n")
+    return seq
+
+
+def _timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(events: int, tail: int, repeat: int) -> dict:
+    history = list(_history(events))
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "bench.jsonl")
+        ckpt_path = os.path.join(tmp, "bench.ckpt")
+        head, rest = history[:-tail], history[-tail:]
+
+        seq = _write(log_path, head, 0)
+        state = capture_state(replay_auction(log_path))
+        state["seq"] = seq
+        state["offset"] = os.path.getsize(log_path)
+        write_checkpoint(ckpt_path, state)
+        _write(log_path, rest, seq)
+
+        full = _timed(lambda: replay_auction(log_path), repeat)
+        checkpointed = _timed(lambda: replay_auction(log_path, ckpt_path), repeat)
+    return {"events": len(history), "full_replay_ms": full * 1000, "checkpoint_ms": checkpointed * 1000}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--tail", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # nessun log reale viene riaperto durante la misura
+    auctions_router.event_log_dir = None
+    print(f"{'events':>10} {'full replay ms':>16} {'checkpoint+tail ms':>20}")
+    for events in args.events:
+        result = run(events, args.tail, args.repeat)
+        print(f"{result['events']:>10} {result['full_replay_ms']:>16.1f} {result['checkpoint_ms']:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
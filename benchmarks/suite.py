@@ -0,0 +1,561 @@
+"""
+Benchmark dei percorsi caldi di core e api, senza rete: ogni caso misura il tempo
+per operazione (migliore di più round, numero di iterazioni calibrato) e i
+risultati si possono salvare in JSON e confrontare con una baseline versionata.
+
+    python benchmarks/suite.py                                   # tabella
+    python benchmarks/suite.py --json results.json               # risultati in JSON
+    python benchmarks/suite.py --compare benchmarks/baseline.json --tolerance 1.5
+    python benchmarks/suite.py --update-baseline                 # riscrive la baseline
+    python benchmarks/suite.py -k snapshot -k broadcast          # solo alcuni casi
+
+Con --compare il processo esce con codice 1 se un caso è più lento della baseline
+oltre la tolleranza (rapporto tra i tempi). I tempi assoluti dipendono dalla
+macchina: la baseline va rigenerata quando cambia l'hardware di riferimento.
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import platform
+import sys
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+
+from api.auction_room import AuctionRoom  # noqa: E402
+from api.remote_participant import RemoteParticipant  # noqa: E402
+from api.routers.auctions import _build_snapshot  # noqa: E402
+from core.auction import Auction  # noqa: E402
+from core.bidding_strategies import ClosedBidStrategy, FreeBiddingStrategy, PokerBiddingStrategy  # noqa: E402
+from core.eligibility import EligibilityEngine  # noqa: E402
+from core.enums import PlayerRole  # noqa: E402
+from core.market_rules import MultiCopyMarket, UniquePlayerMarket  # noqa: E402
+from core.ownership_policies import MaxCopiesOwnershipPolicy, NoDuplicatesOwnershipPolicy  # noqa: E402
+from core.player_pool import PlayerPool  # noqa: E402
+from core.player_pool_builders.role_sequential_pool_builder import RoleSequentialPoolBuilder  # noqa: E402
+from core.simulation import DEFAULT_ROSTER, AuctionSimulation, generate_players  # noqa: E402
+from core.team import Team  # noqa: E402
+from core.team_building_strategies.fixed_max_strategy import FixedMaxStrategy  # noqa: E402
+from core.team_building_strategies.min_max_strategy import MinMaxStrategy  # noqa: E402
+
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+RESULTS_FORMAT = 1
+
+# listone realistico: ~500 giocatori, 20 squadre di serie A
+PLAYERS = generate_players({
+    PlayerRole.GOALKEEPER: 60,
+    PlayerRole.DEFENDER: 160,
+    PlayerRole.MIDFIELDER: 160,
+    PlayerRole.FORWARD: 120,
+})
+ROSTER_SIZE = sum(DEFAULT_ROSTER.values())
+
+
+# --- misura --------------------------------------------------------------------
+
+class Case:
+    """
+    Un caso: setup() prepara lo stato (fuori dalla misura), fn(state) è l'operazione
+    misurata; può essere una coroutine, eseguita sull'event loop del benchmark.
+    fresh=True rifà il setup per ogni iterazione (operazioni che consumano lo stato);
+    teardown(state), se presente, libera lo stato condiviso a fine misura.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[], object],
+        fn: Callable,
+        fresh: bool = False,
+        teardown: Optional[Callable[[object], None]] = None,
+    ):
+        self.name = name
+        self.setup = setup
+        self.fn = fn
+        self.fresh = fresh
+        self.teardown = teardown
+
+
+CASES: List[Case] = []
+
+
+def case(name: str, setup: Callable[[], object], fresh: bool = False, teardown: Optional[Callable[[object], None]] = None):
+    def register(fn):
+        CASES.append(Case(name, setup, fn, fresh, teardown))
+        return fn
+    return register
+
+
+def _run_round(loop: asyncio.AbstractEventLoop, bench: Case, number: int, shared) -> float:
+    states = [bench.setup() for _ in range(number)] if bench.fresh else None
+    fn = bench.fn
+    if inspect.iscoroutinefunction(fn):
+        async def batch() -> float:
+            started = time.perf_counter()
+            for i in range(number):
+                await fn(states[i] if states is not None else shared)
+            return time.perf_counter() - started
+        return loop.run_until_complete(batch())
+    started = time.perf_counter()
+    for i in range(number):
+        fn(states[i] if states is not None else shared)
+    return time.perf_counter() - started
+
+
+def measure(loop: asyncio.AbstractEventLoop, bench: Case, min_time: float, rounds: int) -> dict:
+    shared = None if bench.fresh else _on_loop(loop, bench.setup)
+    # calibrazione: iterazioni sufficienti perché un round duri almeno min_time
+    number = 1
+    while True:
+        elapsed = _run_round(loop, bench, number, shared)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.2))
+    best = elapsed / number
+    for _ in range(rounds - 1):
+        best = min(best, _run_round(loop, bench, number, shared) / number)
+    if bench.teardown is not None:
+        _on_loop(loop, lambda: bench.teardown(shared))
+    return {"ns_per_op": best * 1e9, "number": number, "rounds": rounds}
+
+
+def _on_loop(loop: asyncio.AbstractEventLoop, setup: Callable[[], object]):
+    # alcuni setup aprono connessioni e task: servono dentro l'event loop
+    async def call():
+        return setup()
+    return loop.run_until_complete(call())
+
+
+# --- PlayerPool ----------------------------------------------------------------
+
+def _teams(count: int) -> List[Team]:
+    return [Team(i, f"Team {i}") for i in range(1, count + 1)]
+
+
+def _half_assigned_pool() -> PlayerPool:
+    pool = PlayerPool(PLAYERS)
+    teams = _teams(20)
+    for i, player in enumerate(PLAYERS[: len(PLAYERS) // 2]):
+        pool.assign_to_team(player, teams[i % 20], 1)
+    return pool
+
+
+@case("pool.get_available", _half_assigned_pool)
+def _pool_get_available(pool: PlayerPool):
+    pool.get_available()
+
+
+@case("pool.get_available_by_role", _half_assigned_pool)
+def _pool_get_available_by_role(pool: PlayerPool):
+    pool.get_available_by_role(PlayerRole.DEFENDER)
+
+
+def _searchable_pool() -> PlayerPool:
+    pool = _half_assigned_pool()
+    pool.search("")  # costruisce l'indice fuori dalla misura
+    return pool
+
+
+@case("pool.search.prefix[500]", _searchable_pool)
+def _pool_search_prefix(pool: PlayerPool):
+    pool.search("def 1", available=True)
+
+
+@case("pool.search.role_page[500]", _searchable_pool)
+def _pool_search_role_page(pool: PlayerPool):
+    pool.search("", role=PlayerRole.DEFENDER, limit=20)
+
+
+def _fresh_pool() -> Tuple[PlayerPool, List[Team]]:
+    return PlayerPool(PLAYERS), _teams(20)
+
+
+@case("pool.assign_to_team[500]", _fresh_pool, fresh=True)
+def _pool_assign_all(state: Tuple[PlayerPool, List[Team]]):
+    pool, teams = state
+    for i, player in enumerate(PLAYERS):
+        pool.assign_to_team(player, teams[i % 20], 1)
+
+
+# --- regole: ownership e team building a rose piene -----------------------------
+
+def _full_rosters() -> List[Team]:
+    """20 squadre con rose complete (3/8/8/6), come a fine asta."""
+    teams = _teams(20)
+    by_role: Dict[PlayerRole, List] = {}
+    for player in PLAYERS:
+        by_role.setdefault(player.role, []).append(player)
+    for role, count in DEFAULT_ROSTER.items():
+        players = by_role[role]
+        for t, team in enumerate(teams):
+            for player in players[t * count:(t + 1) * count]:
+                team.add_player(player, 1)
+    return teams
+
+
+def _rules_state():
+    return _full_rosters(), PLAYERS[::10]
+
+
+def _store_state():
+    """Le stesse rose registrate in una MultiCopyMarket(2); le policy leggono lo stesso store, come in un'asta."""
+    teams, players = _rules_state()
+    market = MultiCopyMarket(2)
+    market.store.mask_of(p.player_id for p in PLAYERS)
+    for team in teams:
+        for player in team.roster:
+            market.register_assignment(team, player)
+    return teams, players, market
+
+
+@case("ownership.no_duplicates[20x50]", _store_state)
+def _ownership_no_duplicates(state):
+    teams, players, market = state
+    policy = NoDuplicatesOwnershipPolicy(market.store)
+    for team in teams:
+        for player in players:
+            policy.can_own(team, player)
+
+
+@case("ownership.max_copies[20x50]", _store_state)
+def _ownership_max_copies(state):
+    teams, players, market = state
+    policy = MaxCopiesOwnershipPolicy(2, market.store)
+    for team in teams:
+        for player in players:
+            policy.can_own(team, player)
+
+
+@case("market.available_for_any_team.per_player[20x500]", _store_state)
+def _available_per_player(state):
+    teams, _, market = state
+    policy = MaxCopiesOwnershipPolicy(1, market.store)
+    # la forma di prima: disponibilità globale, poi la policy squadra per squadra
+    [p for p in PLAYERS if market.is_available(p) and any(policy.can_own(t, p) for t in teams)]
+
+
+@case("market.available_players.bulk[20x500]", _store_state)
+def _available_bulk(state):
+    teams, _, market = state
+    market.available_players(PLAYERS, teams)
+
+
+FIXED_MAX = FixedMaxStrategy(dict(DEFAULT_ROSTER))
+MIN_MAX = MinMaxStrategy(dict(DEFAULT_ROSTER), {role: count + 2 for role, count in DEFAULT_ROSTER.items()})
+
+
+@case("team_building.fixed_max.can_assign[20x50]", _rules_state)
+def _fixed_max_can_assign(state):
+    teams, players = state
+    for team in teams:
+        for player in players:
+            FIXED_MAX.can_assign(team, player, 1)
+
+
+@case("team_building.fixed_max.roles_remaining[20]", _rules_state)
+def _fixed_max_roles_remaining(state):
+    for team in state[0]:
+        FIXED_MAX.roles_remaining(team)
+        FIXED_MAX.is_complete(team)
+
+
+@case("team_building.min_max.roles_remaining[20]", _rules_state)
+def _min_max_roles_remaining(state):
+    for team in state[0]:
+        MIN_MAX.roles_remaining(team)
+        MIN_MAX.is_complete(team)
+
+
+# --- idoneità: chi può offrire, chi si può chiamare ------------------------------
+
+def _eligibility_state():
+    """20 squadre a metà asta: portieri esauriti, gli altri ruoli ancora aperti."""
+    pool = PlayerPool(PLAYERS)
+    teams = _teams(20)
+    by_role: Dict[PlayerRole, List] = {}
+    for player in PLAYERS:
+        by_role.setdefault(player.role, []).append(player)
+    for role, count in DEFAULT_ROSTER.items():
+        filled = count if role is PlayerRole.GOALKEEPER else count // 2
+        for t, team in enumerate(teams):
+            for player in by_role[role][t * count:t * count + filled]:
+                pool.assign_to_team(player, team, 1)
+    for team in teams:
+        team.set_requirements(FIXED_MAX.roles_remaining(team))
+    engine = EligibilityEngine(teams, pool, FIXED_MAX)
+    return pool, teams, engine, pool.get_available()[::5]
+
+
+@case("eligibility.bidders.per_team[20x50]", _eligibility_state)
+def _bidders_per_team(state):
+    pool, teams, _, players = state
+    for player in players:
+        [t for t in teams if pool.is_available_for_team(player, t) and FIXED_MAX.can_assign(t, player, 1)]
+
+
+@case("eligibility.bidders.masks[20x50]", _eligibility_state)
+def _bidders_masks(state):
+    _, _, engine, players = state
+    for player in players:
+        engine.eligible_teams(player)
+
+
+@case("eligibility.pool_builder.can_assign[20 teams]", _eligibility_state)
+def _pool_builder_can_assign(state):
+    pool, teams, _, _ = state
+    RoleSequentialPoolBuilder(list(PlayerRole), FIXED_MAX).build_pool(pool.get_available(), teams)
+
+
+@case("eligibility.pool_builder.masks[20 teams]", _eligibility_state)
+def _pool_builder_masks(state):
+    pool, teams, engine, _ = state
+    RoleSequentialPoolBuilder(list(PlayerRole), FIXED_MAX, engine).build_pool(pool.get_available(), teams)
+
+
+@case("eligibility.callable_players[20 teams]", _eligibility_state)
+def _callable_players(state):
+    state[2].callable_players()
+
+
+# --- api: snapshot e broadcast --------------------------------------------------
+
+class _NullWebSocket:
+    """WebSocket finto: accetta ogni frame senza fare nulla."""
+
+    async def send_text(self, data: str) -> None:
+        pass
+
+    async def send_json(self, data) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+def _room(teams: int, participants: int, rosters: bool = True) -> AuctionRoom:
+    auction = Auction("bench", "Bench", teams)
+    auction.player_pool.add_players(PLAYERS)
+    room = AuctionRoom(auction, max_queue=1024)
+    room.snapshot_factory = lambda: {"type": "auction_snapshot", "payload": {}}
+    if rosters:
+        for i, player in enumerate(PLAYERS[: teams * ROSTER_SIZE]):
+            team = auction.teams[i % teams + 1]
+            auction.player_pool.assign_to_team(player, team, 1)
+            team.spent += 1
+    for i in range(participants):
+        participant = RemoteParticipant(f"p{i}", f"Manager {i}", _NullWebSocket())
+        room.join(participant)
+        room.assign_participant(participant, i % teams + 1)
+    return room
+
+
+def _close_room(room: AuctionRoom) -> None:
+    for connection in list(room.connections):
+        connection.close()
+    room.spectators.close()
+
+
+for _teams_count in (8, 12, 20):
+    case(f"api.build_snapshot[{_teams_count} teams]", lambda n=_teams_count: _room(n, n), teardown=_close_room)(
+        lambda room: _build_snapshot(room)
+    )
+
+
+MESSAGE = {"type": "auction_delta", "payload": {"version": 1, "changes": [{"kind": "bid", "team_id": 3, "amount": 42}]}}
+
+
+
+async def _broadcast(room: AuctionRoom) -> None:
+    # serializzazione, accodamento e un giro di loop perché i writer svuotino le code
+    await room.broadcast(MESSAGE)
+    await asyncio.sleep(0)
+
+
+for _sockets in (8, 100, 1000):
+    case(f"api.broadcast[{_sockets} sockets]", lambda n=_sockets: _room(8, n, rosters=False), teardown=_close_room)(_broadcast)
+
+
+# --- strategie di bidding con offerenti scriptati ----------------------------------
+
+class ScriptedBidder:
+    """Offerente con una sequenza fissa di offerte (None = passo)."""
+
+    def __init__(self, name: str, amounts: List[Optional[float]]):
+        self.name = name
+        self.amounts = amounts
+        self._next = 0
+        self.team = SimpleNamespace(id=name)
+        self.ownership_policy = NoDuplicatesOwnershipPolicy()
+        self.bidder = self
+
+    def reset(self) -> None:
+        self._next = 0
+
+    def _take(self) -> Optional[float]:
+        amount = self.amounts[self._next] if self._next < len(self.amounts) else None
+        self._next += 1
+        return amount
+
+    async def get_bid(self, player) -> Optional[float]:
+        return self._take()
+
+    async def make_bid(self, highest: float) -> Optional[float]:
+        return self._take()
+
+    def place_bid(self, player, amount: float):
+        return SimpleNamespace(player=player, amount=amount, team=self.team)
+
+    # per ownership_policy.can_own(team, player): il bidder fa da squadra
+    def has_player(self, player) -> bool:
+        return False
+
+
+def _scripted(bidders: int, rounds: int) -> List[ScriptedBidder]:
+    # ogni offerente rilancia per `rounds` giri, poi passa; il primo resiste di più
+    return [
+        ScriptedBidder(f"b{i}", [float(r * bidders + i + 1) for r in range(rounds + (1 if i == 0 else 0))])
+        for i in range(bidders)
+    ]
+
+
+class _PokerBidding(PokerBiddingStrategy):
+    # poker e busta chiusa espongono solo run_bidding(player, teams) e non
+    # implementano ancora run(): qui basta renderle istanziabili
+    async def run(self, player, bidders):
+        return await self.run_bidding(player, bidders)
+
+
+class _ClosedBid(ClosedBidStrategy):
+    async def run(self, player, bidders):
+        return await self.run_bidding(player, bidders)
+
+
+def _bidding_state(strategy_cls, bidders: int, rounds: int):
+    return strategy_cls(UniquePlayerMarket()), _scripted(bidders, rounds), PLAYERS[0]
+
+
+async def _free_bidding(state) -> None:
+    strategy, bidders, player = state
+    for bidder in bidders:
+        bidder.reset()
+    await strategy.run(player, bidders)
+
+
+async def _run_bidding(state) -> None:
+    strategy, bidders, player = state
+    for bidder in bidders:
+        bidder.reset()
+    await strategy.run_bidding(player, bidders)
+
+
+case("bidding.free[8 bidders x 10 rounds]", lambda: _bidding_state(FreeBiddingStrategy, 8, 10))(_free_bidding)
+case("bidding.poker[8 bidders x 10 rounds]", lambda: _bidding_state(_PokerBidding, 8, 10))(_run_bidding)
+case("bidding.closed[8 bidders]", lambda: _bidding_state(_ClosedBid, 8, 1))(_run_bidding)
+
+
+# --- simulazione completa ------------------------------------------------------------
+
+@case("simulation.full_auction[8 teams]", lambda: generate_players({r: c * 8 * 2 for r, c in DEFAULT_ROSTER.items()}))
+def _full_auction(players):
+    AuctionSimulation(players, seed=7).run()
+
+
+# --- esecuzione --------------------------------------------------------------------
+
+async def _cancel_pending() -> None:
+    # come asyncio.run: i task rimasti (writer delle connessioni) vanno chiusi prima del loop
+    pending = asyncio.all_tasks() - {asyncio.current_task()}
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+def run(patterns: List[str], min_time: float, rounds: int) -> dict:
+    selected = [c for c in CASES if not patterns or any(p in c.name for p in patterns)]
+    loop = asyncio.new_event_loop()
+    try:
+        results = {bench.name: measure(loop, bench, min_time, rounds) for bench in selected}
+    finally:
+        loop.run_until_complete(_cancel_pending())
+        loop.close()
+    return {
+        "format": RESULTS_FORMAT,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> List[Tuple[str, float, float, float]]:
+    """Casi più lenti della baseline oltre la tolleranza: (nome, baseline ns, attuale ns, rapporto)."""
+    regressions = []
+    for name, result in current["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        ratio = result["ns_per_op"] / reference["ns_per_op"]
+        if ratio > tolerance:
+            regressions.append((name, reference["ns_per_op"], result["ns_per_op"], ratio))
+    return regressions
+
+
+def _format_ns(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="patterns", action="append", default=[], help="run only cases containing this text")
+    parser.add_argument("--min-time", type=float, default=0.1, help="minimum seconds per round")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--json", dest="json_path", help="write machine-readable results here ('-' for stdout)")
+    parser.add_argument("--compare", dest="baseline_path", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed slowdown ratio before failing")
+    parser.add_argument("--update-baseline", action="store_true", help=f"overwrite {os.path.relpath(BASELINE_PATH)}")
+    args = parser.parse_args(argv)
+
+    current = run(args.patterns, args.min_time, args.rounds)
+    baseline = None
+    if args.baseline_path:
+        with open(args.baseline_path) as f:
+            baseline = json.load(f)
+
+    if args.json_path != "-":
+        print(f"{'case':<48} {'time/op':>12} {'baseline':>12} {'ratio':>7}")
+        for name, result in current["results"].items():
+            reference = (baseline or {}).get("results", {}).get(name)
+            ref_text = _format_ns(reference["ns_per_op"]) if reference else "-"
+            ratio_text = f"{result['ns_per_op'] / reference['ns_per_op']:.2f}" if reference else "-"
+            print(f"{name:<48} {_format_ns(result['ns_per_op']):>12} {ref_text:>12} {ratio_text:>7}")
+
+    if args.json_path:
+        text = json.dumps(current, indent=2, sort_keys=True)
+        if args.json_path == "-":
+            print(text)
+        else:
+            with open(args.json_path, "w") as f:
+                f.write(text + "\n")
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w") as f:
+            f.write(json.dumps(current, indent=2, sort_keys=True) + "\n")
+
+    if baseline is not None:
+        regressions = compare(current, baseline, args.tolerance)
+        for name, before, after, ratio in regressions:
+            print(f"REGRESSION {name}: {_format_ns(before)} -> {_format_ns(after)} ({ratio:.2f}x)", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,396 @@
+"""
+Generatore di carico per il server d'asta: crea molte aste, collega a ciascuna
+dei partecipanti simulati che parlano il protocollo reale (join,
+choose_player_response, place_bid_response) con tempi di riflessione
+configurabili, e misura la latenza tra l'invio di un'offerta e la ricezione del
+relativo bidding_result, oltre al throughput per stanza e per processo.
+
+    python benchmarks/ws_load.py --auctions 20 --participants 8 --players 100
+    python benchmarks/ws_load.py --url http://127.0.0.1:8000 --auctions 50 --think exp:0.05
+    python benchmarks/ws_load.py --processes 4 --auctions 64 --json load.json
+
+Senza --url il server parte nello stesso processo (uvicorn in un thread, porta
+libera su 127.0.0.1). Con --url si può puntare anche al front del deployment a
+shard (python -m api.sharding). Con --processes le aste vengono divise tra più
+processi client.
+
+Tempi di riflessione: const:S, uniform:A:B, exp:MEDIA, lognormal:MU:SIGMA (secondi).
+Le buste sono chiuse: il lotto si chiude quando hanno risposto tutti, quindi la
+latenza di un'offerta comprende l'attesa dell'offerente più lento.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+
+import httpx  # noqa: E402
+from websockets.asyncio.client import connect  # noqa: E402
+
+from core.enums import PlayerRole  # noqa: E402
+from core.simulation import DEFAULT_ROSTER, generate_players  # noqa: E402
+
+ThinkTime = Callable[[random.Random], float]
+
+
+def parse_think(spec: str) -> ThinkTime:
+    """Distribuzione dei tempi di riflessione da una stringa come "exp:0.05"."""
+    kind, *params = spec.split(":")
+    try:
+        values = [float(p) for p in params]
+    except ValueError:
+        raise ValueError(f"Invalid think time: {spec}") from None
+    if kind == "const" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "exp" and len(values) == 1:
+        return lambda rng: rng.expovariate(1.0 / values[0]) if values[0] > 0 else 0.0
+    if kind == "lognormal" and len(values) == 2:
+        return lambda rng: rng.lognormvariate(values[0], values[1])
+    raise ValueError(f"Invalid think time: {spec}")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentile nearest-rank (q tra 0 e 100); 0 se non ci sono valori."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+# --- server locale -----------------------------------------------------------------
+
+class LocalServer:
+    """L'app FastAPI servita da uvicorn in un thread, su una porta libera di 127.0.0.1."""
+
+    def __init__(self):
+        import uvicorn
+
+        from api.main import app
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self.url = f"http://127.0.0.1:{self._socket.getsockname()[1]}"
+        self._server = uvicorn.Server(uvicorn.Config(app, log_level="warning", ws_max_size=16 * 1024 * 1024))
+        self._thread = threading.Thread(target=self._server.run, kwargs={"sockets": [self._socket]}, daemon=True)
+
+    def start(self, timeout: float = 10.0) -> None:
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("Local server did not start")
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+        self._socket.close()
+
+
+# --- partecipante simulato -----------------------------------------------------------
+
+class LoadParticipant:
+    """
+    Client WebSocket che si comporta come il frontend: tiene in cache il pool
+    (snapshot + differenze di turn_waiting_for_player), sceglie a caso quando è
+    il suo turno e offre una frazione casuale del budget rimasto.
+    """
+
+    def __init__(self, name: str, rng: random.Random, think: ThinkTime, budget: float):
+        self.name = name
+        self.rng = rng
+        self.think = think
+        self.budget = budget
+        self.spent = 0.0
+        self.id: Optional[str] = None
+        self.ws = None
+
+        self.pool_version = 0
+        self.pool: Dict[int, None] = {}  # player_id disponibili, in ordine
+        self._bid_sent: Dict[int, float] = {}  # player_id -> istante dell'ultima offerta
+
+        self.joined = asyncio.Event()
+        self.finished = asyncio.Event()
+        self.latencies: List[float] = []
+        self.bids = 0
+        self.results = 0
+        self.messages = 0
+
+    async def connect(self, ws_url: str) -> None:
+        self.ws = await connect(ws_url, max_size=None)
+        await self.ws.send(json.dumps({"type": "join", "payload": {"name": self.name}}))
+
+    async def run(self) -> None:
+        try:
+            async for raw in self.ws:
+                self.messages += 1
+                self._handle(json.loads(raw))
+                if self.finished.is_set():
+                    break
+        finally:
+            self.finished.set()
+            await self.ws.close()
+
+    def _handle(self, message: dict) -> None:
+        kind = message.get("type")
+        payload = message.get("payload") or {}
+        if kind == "joined" and self.id is None:
+            self.id = payload["id"]
+            self.joined.set()
+        elif kind == "player_pool_snapshot":
+            self.pool_version = payload["version"]
+            self.pool = dict.fromkeys(p["player_id"] for p in payload["players"])
+        elif kind == "turn_waiting_for_player":
+            self._apply_pool_update(payload["pool"])
+        elif kind == "choose_player_request":
+            asyncio.get_running_loop().create_task(self._choose(message))
+        elif kind == "place_bid_request":
+            asyncio.get_running_loop().create_task(self._bid(message))
+        elif kind == "bidding_result":
+            self._on_result(payload)
+        elif kind == "auction_finished":
+            self.finished.set()
+
+    def _apply_pool_update(self, update: dict) -> None:
+        if update.get("reset"):
+            self.pool = dict.fromkeys(p["player_id"] for p in update["players"])
+        elif update.get("base_version") == self.pool_version:
+            for player in update["added"]:
+                self.pool[player["player_id"]] = None
+            for player_id in update["removed_ids"]:
+                self.pool.pop(player_id, None)
+        else:
+            # buco di versione: come il frontend, si chiede il pool completo
+            asyncio.get_running_loop().create_task(self.ws.send(json.dumps({"type": "pool_sync"})))
+            return
+        self.pool_version = update["version"]
+
+    async def _respond(self, request: dict, **fields) -> None:
+        await self.ws.send(json.dumps({
+            "participant_id": self.id,
+            "request_id": request["request_id"],
+            **fields,
+        }))
+
+    async def _choose(self, request: dict) -> None:
+        await asyncio.sleep(self.think(self.rng))
+        player_id = self.rng.choice(list(self.pool)) if self.pool else None
+        await self._respond(request, type="choose_player_response", player_id=player_id)
+
+    async def _bid(self, request: dict) -> None:
+        left = self.budget - self.spent
+        amount = float(self.rng.randint(1, max(1, int(left // 10)))) if left >= 1 else None
+        await asyncio.sleep(self.think(self.rng))
+        if amount is not None:
+            self._bid_sent[request["player"]["player_id"]] = time.perf_counter()
+            self.bids += 1
+        await self._respond(request, type="place_bid_response", amount=amount)
+
+    def _on_result(self, payload: dict) -> None:
+        self.results += 1
+        sent = self._bid_sent.pop(payload["player"]["player_id"], None)
+        if sent is not None:
+            self.latencies.append(time.perf_counter() - sent)
+        winner = payload.get("winner") or {}
+        if payload.get("status") == "won" and winner.get("id") == self.id:
+            self.spent += payload["amount"]
+
+
+# --- asta ---------------------------------------------------------------------------
+
+def _players_csv(players_per_role: Dict[PlayerRole, int], seed: int) -> str:
+    lines = ["id,name,role,team"]
+    for player in generate_players(players_per_role, seed):
+        lines.append(f"{player.player_id},{player.name},{player.role.name},{player.realTeam}")
+    return "\n".join(lines) + "\n"
+
+
+async def run_auction(client: httpx.AsyncClient, base_url: str, index: int, args, seed: int) -> dict:
+    rng = random.Random(seed)
+    think = parse_think(args.think)
+    response = await client.post("/auctions/", json={
+        "name": f"Load {index}",
+        "nickname": "load",
+        "budget": args.budget,
+        "max_teams": args.participants,
+        "bid_timeout": args.bid_timeout,
+        "choose_timeout": args.choose_timeout,
+        "choose_fallback": "random",
+        "seed_players": False,
+    })
+    response.raise_for_status()
+    auction_id = response.json()["auction_id"]
+
+    # listone proporzionato alla rosa classica, con almeno un giocatore per ruolo
+    total = sum(DEFAULT_ROSTER.values())
+    per_role = {role: max(1, round(args.players * count / total)) for role, count in DEFAULT_ROSTER.items()}
+    response = await client.post(
+        f"/auctions/{auction_id}/players/import", params={"format": "csv"}, content=_players_csv(per_role, seed)
+    )
+    response.raise_for_status()
+
+    ws_url = base_url.replace("http", "ws", 1) + f"/auctions/{auction_id}/ws"
+    participants = [
+        LoadParticipant(f"Bot {index}.{i}", random.Random(rng.random()), think, args.budget)
+        for i in range(args.participants)
+    ]
+    await asyncio.gather(*(p.connect(ws_url) for p in participants))
+    tasks = [asyncio.create_task(p.run()) for p in participants]
+    await asyncio.gather(*(p.joined.wait() for p in participants))
+    for team_id, participant in enumerate(participants, start=1):
+        response = await client.post(f"/auctions/{auction_id}/assign", json={"participant_id": participant.id, "team_id": team_id})
+        response.raise_for_status()
+
+    started = time.perf_counter()
+    response = await client.post(f"/auctions/{auction_id}/start")
+    response.raise_for_status()
+    try:
+        await asyncio.wait_for(asyncio.gather(*(p.finished.wait() for p in participants)), args.duration)
+        timed_out = False
+    except asyncio.TimeoutError:
+        timed_out = True
+    elapsed = time.perf_counter() - started
+    for participant in participants:
+        participant.finished.set()
+        await participant.ws.close()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    return {
+        "auction_id": auction_id,
+        "elapsed": elapsed,
+        # ogni bidding_result arriva a tutti: i lotti chiusi sono quelli visti da chi ne ha visti di più
+        "lots": max(p.results for p in participants),
+        "bids": sum(p.bids for p in participants),
+        "messages": sum(p.messages for p in participants),
+        "latencies": [latency for p in participants for latency in p.latencies],
+        "timed_out": timed_out,
+    }
+
+
+async def _run_share(base_url: str, indexes: List[int], args) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def one(index: int) -> dict:
+            async with semaphore:
+                return await run_auction(client, base_url, index, args, args.seed + index)
+
+        started = time.perf_counter()
+        rooms = await asyncio.gather(*(one(i) for i in indexes))
+        elapsed = time.perf_counter() - started
+    return {"pid": os.getpid(), "elapsed": elapsed, "rooms": rooms}
+
+
+def _worker(base_url: str, indexes: List[int], args) -> dict:
+    return asyncio.run(_run_share(base_url, indexes, args))
+
+
+def summarize(processes: List[dict]) -> dict:
+    rooms = [room for process in processes for room in process["rooms"]]
+    latencies = [latency for room in rooms for latency in room["latencies"]]
+    room_rates = [room["lots"] / room["elapsed"] for room in rooms if room["elapsed"] > 0]
+    return {
+        "auctions": len(rooms),
+        "timed_out": sum(1 for room in rooms if room["timed_out"]),
+        "lots": sum(room["lots"] for room in rooms),
+        "bids": len(latencies),
+        "latency_ms": {
+            "p50": percentile(latencies, 50) * 1000,
+            "p90": percentile(latencies, 90) * 1000,
+            "p99": percentile(latencies, 99) * 1000,
+            "max": max(latencies, default=0.0) * 1000,
+        },
+        "per_room_lots_per_s": {
+            "mean": sum(room_rates) / len(room_rates) if room_rates else 0.0,
+            "min": min(room_rates, default=0.0),
+            "max": max(room_rates, default=0.0),
+        },
+        "per_process": [
+            {
+                "pid": process["pid"],
+                "auctions": len(process["rooms"]),
+                "lots_per_s": sum(r["lots"] for r in process["rooms"]) / process["elapsed"],
+                "bids_per_s": sum(len(r["latencies"]) for r in process["rooms"]) / process["elapsed"],
+                "messages_per_s": sum(r["messages"] for r in process["rooms"]) / process["elapsed"],
+            }
+            for process in processes
+        ],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="server to load (default: start the app in this process)")
+    parser.add_argument("--auctions", type=int, default=10)
+    parser.add_argument("--participants", type=int, default=8, help="participants (and teams) per auction")
+    parser.add_argument("--players", type=int, default=50, help="players imported per auction (the server adds its 8 sample players)")
+    parser.add_argument("--budget", type=int, default=500)
+    parser.add_argument("--think", default="exp:0.01", help="think time distribution")
+    parser.add_argument("--processes", type=int, default=1, help="client processes sharing the auctions")
+    parser.add_argument("--concurrency", type=int, default=100, help="auctions running at once per process")
+    parser.add_argument("--bid-timeout", type=float, default=10.0)
+    parser.add_argument("--choose-timeout", type=float, default=10.0)
+    parser.add_argument("--duration", type=float, default=300.0, help="max seconds per auction")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="write the summary here ('-' for stdout)")
+    args = parser.parse_args(argv)
+    parse_think(args.think)  # errore subito, non dentro i processi client
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = LocalServer()
+        server.start()
+        base_url = server.url
+    base_url = base_url.rstrip("/")
+
+    try:
+        shares = [list(range(i, args.auctions, args.processes)) for i in range(args.processes)]
+        shares = [share for share in shares if share]
+        if len(shares) == 1:
+            processes = [asyncio.run(_run_share(base_url, shares[0], args))]
+        else:
+            with ProcessPoolExecutor(max_workers=len(shares)) as executor:
+                processes = list(executor.map(_worker, [base_url] * len(shares), shares, [args] * len(shares)))
+    finally:
+        if server is not None:
+            server.stop()
+
+    summary = summarize(processes)
+    summary["config"] = {k: v for k, v in vars(args).items() if k != "json_path"}
+    if args.json_path == "-":
+        print(json.dumps(summary, indent=2))
+    else:
+        latency = summary["latency_ms"]
+        rooms = summary["per_room_lots_per_s"]
+        print(f"auctions {summary['auctions']} (timed out {summary['timed_out']}), lots {summary['lots']}, bids {summary['bids']}")
+        print(f"bid -> bidding_result ms: p50 {latency['p50']:.1f}  p90 {latency['p90']:.1f}  p99 {latency['p99']:.1f}  max {latency['max']:.1f}")
+        print(f"lots/s per room: mean {rooms['mean']:.1f}  min {rooms['min']:.1f}  max {rooms['max']:.1f}")
+        for process in summary["per_process"]:
+            print(
+                f"process {process['pid']}: {process['auctions']} auctions, {process['lots_per_s']:.1f} lots/s, "
+                f"{process['bids_per_s']:.1f} bids/s, {process['messages_per_s']:.0f} msgs/s"
+            )
+        if args.json_path:
+            with open(args.json_path, "w") as f:
+                f.write(json.dumps(summary, indent=2) + "\n")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
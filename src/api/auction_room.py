@@ -1,16 +1,106 @@
-from typing import Dict, List
+import time
+from typing import Callable, Dict, List, Optional
+
+from fastapi import WebSocket
+
+from api import metrics
+from api.connection import OutboundConnection
+from api.encoding import encode_message
 from api.remote_participant import RemoteParticipant
+from api.request_deadlines import RequestDeadlines
+from api.spectators import SpectatorRelay
 from core.auction import Auction
+from core.eligibility import EligibilityEngine
+from core.events import AuctionEvent
+from core.market_rules import MarketRule
+from core.ownership_policies import OwnershipPolicy
+from core.selection_strategies import SelectionStrategy
 
 
 class AuctionRoom:
-    def __init__(self, auction:Auction):
+    def __init__(
+        self,
+        auction:Auction,
+        max_queue: int = 256,
+        send_timeout: float = 5.0,
+        overflow_policy: str = OutboundConnection.RESYNC,
+        bid_timeout: float = 30.0,
+        choose_timeout: float = 60.0,
+        choose_fallback: Optional[SelectionStrategy] = None,
+        spectator_fps: float = 4.0,
+    ):
         self.auction = auction
+        # scadenze (secondi) delle richieste ai partecipanti, applicate da un'unica
+        # RequestDeadlines per stanza
+        self.bid_timeout = bid_timeout
+        self.choose_timeout = choose_timeout
+        self.choose_fallback = choose_fallback
+        self.request_deadlines = RequestDeadlines()
         self.participants:Dict[str,RemoteParticipant] = {}
         self.team_to_participants:Dict[int, List[RemoteParticipant]] = {}  # team_id -> RemoteParticipant
+        # tutti i partecipanti entrati almeno una volta, anche se ora disconnessi:
+        # participant_id -> {"name", "team_ids"}; permette di riprendere la sessione
+        self.participant_records: Dict[str, dict] = {}
+        # ultimo partecipante che ha chiamato un giocatore: posizione della rotazione dei caller
+        self.last_caller_id: Optional[str] = None
+        # opzioni di creazione (AuctionCreate), salvate nei checkpoint
+        self.options: dict = {}
+        # log append-only degli eventi (api.event_log.EventLog), se la persistenza è attiva
+        self.event_log = None
+        # checkpoint periodici dello stato (api.checkpoint.Checkpointer)
+        self.checkpointer = None
+        # versione monotona dello stato della stanza: cresce ad ogni delta inviato ai client
+        self.version = 0
+        # ultima versione del PlayerPool annunciata ai client con turn_waiting_for_player
+        self.announced_pool_version = 0
+        # idoneità squadre × ruoli per chiamate e offerte (vedi core.eligibility)
+        self.eligibility: Optional[EligibilityEngine] = None
+        # regole di proprietà dell'asta: leggono lo stesso OwnershipStore del pool
+        self.market_rule: Optional[MarketRule] = None
+        self.ownership_policy: Optional[OwnershipPolicy] = None
+
+        # code di uscita per WebSocket (vedi OutboundConnection)
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.overflow_policy = overflow_policy
+        self.snapshot_factory: Optional[Callable[[], dict]] = None
+        self.connections: List[OutboundConnection] = []
+        # spettatori: frame aggregati, fuori dal percorso delle offerte
+        self.spectators = SpectatorRelay(lambda: self.snapshot_factory(), max_fps=spectator_fps)
+
+    def next_version(self) -> int:
+        self.version += 1
+        return self.version
+
+    def open_connection(self, ws: WebSocket) -> OutboundConnection:
+        connection = OutboundConnection(
+            ws,
+            max_queue=self.max_queue,
+            send_timeout=self.send_timeout,
+            overflow_policy=self.overflow_policy,
+            resync_factory=self.snapshot_factory,
+            on_close=self._on_connection_closed,
+        )
+        self.connections.append(connection)
+        connection.start()
+        return connection
+
+    def _on_connection_closed(self, connection: OutboundConnection) -> None:
+        if connection in self.connections:
+            self.connections.remove(connection)
+        for participant_id, participant in list(self.participants.items()):
+            if participant.connection is connection:
+                self.leave(participant_id)
 
     def join(self, participant:RemoteParticipant):
+        if participant.connection is None:
+            participant.connection = self.open_connection(participant._ws)
+        participant.deadlines = self.request_deadlines
+        participant.bid_timeout = self.bid_timeout
+        participant.choose_timeout = self.choose_timeout
+        participant.choose_fallback = self.choose_fallback
         self.participants[participant.id] = participant
+        self.participant_records.setdefault(participant.id, {"name": participant.name, "team_ids": []})
 
     def assign_participant(self, participant:RemoteParticipant, team_id:int):
         # remove existing association
@@ -24,6 +114,9 @@ class AuctionRoom:
         team = self.auction.teams.get(team_id)
         if team:
             participant.team = team
+        record = self.participant_records.get(participant.id)
+        if record is not None:
+            record["team_ids"] = [team_id]
         return team
 
     def get_participant_team_ids(self, participant_id: str) -> List[int]:
@@ -37,18 +130,32 @@ class AuctionRoom:
         participant = self.participants.pop(participant_id, None)
         if participant is None:
             return
+        metrics.DISCONNECTS.inc()
         participant.disconnect()
         for team_id, members in list(self.team_to_participants.items()):
             self.team_to_participants[team_id] = [p for p in members if p.id != participant_id]
             if not self.team_to_participants[team_id]:
                 del self.team_to_participants[team_id]
-    
+
+    def publish(self, event: AuctionEvent) -> None:
+        """Pubblica un evento di stato sul bus dell'asta (log, metriche, ...)."""
+        self.auction.events.publish(event)
+
     async def broadcast(self, message: dict):
-        to_remove = []
-        for c in self.participants.values():
-            try:
-                await c._ws.send_json(message)
-            except Exception:
-                to_remove.append(c.id)
-        for pid in to_remove:
-            self.leave(pid)
+        """
+        Serializza il messaggio una sola volta e accoda lo stesso frame su ogni
+        connessione: nessun invio viene atteso qui.
+        """
+        started = time.perf_counter()
+        frame = encode_message(message)
+        for c in list(self.participants.values()):
+            c.connection.send(frame)
+        self.spectators.publish(message)
+        metrics.BROADCAST_SECONDS.observe(time.perf_counter() - started)
+
+    def connection_stats(self) -> List[dict]:
+        return [
+            {"participant_id": p.id, "name": p.name, **p.connection.stats()}
+            for p in self.participants.values()
+            if p.connection is not None
+        ]
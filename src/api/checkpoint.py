@@ -0,0 +1,110 @@
+import asyncio
+import os
+import pickle
+from typing import Optional
+
+from api.auction_room import AuctionRoom
+from core.event_bus import EventBus
+from core.events import AuctionEvent
+
+# versione del formato: un checkpoint di formato diverso viene ignorato (si rilegge tutto il log)
+CHECKPOINT_FORMAT = 1
+
+
+def capture_state(room: AuctionRoom) -> dict:
+    """
+    Stato dell'asta come soli dict, liste e scalari: si serializza in fretta e
+    non dipende dalle classi del dominio. Va chiamata sull'event loop.
+    """
+    auction = room.auction
+    pool = auction.player_pool
+    return {
+        "format": CHECKPOINT_FORMAT,
+        "auction_id": auction.auction_id,
+        "options": dict(room.options),
+        "started": auction.started,
+        "players": [[p.player_id, p.name, p.role.name, p.realTeam] for p in pool.players],
+        "teams": {
+            team.id: {"spent": team.spent, "roster": [p.player_id for p in team.roster]}
+            for team in auction.teams.values()
+        },
+        "participants": {pid: {"name": r["name"], "team_ids": list(r["team_ids"])} for pid, r in room.participant_records.items()},
+        "last_caller_id": room.last_caller_id,
+    }
+
+
+def write_checkpoint(path: str, state: dict) -> None:
+    """Scrittura atomica: file temporaneo, fsync e rename."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if not isinstance(state, dict) or state.get("format") != CHECKPOINT_FORMAT:
+        return None
+    return state
+
+
+class Checkpointer:
+    """
+    Scrive un checkpoint dell'asta ogni `every` eventi pubblicati. Lo stato viene
+    copiato sul loop subito dopo aver svuotato il log (così corrisponde esattamente
+    a (seq, offset)); serializzazione e scrittura avvengono in un thread.
+    """
+
+    def __init__(self, room: AuctionRoom, path: str, every: int = 1000):
+        self.room = room
+        self.path = path
+        self.every = every
+        self._since_last = 0
+        self._task: Optional[asyncio.Task] = None
+        self._bus: Optional[EventBus] = None
+
+        self.written = 0
+        self.last_seq = 0
+
+    def attach(self, bus: EventBus) -> None:
+        self._bus = bus
+        bus.subscribe(EventBus.WILDCARD, self._on_event)
+
+    def _on_event(self, event: AuctionEvent) -> None:
+        self._since_last += 1
+        if self._since_last >= self.every and self._task is None:
+            self._since_last = 0
+            self._task = asyncio.ensure_future(self.checkpoint())
+            self._task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Task) -> None:
+        self._task = None
+
+    async def checkpoint(self) -> None:
+        log = self.room.event_log
+        if log is None:
+            return
+        await log.flush()
+        state = capture_state(self.room)
+        state["seq"] = log.seq
+        state["offset"] = log.offset
+        await asyncio.to_thread(write_checkpoint, self.path, state)
+        self.written += 1
+        self.last_seq = state["seq"]
+
+    async def close(self) -> None:
+        if self._task is not None:
+            await asyncio.wait([self._task])
+        if self._bus is not None:
+            self._bus.unsubscribe(EventBus.WILDCARD, self._on_event)
+        # checkpoint finale: al prossimo avvio non resta coda da rileggere
+        if self.room.event_log is not None and self.room.event_log.seq != self.last_seq:
+            await self.checkpoint()
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from typing import Callable, Optional
+
+from fastapi import WebSocket
+
+from api.encoding import encode_message
+
+# segnaposto in coda: al momento dell'invio viene sostituito da uno snapshot fresco
+_RESYNC = object()
+
+
+def _is_request(message) -> bool:
+    return isinstance(message, dict) and "request_id" in message
+
+
+class OutboundConnection:
+    """
+    Coda di uscita limitata per un singolo WebSocket, svuotata da un task dedicato.
+    send() non attende mai la rete: il costo di un broadcast per chi lo invoca
+    non dipende dalla velocità dei client. I messaggi possono essere dict oppure
+    frame già serializzati (str), condivisi tra tutte le connessioni di un broadcast.
+    """
+
+    DROP = "drop"
+    RESYNC = "resync"
+
+    def __init__(
+        self,
+        ws: WebSocket,
+        max_queue: int = 256,
+        send_timeout: float = 5.0,
+        overflow_policy: str = RESYNC,
+        resync_factory: Optional[Callable[[], dict]] = None,
+        on_close: Optional[Callable[["OutboundConnection"], None]] = None,
+    ):
+        self.ws = ws
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.overflow_policy = overflow_policy
+        self.resync_factory = resync_factory
+        self.on_close = on_close
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+
+        # statistiche
+        self.sent = 0
+        self.dropped = 0
+        self.resyncs = 0
+        self.max_depth = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._total_latency = 0.0
+
+    def start(self) -> None:
+        if self._task is None and not self.closed:
+            self._task = asyncio.create_task(self._run())
+
+    def send(self, message) -> bool:
+        """Accoda un messaggio; ritorna False se la connessione è già chiusa."""
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self._on_overflow(message)
+            if self.closed:
+                return False
+        depth = self._queue.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+        return True
+
+    def _on_overflow(self, incoming) -> None:
+        if self.overflow_policy == self.RESYNC and self.resync_factory is not None:
+            # il client è rimasto indietro: scartiamo i broadcast in coda (ma non le
+            # richieste personali, compresa quella in arrivo) e gli mandiamo lo stato
+            # completo al loro posto; un broadcast in arrivo è già coperto dal resync
+            kept = []
+            while not self._queue.empty():
+                message = self._queue.get_nowait()
+                if _is_request(message):
+                    kept.append(message)
+                else:
+                    self.dropped += 1
+            if _is_request(incoming):
+                kept.append(incoming)
+            if len(kept) + 1 > self.max_queue:
+                # solo richieste personali in attesa: non c'è modo di recuperare
+                self.dropped += len(kept)
+                self.close()
+                return
+            self._queue.put_nowait(_RESYNC)
+            for message in kept:
+                self._queue.put_nowait(message)
+            self.resyncs += 1
+        else:
+            self.dropped += self._queue.qsize()
+            self.close()
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                message = await self._queue.get()
+                if message is _RESYNC:
+                    message = self.resync_factory()
+                started = time.perf_counter()
+                # asyncio.timeout e non wait_for: niente task per messaggio e una
+                # cancellazione arrivata a invio concluso non viene persa
+                async with asyncio.timeout(self.send_timeout):
+                    await self._send(message)
+                latency = time.perf_counter() - started
+                self.sent += 1
+                self.last_latency = latency
+                self._total_latency += latency
+                if latency > self.max_latency:
+                    self.max_latency = latency
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # invio troppo lento o socket rotto: il consumer viene scollegato
+            self._task = None
+            self.close()
+
+    async def _send(self, message) -> None:
+        if not isinstance(message, str):
+            message = encode_message(message)
+        await self.ws.send_text(message)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        asyncio.ensure_future(self._close_ws())
+        if self.on_close is not None:
+            self.on_close(self)
+
+    async def _close_ws(self) -> None:
+        try:
+            await self.ws.close(code=1013)
+        except Exception:
+            pass
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self.max_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "resyncs": self.resyncs,
+            "last_send_latency": self.last_latency,
+            "max_send_latency": self.max_latency,
+            "avg_send_latency": self._total_latency / self.sent if self.sent else 0.0,
+            "closed": self.closed,
+        }
@@ -0,0 +1,13 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # encoder veloce opzionale
+    orjson = None
+
+
+def encode_message(message: dict) -> str:
+    """Serializza un messaggio WebSocket in un frame di testo."""
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,122 @@
+import asyncio
+import json
+import os
+from dataclasses import fields
+from typing import Dict, List, Optional, Tuple, Type
+
+from api.encoding import encode_message
+from core.event_bus import AsyncSubscriber, EventBus
+from core.events import AuctionEvent
+
+
+_EVENT_CLASSES: Dict[str, Type[AuctionEvent]] = {}
+
+
+def _event_class(event_type: str) -> Type[AuctionEvent]:
+    if event_type not in _EVENT_CLASSES:
+        pending = [AuctionEvent]
+        while pending:
+            cls = pending.pop()
+            for sub in cls.__subclasses__():
+                _EVENT_CLASSES[sub.type] = sub
+                pending.append(sub)
+    try:
+        return _EVENT_CLASSES[event_type]
+    except KeyError:
+        raise ValueError(f"Unknown event type: {event_type}") from None
+
+
+def event_to_record(seq: int, event: AuctionEvent) -> dict:
+    return {
+        "seq": seq,
+        "type": event.type,
+        "data": {f.name: getattr(event, f.name) for f in fields(event)},
+    }
+
+
+def event_from_record(record: dict) -> AuctionEvent:
+    return _event_class(record["type"])(**record["data"])
+
+
+def read_log(path: str, offset: int = 0) -> Tuple[List[Tuple[int, AuctionEvent]], int]:
+    """
+    Legge il log a partire dall'offset (in byte) indicato.
+    Ritorna gli eventi (seq, evento) e l'offset della fine dell'ultima riga completa:
+    una riga troncata da un crash viene ignorata.
+    """
+    events: List[Tuple[int, AuctionEvent]] = []
+    end = offset
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            record = json.loads(line)
+            events.append((record["seq"], event_from_record(record)))
+            end += len(line)
+    return events, end
+
+
+class EventLog:
+    """
+    Log append-only (JSON Lines) degli eventi di un'asta. È un sottoscrittore
+    asincrono del bus con coda illimitata: gli eventi pubblicati mentre è in corso
+    una scrittura vengono scritti tutti insieme alla successiva, con un solo fsync
+    (group commit). Scrittura e fsync girano in un thread per non bloccare il loop.
+    """
+
+    def __init__(self, path: str, seq: int = 0, fsync: bool = True):
+        self.path = path
+        # numero di sequenza dell'ultimo evento scritto
+        self.seq = seq
+        self.fsync = fsync
+        self._file = open(path, "ab")
+        # byte scritti finora: l'offset della fine dell'evento seq
+        self.offset = self._file.tell()
+        self._bus: Optional[EventBus] = None
+        self._subscriber: Optional[AsyncSubscriber] = None
+
+        self.commits = 0
+        self.written = 0
+
+    def attach(self, bus: EventBus) -> None:
+        self._bus = bus
+        self._subscriber = bus.subscribe_async(EventBus.WILDCARD, self._commit, max_queue=None)
+
+    async def _commit(self, events: List[AuctionEvent]) -> None:
+        lines = []
+        for event in events:
+            self.seq += 1
+            lines.append(encode_message(event_to_record(self.seq, event)).encode() + b"\n")
+        data = b"".join(lines)
+        await asyncio.to_thread(self._write, data)
+        self.offset += len(data)
+        self.commits += 1
+        self.written += len(lines)
+
+    def _write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    async def flush(self) -> None:
+        """Attende che tutti gli eventi pubblicati finora siano su disco."""
+        if self._subscriber is not None:
+            await self._subscriber.drain()
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._bus is not None and self._subscriber is not None:
+            self._bus.unsubscribe(EventBus.WILDCARD, self._subscriber)
+        self._subscriber = None
+        self._file.close()
+
+    def stats(self) -> dict:
+        return {
+            "seq": self.seq,
+            "offset": self.offset,
+            "commits": self.commits,
+            "written": self.written,
+            "errors": self._subscriber.errors if self._subscriber is not None else 0,
+        }
@@ -1,7 +1,9 @@
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from api.routers import auctions
+from api.recovery import close_event_logs, recover_auctions
+from api.routers import admin, auctions, metrics
 # Path assoluto basato sulla posizione di questo file
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 FRONTEND_DIR = os.path.join(BASE_DIR, "frontend")
@@ -9,10 +11,21 @@ FRONTEND_DIR = os.path.join(BASE_DIR, "frontend")
 if not os.path.exists(FRONTEND_DIR):
     raise RuntimeError(f"Frontend directory not found: {FRONTEND_DIR}")
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # con FANTAPY_EVENT_LOG_DIR impostata le aste vengono ricostruite dai loro log
+    recover_auctions()
+    yield
+    await close_event_logs()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Routers
 app.include_router(auctions.router, prefix="/auctions", tags=["auctions"])
+app.include_router(metrics.router, tags=["metrics"])
+app.include_router(admin.router, prefix="/admin", tags=["admin"])
 
 # Static frontend
 app.mount("/app", StaticFiles(directory=FRONTEND_DIR, html=True), name="frontend")
\ No newline at end of file
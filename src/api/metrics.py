@@ -0,0 +1,203 @@
+"""
+Metriche del server in formato testo Prometheus, senza dipendenze esterne.
+
+Sul percorso caldo si usano solo contatori e istogrammi già risolti per
+etichetta (es. SNAPSHOT_SECONDS): observe() è una bisect e due somme. I gauge
+e i contatori che derivano dallo stato delle stanze vengono calcolati solo
+quando qualcuno legge /metrics.
+"""
+import math
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# da 0.5 ms a 60 s: copre sia la costruzione di uno snapshot sia un turno intero
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+LabelValues = Tuple[str, ...]
+# valore di un collect(): un numero oppure {valori delle etichette: numero}
+Collected = Union[float, Dict[LabelValues, float]]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, "_Metric"] = {}
+
+    def register(self, metric: "_Metric") -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> Optional["_Metric"]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Collected]] = None,
+        registry: Optional[Registry] = REGISTRY,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        # valori calcolati alla lettura (es. dallo stato delle stanze)
+        self.collect = collect
+        self._values: Dict[LabelValues, float] = {}
+        if registry is not None:
+            registry.register(self)
+
+    def _current(self) -> Dict[LabelValues, float]:
+        if self.collect is None:
+            return self._values
+        collected = self.collect()
+        return collected if isinstance(collected, dict) else {(): collected}
+
+    def value(self, *labelvalues: str) -> float:
+        return self._current().get(tuple(labelvalues), 0.0)
+
+    def samples(self) -> Iterable[str]:
+        for labelvalues, value in self._current().items():
+            yield f"{self.name}{_labels(self.labelnames, labelvalues)} {_format_value(value)}"
+
+
+class _CounterChild:
+    __slots__ = ("_values", "_key")
+
+    def __init__(self, values: Dict[LabelValues, float], key: LabelValues):
+        self._values = values
+        self._key = key
+        values.setdefault(key, 0.0)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._values[self._key] += amount
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def labels(self, *labelvalues: str) -> _CounterChild:
+        return _CounterChild(self._values, tuple(labelvalues))
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._values[()] = self._values.get((), 0.0) + amount
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        self._values[tuple(labelvalues)] = value
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # conteggi per bucket (non cumulativi; l'ultimo è +Inf), cumulati solo in lettura
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: Optional[Registry] = REGISTRY,
+    ):
+        super().__init__(name, help, labelnames, registry=registry)
+        self.buckets = tuple(sorted(buckets))
+        self._children: Dict[LabelValues, _HistogramChild] = {}
+
+    def labels(self, *labelvalues: str) -> _HistogramChild:
+        key = tuple(labelvalues)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = _HistogramChild(self.buckets)
+        return child
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def samples(self) -> Iterable[str]:
+        for labelvalues, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_labels(self.labelnames, labelvalues, le)} {cumulative}"
+            labels = _labels(self.labelnames, labelvalues)
+            yield f"{self.name}_sum{labels} {_format_value(child.sum)}"
+            yield f"{self.name}_count{labels} {child.count}"
+
+
+# --- metriche del server d'asta ---------------------------------------------------
+
+PHASE_SECONDS = Histogram(
+    "fantapy_phase_seconds",
+    "Duration of auction phases: turn, choose, bidding, snapshot, broadcast.",
+    ["phase"],
+)
+TURN_SECONDS = PHASE_SECONDS.labels("turn")
+CHOOSE_SECONDS = PHASE_SECONDS.labels("choose")
+BIDDING_SECONDS = PHASE_SECONDS.labels("bidding")
+SNAPSHOT_SECONDS = PHASE_SECONDS.labels("snapshot")
+BROADCAST_SECONDS = PHASE_SECONDS.labels("broadcast")
+
+LOTS = Counter("fantapy_lots_total", "Closed lots by outcome.", ["status"])
+LOTS_WON = LOTS.labels("won")
+LOTS_NO_BIDS = LOTS.labels("no_bids")
+LOTS_NO_BIDDERS = LOTS.labels("no_bidders")
+
+BIDS = Counter("fantapy_bids_total", "Valid sealed bids received.")
+DISCONNECTS = Counter("fantapy_disconnects_total", "Participants that left or were dropped.")
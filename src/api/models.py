@@ -15,6 +15,8 @@ class TeamDTO(BaseModel):
     name: str
     players: List[PlayerDTO]
     budget: float
+    # offerta massima: crediti residui meno la riserva per gli slot obbligatori
+    max_bid: float = 0
     participants: List["ParticipantDTO"] = Field(default_factory=list)
 
 
@@ -42,6 +44,7 @@ class AuctionDTO(BaseModel):
 class AuctionRoomDTO(BaseModel):
     auction: AuctionDTO
     participants: List[ParticipantDTO]
+    version: int = 0
 
 
 TeamDTO.model_rebuild()
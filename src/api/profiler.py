@@ -0,0 +1,132 @@
+"""
+Profiler a campionamento attivabile a caldo, uno per processo.
+
+Un timer ITIMER_PROF invia SIGPROF ogni `interval` secondi di CPU; l'handler
+gira nel thread principale (quello dell'event loop sotto uvicorn) e riceve il
+frame in esecuzione, da cui si risale lo stack. I campioni vengono raccolti
+come tuple di code object e formattati solo a fine profilo, nel formato
+"collapsed" di flamegraph.pl / speedscope.
+
+Ogni campione è etichettato con `current_auction_id`, impostata dai task di
+un'asta (loop dei turni e WebSocket): il valore letto è quello del task in
+esecuzione quando arriva il segnale. A profiler spento non è installato alcun
+handler né timer, quindi il costo è nullo.
+"""
+import signal
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from types import CodeType, FrameType
+from typing import Dict, List, Optional
+
+current_auction_id: ContextVar[Optional[str]] = ContextVar("current_auction_id", default=None)
+
+# moduli i cui frame portano l'etichetta dell'asta nello stack
+TAGGED_MODULES = ("api.routers.auctions", "api.auction_room", "core.")
+
+DEFAULT_INTERVAL = 0.005
+MAX_DEPTH = 128
+
+
+class ProfilerUnavailable(RuntimeError):
+    """SIGPROF non disponibile (es. Windows) o event loop fuori dal thread principale."""
+
+
+class ProfilerBusy(RuntimeError):
+    """Un profilo è già in corso in questo processo."""
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = DEFAULT_INTERVAL, max_depth: int = MAX_DEPTH):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples: Counter = Counter()  # (auction_id, stack) -> campioni
+        # modulo di ogni code object visto, risolto al primo campione che lo contiene
+        self._modules: Dict[CodeType, str] = {}
+        self.running = False
+        self._previous_handler = None
+
+    def start(self) -> None:
+        if not hasattr(signal, "SIGPROF"):
+            raise ProfilerUnavailable("SIGPROF is not available on this platform")
+        if threading.current_thread() is not threading.main_thread():
+            raise ProfilerUnavailable("the profiler must be started from the main thread")
+        self.samples.clear()
+        self._modules.clear()
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        self.running = True
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        self.running = False
+
+    def _sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        codes: List[CodeType] = []
+        modules = self._modules
+        depth = self.max_depth
+        while frame is not None and depth:
+            code = frame.f_code
+            if code not in modules:
+                modules[code] = frame.f_globals.get("__name__", "")
+            codes.append(code)
+            frame = frame.f_back
+            depth -= 1
+        codes.reverse()
+        self.samples[(current_auction_id.get(), tuple(codes))] += 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.samples.values())
+
+    def collapsed(self) -> str:
+        """Una riga per stack: `auction:<id>;modulo:funzione;... <campioni>`."""
+        names: Dict[CodeType, str] = {}
+        lines = Counter()
+        for (auction_id, codes), count in self.samples.items():
+            frames = [names.get(code) or names.setdefault(code, self._frame_name(code)) for code in codes]
+            if auction_id is not None and any(_is_tagged(name) for name in frames):
+                frames.insert(0, f"auction:{auction_id}")
+            lines[";".join(frames)] += count
+        return "".join(f"{stack} {count}\n" for stack, count in lines.most_common())
+
+    def _frame_name(self, code: CodeType) -> str:
+        module = self._modules.get(code)
+        return f"{module}:{code.co_qualname}" if module else code.co_qualname
+
+    def by_auction(self) -> Dict[str, int]:
+        counts = Counter()
+        for (auction_id, _), count in self.samples.items():
+            counts[auction_id or "-"] += count
+        return dict(counts)
+
+
+def _is_tagged(name: str) -> bool:
+    return name.startswith(TAGGED_MODULES)
+
+
+_lock = threading.Lock()
+_active: Optional[SamplingProfiler] = None
+
+
+def start(interval: float = DEFAULT_INTERVAL) -> SamplingProfiler:
+    """Avvia il profiler del processo; ne è ammesso uno alla volta."""
+    global _active
+    with _lock:
+        if _active is not None:
+            raise ProfilerBusy("a profile is already running")
+        profiler = SamplingProfiler(interval)
+        profiler.start()
+        _active = profiler
+    return profiler
+
+
+def stop(profiler: SamplingProfiler) -> None:
+    global _active
+    with _lock:
+        profiler.stop()
+        if _active is profiler:
+            _active = None
@@ -0,0 +1,174 @@
+import os
+from typing import Callable, Dict, List, Optional, Type
+
+from api.auction_room import AuctionRoom
+from api.checkpoint import read_checkpoint
+from api.event_log import read_log
+from api.routers import auctions as auctions_router
+from api.sharding import is_valid_auction_id
+from core.enums import PlayerRole
+from core.events import (
+    AuctionCreated,
+    AuctionEvent,
+    AuctionFinished,
+    AuctionStarted,
+    ParticipantAssigned,
+    ParticipantJoined,
+    PlayerAssigned,
+    PlayerCalled,
+    PlayersAdded,
+)
+from core.player import Player
+
+
+def _players_added(room: AuctionRoom, event: PlayersAdded) -> None:
+    room.auction.player_pool.add_players([
+        Player(player_id, name, PlayerRole[role], real_team)
+        for player_id, name, role, real_team in event.players
+    ])
+
+
+def _participant_joined(room: AuctionRoom, event: ParticipantJoined) -> None:
+    room.participant_records.setdefault(event.participant_id, {"name": event.name, "team_ids": []})
+
+
+def _participant_assigned(room: AuctionRoom, event: ParticipantAssigned) -> None:
+    record = room.participant_records.get(event.participant_id)
+    if record is not None:
+        record["team_ids"] = [event.team_id]
+
+
+def _player_called(room: AuctionRoom, event: PlayerCalled) -> None:
+    if event.caller_id is not None:
+        room.last_caller_id = event.caller_id
+
+
+def _player_assigned(room: AuctionRoom, event: PlayerAssigned) -> None:
+    pool = room.auction.player_pool
+    team = room.auction.teams[event.team_id]
+    pool.assign_to_team(pool.get(event.player_id), team, event.price)
+    team.spent += event.price
+
+
+def _auction_started(room: AuctionRoom, event: AuctionStarted) -> None:
+    room.auction.started = True
+
+
+def _auction_finished(room: AuctionRoom, event: AuctionFinished) -> None:
+    room.auction.started = False
+
+
+# come ogni evento modifica lo stato; gli eventi assenti sono solo informativi
+APPLY: Dict[Type[AuctionEvent], Callable[[AuctionRoom, AuctionEvent], None]] = {
+    PlayersAdded: _players_added,
+    ParticipantJoined: _participant_joined,
+    ParticipantAssigned: _participant_assigned,
+    PlayerCalled: _player_called,
+    PlayerAssigned: _player_assigned,
+    AuctionStarted: _auction_started,
+    AuctionFinished: _auction_finished,
+}
+
+
+def apply_event(room: AuctionRoom, event: AuctionEvent) -> None:
+    handler = APPLY.get(type(event))
+    if handler is not None:
+        handler(room, event)
+
+
+def restore_room(state: dict) -> AuctionRoom:
+    """Ricostruisce una stanza da un checkpoint (vedi api.checkpoint.capture_state)."""
+    room = auctions_router._build_room(
+        state["auction_id"], auctions_router.AuctionCreate(**state["options"]), seed_players=False
+    )
+    auction = room.auction
+    pool = auction.player_pool
+    pool.add_players([
+        Player(player_id, name, PlayerRole[role], real_team)
+        for player_id, name, role, real_team in state["players"]
+    ])
+    for team_id, team_state in state["teams"].items():
+        team = auction.teams[team_id]
+        for player_id in team_state["roster"]:
+            pool.assign_to_team(pool.get(player_id), team)
+        team.spent = team_state["spent"]
+    room.participant_records = {
+        pid: {"name": record["name"], "team_ids": list(record["team_ids"])}
+        for pid, record in state["participants"].items()
+    }
+    room.last_caller_id = state["last_caller_id"]
+    auction.started = state["started"]
+    return room
+
+
+def replay_auction(path: str, checkpoint_path: Optional[str] = None) -> Optional[AuctionRoom]:
+    """
+    Ricostruisce una stanza dal suo log; None se il log è vuoto.
+    Con un checkpoint valido si rileggono solo gli eventi successivi.
+    """
+    state = read_checkpoint(checkpoint_path) if checkpoint_path else None
+    offset = state["offset"] if state is not None else 0
+    if state is not None and os.path.getsize(path) < offset:
+        # log più corto del checkpoint: non ci si può fidare, si rilegge tutto
+        state, offset = None, 0
+
+    events, end = read_log(path, offset)
+    if os.path.getsize(path) > end:
+        # riga finale scritta a metà da un crash: la si scarta prima di riaprire il log
+        with open(path, "r+b") as f:
+            f.truncate(end)
+
+    if state is not None:
+        room = restore_room(state)
+        seq = state["seq"]
+    else:
+        if not events:
+            return None
+        seq, created = events.pop(0)
+        if not isinstance(created, AuctionCreated):
+            raise ValueError(f"{path}: the log must start with auction_created")
+        room = auctions_router._build_room(created.auction_id, auctions_router.AuctionCreate(**created.options))
+    for seq, event in events:
+        apply_event(room, event)
+
+    # il loop d'asta non sopravvive al riavvio: l'asta riparte con /start
+    room.auction.started = False
+    auctions_router._open_event_log(room, seq=seq)
+    if room.checkpointer is not None and state is not None:
+        room.checkpointer.last_seq = state["seq"]
+    return room
+
+
+def recover_auctions() -> List[str]:
+    """Ricostruisce tutte le aste presenti nella directory dei log."""
+    log_dir = auctions_router.event_log_dir
+    if log_dir is None or not os.path.isdir(log_dir):
+        return []
+    recovered: List[str] = []
+    for filename in sorted(os.listdir(log_dir)):
+        if not filename.endswith(".jsonl"):
+            continue
+        auction_id = filename[: -len(".jsonl")]
+        # file che non corrispondono a un id valido non vengono mai riletti (né il loro checkpoint)
+        if not is_valid_auction_id(auction_id):
+            continue
+        # con più shard che condividono la directory ognuno rilegge solo le sue aste
+        if not auctions_router.shard.owns(auction_id):
+            continue
+        base_path = auctions_router.event_log_base_path(auction_id)
+        room = replay_auction(f"{base_path}.jsonl", f"{base_path}.ckpt")
+        if room is None:
+            continue
+        auctions_router.auctions[room.auction.auction_id] = room
+        recovered.append(room.auction.auction_id)
+    return recovered
+
+
+async def close_event_logs() -> None:
+    for room in auctions_router.auctions.values():
+        if room.checkpointer is not None:
+            await room.checkpointer.close()
+            room.checkpointer = None
+        if room.event_log is not None:
+            await room.event_log.close()
+            room.event_log = None
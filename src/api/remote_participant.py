@@ -4,25 +4,36 @@ from typing import Dict, List, Optional
 
 from fastapi import WebSocket
 
+from api.connection import OutboundConnection
+from api.request_deadlines import EXPIRED, RequestDeadlines, RequestExpired
 from core.bid import Bid
 from core.bidder import IBidder
 from core.bidding_strategies import BiddingStrategy, FreeBiddingStrategy
 from core.caller import ICaller
 from core.player import Player
+from core.selection_strategies import SelectionStrategy
 from core.team import Team
 
 
 class RemoteParticipant(ICaller, IBidder):
     """Partecipante remoto che si connette via WebSocket."""
 
-    def __init__(self, participant_id: str, username: str, ws: WebSocket):
+    def __init__(self, participant_id: str, username: str, ws: WebSocket, connection: Optional[OutboundConnection] = None):
         self._id = participant_id
         self._name = username
         self._ws = ws
+        self.connection = connection
         self._team: Optional[Team] = None
         self._connected = True
         self._pending_requests: Dict[str, asyncio.Future] = {}
 
+        # scadenze delle richieste, impostate dalla stanza in join()
+        self.deadlines: Optional[RequestDeadlines] = None
+        self.bid_timeout: Optional[float] = None
+        self.choose_timeout: Optional[float] = None
+        # scelta automatica quando il partecipante non sceglie in tempo (None = passa il turno)
+        self.choose_fallback: Optional[SelectionStrategy] = None
+
     @property
     def id(self) -> str:
         return self._id
@@ -59,24 +70,31 @@ class RemoteParticipant(ICaller, IBidder):
             future = self._pending_requests.pop(request_id)
             if not future.done():
                 future.set_result(message)
+        elif request_id and self.deadlines is not None:
+            self.deadlines.note_unmatched(request_id)
 
-    async def _await_response(self, request_id: str, expected_type: str) -> Optional[dict]:
+    async def _await_response(self, request_id: str, expected_type: str, timeout: Optional[float] = None) -> Optional[dict]:
         if not self._connected:
             raise ConnectionError("Participant disconnected")
         loop = asyncio.get_running_loop()
         future: asyncio.Future = loop.create_future()
         self._pending_requests[request_id] = future
+        if timeout is not None and self.deadlines is not None:
+            self.deadlines.register(request_id, future, timeout)
         try:
             response = await future
         finally:
             self._pending_requests.pop(request_id, None)
+        if response is EXPIRED:
+            raise RequestExpired(request_id)
         if response is None:
             return None
         if response.get("type") != expected_type:
             raise ValueError(f"Unexpected response type: {response.get('type')} (expected {expected_type})")
         return response
 
-    async def _request(self, payload: dict, expected_response: str) -> Optional[dict]:
+    async def _request(self, payload: dict, expected_response: str, timeout: Optional[float] = None) -> Optional[dict]:
+        """Invia una richiesta e ne attende la risposta; RequestExpired se scade il timeout."""
         if not self._connected:
             raise ConnectionError("Participant disconnected")
         request_id = uuid.uuid4().hex
@@ -85,30 +103,45 @@ class RemoteParticipant(ICaller, IBidder):
             "request_id": request_id,
             "participant_id": self.id,
         }
-        await self._ws.send_json(payload)
+        if timeout is not None:
+            payload["deadline_seconds"] = timeout
+        if not await self._send(payload):
+            return None
         try:
-            return await self._await_response(request_id, expected_response)
+            return await self._await_response(request_id, expected_response, timeout)
         except ConnectionError:
             return None
 
+    async def _send(self, message: dict) -> bool:
+        if self.connection is not None:
+            return self.connection.send(message)
+        await self._ws.send_json(message)
+        return True
+
     async def get_bid(self, player: Player) -> Optional[float]:
         team = self.team
-        response = await self._request(
-            {
-                "type": "place_bid_request",
-                "player": {
-                    "player_id": player.player_id,
-                    "name": player.name,
-                    "role": player.role.name,
-                    "real_team": player.realTeam,
-                },
-                "team": {
-                    "id": team.id if team else None,
-                    "name": team.name if team else None,
+        try:
+            response = await self._request(
+                {
+                    "type": "place_bid_request",
+                    "player": {
+                        "player_id": player.player_id,
+                        "name": player.name,
+                        "role": player.role.name,
+                        "real_team": player.realTeam,
+                    },
+                    "team": {
+                        "id": team.id if team else None,
+                        "name": team.name if team else None,
+                        "max_bid": team.max_bid_for(player.role) if team else None,
+                    },
                 },
-            },
-            "place_bid_response",
-        )
+                "place_bid_response",
+                self.bid_timeout,
+            )
+        except RequestExpired:
+            # nessuna offerta in tempo: passa
+            return None
         if not response:
             return None
         amount = response.get("amount")
@@ -120,7 +153,7 @@ class RemoteParticipant(ICaller, IBidder):
             return None
         if bid_value <= 0:
             return None
-        if team is not None and not team.can_afford(bid_value):
+        if team is not None and not team.can_afford(bid_value, player.role):
             return None
         return bid_value
 
@@ -129,28 +162,41 @@ class RemoteParticipant(ICaller, IBidder):
             raise Exception("Bidder has no team assigned")
         return Bid(player=player, amount=amount, team=self.team)
 
-    async def choose_player(self, player_pool: List[Player]) -> Optional[Player]:
-        response = await self._request(
-            {
-                "type": "choose_player_request",
-                "player_pool": [
-                    {
-                        "player_id": p.player_id,
-                        "name": p.name,
-                        "role": p.role.name,
-                        "real_team": p.realTeam,
-                    }
-                    for p in player_pool
-                ],
-            },
-            "choose_player_response",
-        )
+    async def choose_player(self, player_pool: List[Player], pool_version: Optional[int] = None) -> Optional[Player]:
+        request: dict = {"type": "choose_player_request"}
+        if pool_version is not None:
+            # il client ha già il pool in cache: basta indicarne la versione
+            request["pool_version"] = pool_version
+        else:
+            request["player_pool"] = [
+                {
+                    "player_id": p.player_id,
+                    "name": p.name,
+                    "role": p.role.name,
+                    "real_team": p.realTeam,
+                }
+                for p in player_pool
+            ]
+        try:
+            response = await self._request(request, "choose_player_response", self.choose_timeout)
+        except RequestExpired:
+            if self.choose_fallback is None:
+                return None
+            return self.choose_fallback.select_player(player_pool)
         if not response:
             return None
         player_id = response.get("player_id")
         for player in player_pool:
             if player.player_id == player_id:
                 return player
+        # il client sceglie dal suo pool in cache, che include anche giocatori per cui
+        # nessuna squadra può offrire: glielo si dice invece di ripetere la richiesta in silenzio
+        await self._send({
+            "type": "choose_player_rejected",
+            "request_id": response.get("request_id"),
+            "participant_id": self.id,
+            "payload": {"player_id": player_id, "reason": "not_callable"},
+        })
         return None
 
     async def choose_bidding_strategy(self) -> BiddingStrategy:
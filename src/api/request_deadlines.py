@@ -0,0 +1,93 @@
+import asyncio
+import heapq
+import itertools
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+class RequestExpired(TimeoutError):
+    """La richiesta al partecipante è scaduta senza risposta."""
+
+
+# valore con cui viene risolta la future di una richiesta scaduta
+EXPIRED = object()
+
+
+class RequestDeadlines:
+    """
+    Scadenze di tutte le richieste pendenti di una stanza: un heap ordinato per
+    scadenza e un solo timer sull'event loop, riarmato sulla prossima scadenza.
+    Le richieste risolte restano nell'heap fino alla loro scadenza e vengono
+    semplicemente ignorate dallo sweep.
+    """
+
+    def __init__(self, expired_memory: int = 1024):
+        self._heap: List[Tuple[float, int, str, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._armed_at: Optional[float] = None
+        # id delle ultime richieste scadute, per distinguere risposte tardive e orfane
+        self._recently_expired: "OrderedDict[str, None]" = OrderedDict()
+        self._expired_memory = expired_memory
+
+        self.expired = 0
+        self.late = 0
+        self.orphaned = 0
+
+    def register(self, request_id: str, future: asyncio.Future, timeout: float) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        heapq.heappush(self._heap, (deadline, next(self._counter), request_id, future))
+        if self._armed_at is None or deadline < self._armed_at:
+            self._arm(loop, deadline)
+
+    def _arm(self, loop: asyncio.AbstractEventLoop, when: float) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._armed_at = when
+        self._handle = loop.call_at(when, self._sweep, loop)
+
+    def _sweep(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._handle = None
+        self._armed_at = None
+        now = loop.time()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, request_id, future = heapq.heappop(heap)
+            if future.done():
+                continue
+            future.set_result(EXPIRED)
+            self.expired += 1
+            self._recently_expired[request_id] = None
+            if len(self._recently_expired) > self._expired_memory:
+                self._recently_expired.popitem(last=False)
+        # scarta in testa le richieste già risolte, poi riarma sulla prossima scadenza
+        while heap and heap[0][3].done():
+            heapq.heappop(heap)
+        if heap:
+            self._arm(loop, heap[0][0])
+
+    def note_unmatched(self, request_id: str) -> None:
+        """Risposta arrivata per una richiesta non più pendente."""
+        if request_id in self._recently_expired:
+            self.late += 1
+        else:
+            self.orphaned += 1
+
+    @property
+    def pending(self) -> int:
+        return sum(1 for entry in self._heap if not entry[3].done())
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.pending,
+            "expired": self.expired,
+            "late": self.late,
+            "orphaned": self.orphaned,
+        }
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+            self._armed_at = None
@@ -0,0 +1,65 @@
+import asyncio
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from api import profiler
+
+router = APIRouter()
+
+# durata massima di un profilo richiesto via HTTP
+MAX_PROFILE_SECONDS = 120.0
+
+# token da inviare in X-Admin-Token; senza, le route di amministrazione sono spente
+admin_token: Optional[str] = os.environ.get("FANTAPY_ADMIN_TOKEN") or None
+
+
+def _check_token(token: Optional[str]) -> None:
+    if admin_token is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if token is None or not hmac.compare_digest(token.encode(), admin_token.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@router.post("/profile")
+async def profile(
+    seconds: float = Query(10.0, gt=0, le=MAX_PROFILE_SECONDS),
+    interval: float = Query(profiler.DEFAULT_INTERVAL, ge=0.001, le=1.0),
+    fmt: str = Query("collapsed", alias="format"),
+    x_admin_token: Optional[str] = Header(None),
+):
+    """
+    Campiona questo processo per `seconds` secondi e restituisce gli stack.
+    `collapsed` è il formato di flamegraph.pl / speedscope (un file .folded);
+    `json` riassume i campioni per asta insieme agli stack.
+    Il campionamento rallenta tutte le aste del processo: serve il token di admin.
+    """
+    _check_token(x_admin_token)
+    if fmt not in {"collapsed", "json"}:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {fmt}")
+    try:
+        active = profiler.start(interval)
+    except profiler.ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except profiler.ProfilerUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.stop(active)
+
+    if fmt == "json":
+        return {
+            "pid": os.getpid(),
+            "interval": interval,
+            "samples": active.total,
+            "by_auction": active.by_auction(),
+            "collapsed": active.collapsed(),
+        }
+    return PlainTextResponse(
+        active.collapsed(),
+        headers={"Content-Disposition": f'attachment; filename="fantapy-{os.getpid()}.folded"'},
+    )
@@ -1,18 +1,46 @@
 import asyncio
+import codecs
 import json
+import os
+import time
 import uuid
 from typing import Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel, Field
 
+from api import metrics
+from api.profiler import current_auction_id
 from api.auction_room import AuctionRoom
+from api.checkpoint import Checkpointer
+from api.event_log import EventLog
+from api.sharding import AUCTION_ID_PATTERN, ShardConfig, is_valid_auction_id
 from api.models import AuctionDTO, AuctionRoomDTO, ParticipantDTO, PlayerDTO, TeamDTO
 from api.remote_participant import RemoteParticipant
 from core.auction import Auction
 from core.calling_strategy.sequential_calling_strategy import SequentialCallingStrategy
+from core.eligibility import EligibilityEngine
 from core.enums import PlayerRole
+from core.events import (
+    AuctionCreated,
+    AuctionFinished,
+    AuctionStarted,
+    ParticipantAssigned,
+    ParticipantJoined,
+    ParticipantLeft,
+    PlayerAssigned,
+    PlayerCalled,
+    PlayersAdded,
+)
+from core.market_rules import UniquePlayerMarket
+from core.ownership_policies import NoDuplicatesOwnershipPolicy
+from core.ownership_store import OwnershipStore
 from core.player import Player
+from core.player_import import PlayerImportError, PlayerImporter, make_reader
+from core.player_pool import PlayerPool
+from core.player_search import InvalidCursor
+from core.selection_strategies import AlphabeticalSelection, RandomSelection, SelectionStrategy
+from core.team_building_strategies.fixed_max_strategy import FixedMaxStrategy
 
 router = APIRouter()
 
@@ -20,12 +48,42 @@ router = APIRouter()
 auctions: Dict[str, AuctionRoom] = {}
 auction_simulations: Dict[str, asyncio.Task] = {}
 
+# directory dei log degli eventi (un file per asta); None disattiva la persistenza
+event_log_dir: Optional[str] = os.environ.get("FANTAPY_EVENT_LOG_DIR") or None
+# ogni quanti eventi scrivere un checkpoint dello stato (0 li disattiva)
+checkpoint_every: int = int(os.environ.get("FANTAPY_CHECKPOINT_EVERY", "1000"))
+# shard servito da questo processo (vedi api.sharding); di default uno solo con tutte le aste
+shard: ShardConfig = ShardConfig.from_env()
+
+# margine oltre bid_timeout prima di chiudere d'autorità un lotto: le scadenze
+# per richiesta scattano prima, questo copre i partecipanti che non le hanno
+BID_DEADLINE_GRACE = 1.0
+
+CHOOSE_FALLBACKS = {
+    "random": RandomSelection,
+    "alphabetical": AlphabeticalSelection,
+}
+
 
 class AuctionCreate(BaseModel):
+    # assegnato dal proxy in modalità shard; altrimenti generato qui
+    auction_id: Optional[str] = Field(None, pattern=AUCTION_ID_PATTERN)
     name: str
     nickname: str
     budget: int
     max_teams: int
+    bid_timeout: float = 30.0
+    choose_timeout: float = 60.0
+    # scelta automatica allo scadere del turno: "random", "alphabetical" o None (passa)
+    choose_fallback: Optional[str] = None
+    # frame al secondo al massimo verso gli spettatori
+    spectator_fps: float = 4.0
+    # slot per ruolo da riempire (es. {"P": 3, "D": 8, "C": 8, "A": 6}); None: rosa libera
+    roster: Optional[Dict[str, int]] = None
+    # prezzo minimo di un giocatore, riservato per ogni slot ancora vuoto
+    min_price: float = 1
+    # giocatori d'esempio nel pool; False per le aste il cui listone arriva da /players/import
+    seed_players: bool = True
 
 
 class AssignParticipantRequest(BaseModel):
@@ -54,6 +112,7 @@ def _seed_default_players(auction: Auction) -> None:
 
 
 def _build_snapshot(auction_room: AuctionRoom) -> AuctionRoomDTO:
+    started = time.perf_counter()
     participant_assignments: Dict[str, List[str]] = {
         participant_id: []
         for participant_id in auction_room.participants
@@ -88,6 +147,7 @@ def _build_snapshot(auction_room: AuctionRoom) -> AuctionRoomDTO:
                 name=team.name,
                 players=team_players,
                 budget=team.spent,
+                max_bid=team.max_bid,
                 participants=team_participants,
             )
         )
@@ -116,17 +176,28 @@ def _build_snapshot(auction_room: AuctionRoom) -> AuctionRoomDTO:
             )
             for participant in auction_room.participants.values()
         ],
+        version=auction_room.version,
     )
+    metrics.SNAPSHOT_SECONDS.observe(time.perf_counter() - started)
     return snapshot
 
 
-async def _broadcast_snapshot(auction_room: AuctionRoom) -> AuctionRoomDTO:
+def _snapshot_message(auction_room: AuctionRoom) -> dict:
     snapshot = _build_snapshot(auction_room)
+    return {"type": "auction_snapshot", "payload": snapshot.model_dump(mode="json")}
+
+
+async def _broadcast_delta(auction_room: AuctionRoom, *changes: dict) -> int:
+    """
+    Invia solo le modifiche allo stato, con la nuova versione della stanza.
+    Un client che trova un buco di versione chiede un resync e riceve lo snapshot completo.
+    """
+    version = auction_room.next_version()
     await auction_room.broadcast({
-        "type": "auction_snapshot",
-        "payload": snapshot.model_dump_json(),
+        "type": "auction_delta",
+        "payload": {"version": version, "changes": list(changes)},
     })
-    return snapshot
+    return version
 
 
 def _player_to_payload(player: Player) -> dict:
@@ -138,6 +209,51 @@ def _player_to_payload(player: Player) -> dict:
     }
 
 
+def _player_to_dto(player: Player) -> dict:
+    return {
+        "id": player.player_id,
+        "name": player.name,
+        "role": player.role.name,
+        "team_name": player.realTeam,
+    }
+
+
+def _pool_snapshot_message(auction_room: AuctionRoom) -> dict:
+    pool = auction_room.auction.player_pool
+    return {
+        "type": "player_pool_snapshot",
+        "payload": {
+            "version": pool.version,
+            "players": [_player_to_payload(p) for p in pool.get_available()],
+        },
+    }
+
+
+def _pool_update(auction_room: AuctionRoom) -> dict:
+    """
+    Differenze del pool rispetto all'ultimo turno annunciato. I client applicano
+    added/removed_ids alla propria cache solo se è alla base_version, altrimenti
+    chiedono un pool_sync.
+    """
+    pool = auction_room.auction.player_pool
+    base_version = auction_room.announced_pool_version
+    auction_room.announced_pool_version = pool.version
+    changes = pool.changes_since(base_version)
+    if changes is None:
+        return {
+            "version": pool.version,
+            "reset": True,
+            "players": [_player_to_payload(p) for p in pool.get_available()],
+        }
+    added_ids, removed_ids = changes
+    return {
+        "version": pool.version,
+        "base_version": base_version,
+        "added": [_player_to_payload(pool.get(pid)) for pid in added_ids],
+        "removed_ids": removed_ids,
+    }
+
+
 def _get_callers_for_auction(auction_room: AuctionRoom) -> List[RemoteParticipant]:
     callers: List[RemoteParticipant] = []
     participant_ids = set()
@@ -155,7 +271,10 @@ def _ensure_calling_strategy(auction_room: AuctionRoom) -> List[RemoteParticipan
         return []
     strategy = getattr(auction_room.auction, "calling_strategy", None)
     if strategy is None:
-        auction_room.auction.set_calling_strategy(SequentialCallingStrategy(callers))
+        strategy = SequentialCallingStrategy(callers)
+        # dopo un riavvio la rotazione riprende dall'ultimo caller registrato
+        strategy.resume_after(auction_room.last_caller_id)
+        auction_room.auction.set_calling_strategy(strategy)
     else:
         try:
             strategy.update_callers(callers)
@@ -164,12 +283,13 @@ def _ensure_calling_strategy(auction_room: AuctionRoom) -> List[RemoteParticipan
     return callers
 
 
-async def _request_player_choice(callers: List[RemoteParticipant], available_players: List[Player]) -> tuple[Optional[Player], Optional[RemoteParticipant]]:
+async def _request_player_choice(callers: List[RemoteParticipant], available_players: List[Player], pool_version: Optional[int] = None) -> tuple[Optional[Player], Optional[RemoteParticipant]]:
     if not callers or not available_players:
         return None, None
+    started = time.perf_counter()
     tasks: Dict[asyncio.Task, RemoteParticipant] = {}
     for caller in callers:
-        tasks[asyncio.create_task(caller.choose_player(available_players))] = caller
+        tasks[asyncio.create_task(caller.choose_player(available_players, pool_version))] = caller
 
     done, pending = await asyncio.wait(tasks.keys(), return_when=asyncio.FIRST_COMPLETED)
 
@@ -190,15 +310,17 @@ async def _request_player_choice(callers: List[RemoteParticipant], available_pla
     for task in pending:
         task.cancel()
 
+    metrics.CHOOSE_SECONDS.observe(time.perf_counter() - started)
     return chosen_player, chosen_caller
 
 
 async def _run_bidding_phase(auction_room: AuctionRoom, player: Player) -> Optional[RemoteParticipant]:
+    eligibility = auction_room.eligibility
+    mask = eligibility.bidder_mask(player)
     bidders = [
         participant
         for participant in auction_room.participants.values()
-        if participant.team is not None
-        and auction_room.auction.player_pool.is_available_for_team(player, participant.team)
+        if participant.team is not None and mask & eligibility.bit(participant.team)
     ]
 
     await auction_room.broadcast({
@@ -206,10 +328,12 @@ async def _run_bidding_phase(auction_room: AuctionRoom, player: Player) -> Optio
         "payload": {
             "player": _player_to_payload(player),
             "bidders": [{"id": b.id, "name": b.name, "team_id": b.team.id if b.team else None} for b in bidders],
+            "deadline_seconds": auction_room.bid_timeout,
         },
     })
 
     if not bidders:
+        metrics.LOTS_NO_BIDDERS.inc()
         await auction_room.broadcast({
             "type": "bidding_result",
             "payload": {
@@ -219,17 +343,29 @@ async def _run_bidding_phase(auction_room: AuctionRoom, player: Player) -> Optio
         })
         return None
 
+    # buste chiuse raccolte in parallelo: il lotto si chiude appena hanno risposto
+    # tutti; la scadenza è applicata da auction_room.request_deadlines e chi non
+    # risponde in tempo passa. Il timeout qui è solo una rete di sicurezza.
+    tasks = [asyncio.create_task(bidder.get_bid(player)) for bidder in bidders]
+    _, pending = await asyncio.wait(tasks, timeout=auction_room.bid_timeout + BID_DEADLINE_GRACE)
+    for task in pending:
+        task.cancel()
+
     offers = []
-    for bidder in bidders:
+    for bidder, task in zip(bidders, tasks):
+        if task in pending:
+            continue
         try:
-            amount = await bidder.get_bid(player)
+            amount = task.result()
         except Exception:
             amount = None
         if amount is None:
             continue
         offers.append((amount, bidder))
 
+    metrics.BIDS.inc(len(offers))
     if not offers:
+        metrics.LOTS_NO_BIDS.inc()
         await auction_room.broadcast({
             "type": "bidding_result",
             "payload": {
@@ -239,11 +375,27 @@ async def _run_bidding_phase(auction_room: AuctionRoom, player: Player) -> Optio
         })
         return None
 
+    metrics.LOTS_WON.inc()
     offers.sort(key=lambda item: item[0], reverse=True)
     winning_amount, winner = offers[0]
     if winner.team is not None:
         auction_room.auction.player_pool.assign_to_team(player, winner.team, winning_amount)
         winner.team.spent += winning_amount
+        auction_room.publish(PlayerAssigned(
+            team_id=winner.team.id,
+            team_name=winner.team.name,
+            player_id=player.player_id,
+            player_name=player.name,
+            price=winning_amount,
+        ))
+        await _broadcast_delta(auction_room, {
+            "op": "player_assigned",
+            "team_id": winner.team.id,
+            "player": _player_to_dto(player),
+            "price": winning_amount,
+            "spent": winner.team.spent,
+            "max_bid": winner.team.max_bid,
+        })
 
     await auction_room.broadcast({
         "type": "bidding_result",
@@ -265,6 +417,8 @@ async def _run_bidding_phase(auction_room: AuctionRoom, player: Player) -> Optio
 async def _run_auction_loop(auction_id: str, auction_room: AuctionRoom):
     auction = auction_room.auction
     end_reason: Optional[str] = None
+    # etichetta i campioni del profiler raccolti in questo task (vedi api.profiler)
+    current_auction_id.set(auction_id)
     try:
         await auction_room.broadcast({
             "type": "auction_started",
@@ -272,10 +426,12 @@ async def _run_auction_loop(auction_id: str, auction_room: AuctionRoom):
         })
 
         while auction.started:
+            turn_started = time.perf_counter()
             available_pool = _ensure_calling_strategy(auction_room)
             strategy = getattr(auction, "calling_strategy", None)
             callers = strategy.next_caller() if strategy else available_pool
-            available_players = auction.player_pool.get_available()
+            # solo i giocatori per cui almeno una squadra ha posto e crediti
+            available_players = auction_room.eligibility.callable_players()
 
             if not callers:
                 end_reason = "no_callers"
@@ -294,15 +450,24 @@ async def _run_auction_loop(auction_id: str, auction_room: AuctionRoom):
                 "payload": {
                     "auction_id": auction_id,
                     "callers": [{"id": c.id, "name": c.name} for c in callers],
-                    "player_pool": [_player_to_payload(p) for p in available_players],
+                    "pool": _pool_update(auction_room),
                 },
             })
 
-            player, caller = await _request_player_choice(callers, available_players)
+            player, caller = await _request_player_choice(
+                callers, available_players, auction.player_pool.version
+            )
             if not player or not caller:
                 await asyncio.sleep(0.2)
                 continue
 
+            auction_room.last_caller_id = caller.id
+            auction_room.publish(PlayerCalled(
+                player_id=player.player_id,
+                player_name=player.name,
+                role=player.role.name,
+                caller_id=caller.id,
+            ))
             await auction_room.broadcast({
                 "type": "player_selected",
                 "payload": {
@@ -311,18 +476,22 @@ async def _run_auction_loop(auction_id: str, auction_room: AuctionRoom):
                 },
             })
 
+            bidding_started = time.perf_counter()
             await _run_bidding_phase(auction_room, player)
-            await _broadcast_snapshot(auction_room)
+            finished = time.perf_counter()
+            metrics.BIDDING_SECONDS.observe(finished - bidding_started)
+            metrics.TURN_SECONDS.observe(finished - turn_started)
 
     except asyncio.CancelledError:
         raise
     finally:
         auction.started = False
+        auction_room.publish(AuctionFinished(auction_id=auction_id, reason=end_reason))
         await auction_room.broadcast({
             "type": "auction_finished",
             "payload": {"auction_id": auction_id, "reason": end_reason},
         })
-        await _broadcast_snapshot(auction_room)
+        await _broadcast_delta(auction_room, {"op": "auction_state", "started": False})
 
 
 # --- ROUTES ---
@@ -340,13 +509,93 @@ def list_auctions() -> List[dict]:
     ]
 
 
-@router.post("/")
-def create_auction(data: AuctionCreate):
-    auction_id = str(uuid.uuid4())
+def _build_room(auction_id: str, data: AuctionCreate, seed_players: bool = True) -> AuctionRoom:
+    """Costruisce la stanza di un'asta nuova; usata anche per ricostruirla dal log."""
+    fallback: Optional[SelectionStrategy] = None
+    if data.choose_fallback is not None:
+        fallback_cls = CHOOSE_FALLBACKS.get(data.choose_fallback)
+        if fallback_cls is None:
+            raise HTTPException(status_code=400, detail=f"Unknown choose fallback: {data.choose_fallback}")
+        fallback = fallback_cls()
+
     auction = Auction(auction_id, data.name, data.max_teams)
-    _seed_default_players(auction)
+    # un solo store per stanza: il pool registra le assegnazioni, regola, policy e idoneità le leggono
+    store = OwnershipStore()
+    auction.player_pool = PlayerPool(store=store)
+    for team in auction.teams.values():
+        team.budget = data.budget
+    if data.roster is not None:
+        try:
+            max_slots = {PlayerRole[role]: count for role, count in data.roster.items()}
+        except KeyError as e:
+            raise HTTPException(status_code=400, detail=f"Unknown role: {e.args[0]}")
+        auction.set_team_building_strategy(FixedMaxStrategy(max_slots), data.min_price)
+    if seed_players and data.seed_players:
+        _seed_default_players(auction)
+
+    auction_room = AuctionRoom(
+        auction,
+        bid_timeout=data.bid_timeout,
+        choose_timeout=data.choose_timeout,
+        choose_fallback=fallback,
+        spectator_fps=data.spectator_fps,
+    )
+    auction_room.market_rule = UniquePlayerMarket(store)
+    auction_room.ownership_policy = NoDuplicatesOwnershipPolicy(store)
+    auction_room.eligibility = EligibilityEngine(
+        auction.teams.values(),
+        auction.player_pool,
+        auction.team_building_strategy,
+        data.min_price,
+        auction_room.market_rule,
+        auction_room.ownership_policy,
+    )
+    auction_room.eligibility.attach(auction.events)
+    auction_room.snapshot_factory = lambda: _snapshot_message(auction_room)
+    auction_room.options = data.model_dump()
+    return auction_room
+
 
-    auctions[auction_id] = AuctionRoom(auction)
+def event_log_base_path(auction_id: str) -> str:
+    """Percorso (senza estensione) di log e checkpoint dell'asta, sempre dentro event_log_dir."""
+    if not is_valid_auction_id(auction_id):
+        raise ValueError(f"Invalid auction id: {auction_id!r}")
+    root = os.path.realpath(event_log_dir)
+    base_path = os.path.realpath(os.path.join(root, auction_id))
+    if os.path.dirname(base_path) != root:
+        raise ValueError(f"Auction id escapes the event log directory: {auction_id!r}")
+    return base_path
+
+
+def _open_event_log(auction_room: AuctionRoom, seq: int = 0) -> None:
+    if event_log_dir is None:
+        return
+    os.makedirs(event_log_dir, exist_ok=True)
+    base_path = event_log_base_path(auction_room.auction.auction_id)
+    auction_room.event_log = EventLog(f"{base_path}.jsonl", seq=seq)
+    auction_room.event_log.attach(auction_room.auction.events)
+    if checkpoint_every > 0:
+        auction_room.checkpointer = Checkpointer(auction_room, f"{base_path}.ckpt", every=checkpoint_every)
+        auction_room.checkpointer.attach(auction_room.auction.events)
+
+
+@router.post("/")
+async def create_auction(data: AuctionCreate):
+    auction_id = data.auction_id or str(uuid.uuid4())
+    if not shard.owns(auction_id):
+        raise HTTPException(status_code=421, detail="Auction belongs to another shard")
+    if auction_id in auctions:
+        raise HTTPException(status_code=409, detail="Auction already exists")
+    auction_room = _build_room(auction_id, data)
+    auctions[auction_id] = auction_room
+
+    _open_event_log(auction_room)
+    auction_room.publish(AuctionCreated(
+        auction_id=auction_id,
+        name=data.name,
+        max_teams=data.max_teams,
+        options=data.model_dump(),
+    ))
 
     return {"auction_id": auction_id, "join_url": f"/auctions/{auction_id}/ws"}
 
@@ -367,9 +616,14 @@ async def auction_ws(ws: WebSocket, auction_id: str):
         return
 
     await ws.accept()
+    current_auction_id.set(auction_id)
     auction_room = auctions[auction_id]
-    snapshot = _build_snapshot(auction_room)
-    await ws.send_json({"type": "auction_snapshot", "payload": snapshot.model_dump_json()})
+    # tutto ciò che esce su questo socket passa dalla sua coda, nello stesso ordine
+    connection = auction_room.open_connection(ws)
+    connection.send(_snapshot_message(auction_room))
+    # il catalogo viaggia una volta per connessione, poi solo differenze
+    connection.send(_pool_snapshot_message(auction_room))
+    joined_ids: List[str] = []
 
     try:
         while True:
@@ -378,16 +632,42 @@ async def auction_ws(ws: WebSocket, auction_id: str):
 
             if msg["type"] == "join":
                 nickname = msg["payload"]["name"]
-                new_id = str(uuid.uuid4())
-                participant = RemoteParticipant(new_id, nickname, ws)
+                # un partecipante già registrato (anche prima di un riavvio) può riprendere il suo posto
+                previous_id = msg["payload"].get("participant_id")
+                resumed = previous_id in auction_room.participant_records and previous_id not in auction_room.participants
+                new_id = previous_id if resumed else str(uuid.uuid4())
+                participant = RemoteParticipant(new_id, nickname, ws, connection)
 
                 auction_room.join(participant)
-
-                await ws.send_json({
+                joined_ids.append(participant.id)
+                team_ids: List[int] = []
+                if resumed:
+                    team_ids = list(auction_room.participant_records[new_id]["team_ids"])
+                    for team_id in team_ids:
+                        auction_room.assign_participant(participant, team_id)
+                else:
+                    auction_room.publish(ParticipantJoined(participant_id=participant.id, name=participant.name))
+
+                connection.send({
                     "type": "joined",
-                    "payload": {"id": participant.id, "name": participant.name}
+                    "payload": {"id": participant.id, "name": participant.name, "resumed": resumed}
+                })
+                await _broadcast_delta(auction_room, {
+                    "op": "participant_joined",
+                    "participant": {
+                        "id": participant.id,
+                        "name": participant.name,
+                        "assigned_teams": [str(team_id) for team_id in team_ids],
+                    },
                 })
-                await _broadcast_snapshot(auction_room)
+                # chi entra riceve lo stato completo, gli altri solo il delta
+                connection.send(_snapshot_message(auction_room))
+
+            elif msg["type"] == "resync":
+                connection.send(_snapshot_message(auction_room))
+
+            elif msg["type"] == "pool_sync":
+                connection.send(_pool_snapshot_message(auction_room))
 
             else:
                 msg_type = msg.get("type")
@@ -406,14 +686,112 @@ async def auction_ws(ws: WebSocket, auction_id: str):
                     await auction_room.broadcast(msg)
 
     except WebSocketDisconnect:
-        disconnected_ids = [
-            pid for pid, participant in list(auction_room.participants.items())
-            if participant._ws is ws
-        ]
-        for pid in disconnected_ids:
+        pass
+    finally:
+        # la connessione può essere già stata chiusa dalla coda (consumer troppo lento)
+        connection.close()
+        for pid in joined_ids:
             auction_room.leave(pid)
-        if disconnected_ids:
-            await _broadcast_snapshot(auction_room)
+            auction_room.publish(ParticipantLeft(participant_id=pid))
+        if joined_ids:
+            await _broadcast_delta(auction_room, *[
+                {"op": "participant_left", "participant_id": pid}
+                for pid in joined_ids
+            ])
+
+
+@router.websocket("/{auction_id}/spectate")
+async def auction_spectate(ws: WebSocket, auction_id: str):
+    """Canale in sola lettura: snapshot iniziale, poi frame aggregati della stanza."""
+    if auction_id not in auctions:
+        await ws.close(code=1008)
+        return
+
+    await ws.accept()
+    current_auction_id.set(auction_id)
+    auction_room = auctions[auction_id]
+    connection = auction_room.spectators.add(ws)
+    connection.send(_pool_snapshot_message(auction_room))
+    try:
+        while True:
+            msg = json.loads(await ws.receive_text())
+            # gli spettatori possono solo chiedere di riallinearsi
+            if msg.get("type") == "resync":
+                connection.send(auction_room.spectators.snapshot_frame())
+            elif msg.get("type") == "pool_sync":
+                connection.send(_pool_snapshot_message(auction_room))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        connection.close()
+
+
+@router.get("/{auction_id}/spectators")
+def get_auction_spectators(auction_id: str) -> dict:
+    if auction_id not in auctions:
+        raise HTTPException(status_code=404, detail="Auction not found")
+
+    return auctions[auction_id].spectators.stats()
+
+
+@router.get("/{auction_id}/pool")
+def get_auction_pool(auction_id: str) -> dict:
+    if auction_id not in auctions:
+        raise HTTPException(status_code=404, detail="Auction not found")
+
+    return _pool_snapshot_message(auctions[auction_id])["payload"]
+
+
+@router.get("/{auction_id}/players")
+def search_auction_players(
+    auction_id: str,
+    q: str = "",
+    role: Optional[str] = None,
+    team: Optional[str] = None,
+    available: Optional[bool] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    Ricerca nel pool per nome (prefisso delle parole o sottostringa), ruolo,
+    squadra reale e disponibilità, a pagine: per la pagina successiva si
+    ripassa il next_cursor ricevuto.
+    """
+    if auction_id not in auctions:
+        raise HTTPException(status_code=404, detail="Auction not found")
+
+    player_role: Optional[PlayerRole] = None
+    if role is not None:
+        player_role = PlayerRole.__members__.get(role) or PlayerRole.__members__.get(role.upper())
+        if player_role is None:
+            raise HTTPException(status_code=400, detail=f"Unknown role: {role}")
+
+    pool = auctions[auction_id].auction.player_pool
+    try:
+        page = pool.search(q, player_role, team, available, limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "version": pool.version,
+        "players": [{**_player_to_payload(p), "available": pool.is_available(p)} for p in page.players],
+        "next_cursor": page.next_cursor,
+    }
+
+
+@router.get("/{auction_id}/connections")
+def get_auction_connections(auction_id: str) -> List[dict]:
+    if auction_id not in auctions:
+        raise HTTPException(status_code=404, detail="Auction not found")
+
+    return auctions[auction_id].connection_stats()
+
+
+@router.get("/{auction_id}/requests")
+def get_auction_requests(auction_id: str) -> dict:
+    if auction_id not in auctions:
+        raise HTTPException(status_code=404, detail="Auction not found")
+
+    return auctions[auction_id].request_deadlines.stats()
 
 
 @router.post("/{auction_id}/assign")
@@ -430,7 +808,13 @@ async def assign_participant(auction_id: str, payload: AssignParticipantRequest)
         raise HTTPException(status_code=404, detail="Team not found")
 
     auction_room.assign_participant(participant, payload.team_id)
-    snapshot = await _broadcast_snapshot(auction_room)
+    auction_room.publish(ParticipantAssigned(participant_id=participant.id, team_id=payload.team_id))
+    await _broadcast_delta(auction_room, {
+        "op": "participant_assigned",
+        "participant_id": participant.id,
+        "team_id": payload.team_id,
+    })
+    snapshot = _build_snapshot(auction_room)
     return {"status": "assigned", "snapshot": snapshot.model_dump()}
 
 
@@ -451,8 +835,16 @@ async def start_auction(auction_id: str):
     if not callers:
         raise HTTPException(status_code=400, detail="No eligible callers")
 
+    # rose e budget possono essere cambiati prima della partenza (import, ripristino)
+    auction_room.eligibility.rebuild()
     auction_room.auction.started = True
-    await _broadcast_snapshot(auction_room)
+    auction_room.publish(AuctionStarted(auction_id=auction_id))
+    # il pool può essere cambiato (import) dopo lo snapshot ricevuto da ogni client
+    # alla connessione: si riparte da uno snapshot completo e i turni ne danno le differenze
+    pool_snapshot = _pool_snapshot_message(auction_room)
+    await auction_room.broadcast(pool_snapshot)
+    auction_room.announced_pool_version = pool_snapshot["payload"]["version"]
+    await _broadcast_delta(auction_room, {"op": "auction_state", "started": True})
 
     task = asyncio.create_task(_run_auction_loop(auction_id, auction_room))
     auction_simulations[auction_id] = task
@@ -462,3 +854,43 @@ async def start_auction(auction_id: str):
 
     task.add_done_callback(_cleanup_task)
     return {"status": "started"}
+
+
+@router.post("/{auction_id}/players/import")
+async def import_auction_players(auction_id: str, request: Request, fmt: str = Query("csv", alias="format")):
+    """
+    Importa un listone CSV/JSON inviato come corpo della richiesta.
+    Il corpo viene letto a blocchi e ogni blocco è parsato e inserito nel pool
+    prima di leggere il successivo. Un errore di formato interrompe l'import ma
+    i blocchi già inseriti restano: la risposta 400 riporta quanti sono.
+    """
+    if auction_id not in auctions:
+        raise HTTPException(status_code=404, detail="Auction not found")
+
+    auction_room = auctions[auction_id]
+    if auction_room.auction.started:
+        raise HTTPException(status_code=400, detail="Auction already started")
+
+    pool = auction_room.auction.player_pool
+    imported_from = len(pool.players)
+    try:
+        importer = PlayerImporter(pool, make_reader(fmt))
+    except PlayerImportError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    try:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        async for chunk in request.stream():
+            importer.feed(decoder.decode(chunk))
+        importer.feed(decoder.decode(b"", final=True))
+        report = importer.close()
+    except (PlayerImportError, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=400, detail={"error": str(exc), "partial": True, **importer.report.to_dict()})
+    finally:
+        # anche un import interrotto può aver già inserito dei blocchi nel pool
+        added = pool.players[imported_from:]
+        if added:
+            auction_room.publish(PlayersAdded(players=[
+                [p.player_id, p.name, p.role.name, p.realTeam] for p in added
+            ]))
+
+    return report.to_dict()
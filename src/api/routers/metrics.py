@@ -0,0 +1,40 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from api import metrics
+from api.routers import auctions as auctions_router
+
+router = APIRouter()
+
+
+# valori letti dallo stato delle stanze solo quando /metrics viene interrogato
+def _rooms() -> dict:
+    running = len(auctions_router.auction_simulations)
+    return {("running",): running, ("idle",): len(auctions_router.auctions) - running}
+
+
+def _connections() -> dict:
+    rooms = auctions_router.auctions.values()
+    return {
+        ("participant",): sum(len(room.connections) for room in rooms),
+        ("spectator",): sum(len(room.spectators.viewers) for room in rooms),
+    }
+
+
+def _pending_requests() -> int:
+    return sum(room.request_deadlines.pending for room in auctions_router.auctions.values())
+
+
+def _request_timeouts() -> int:
+    return sum(room.request_deadlines.expired for room in auctions_router.auctions.values())
+
+
+ROOMS = metrics.Gauge("fantapy_rooms", "Auction rooms by state.", ["state"], collect=_rooms)
+CONNECTIONS = metrics.Gauge("fantapy_connections", "Open WebSocket connections.", ["kind"], collect=_connections)
+PENDING_REQUESTS = metrics.Gauge("fantapy_pending_requests", "Participant requests awaiting a response.", collect=_pending_requests)
+REQUEST_TIMEOUTS = metrics.Counter("fantapy_request_timeouts_total", "Participant requests that expired.", collect=_request_timeouts)
+
+
+@router.get("/metrics")
+def get_metrics() -> Response:
+    return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
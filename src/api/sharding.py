@@ -0,0 +1,220 @@
+"""
+Deployment a shard su una sola macchina: N processi worker (uno per shard),
+ciascuno proprietario delle aste con crc32(auction_id) % N == indice, e un
+processo front che inoltra REST e WebSocket allo shard giusto su socket unix.
+
+    python -m api.sharding --workers 4 --port 8000
+"""
+import argparse
+import asyncio
+import os
+import re
+import signal
+import subprocess
+import sys
+import tempfile
+import uuid
+import zlib
+from typing import List, Optional, Sequence
+
+SHARD_INDEX_ENV = "FANTAPY_SHARD_INDEX"
+SHARD_COUNT_ENV = "FANTAPY_SHARD_COUNT"
+
+# header legati alla singola connessione: non vanno inoltrati
+HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "upgrade", "host", "content-length"}
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# formato ammesso per gli id scelti dal client: l'id diventa anche il nome dei
+# file di log e checkpoint, quindi niente separatori di percorso né "."
+AUCTION_ID_PATTERN = r"^[A-Za-z0-9_-]{1,64}$"
+_AUCTION_ID_RE = re.compile(AUCTION_ID_PATTERN)
+
+
+def is_valid_auction_id(auction_id: object) -> bool:
+    return isinstance(auction_id, str) and _AUCTION_ID_RE.fullmatch(auction_id) is not None
+
+
+def shard_for(auction_id: str, shard_count: int) -> int:
+    """Shard proprietario di un'asta: stabile tra processi e riavvii (a differenza di hash())."""
+    return zlib.crc32(auction_id.encode()) % shard_count
+
+
+class ShardConfig:
+    def __init__(self, index: int = 0, count: int = 1):
+        if count < 1 or not 0 <= index < count:
+            raise ValueError(f"Invalid shard {index}/{count}")
+        self.index = index
+        self.count = count
+
+    @classmethod
+    def from_env(cls) -> "ShardConfig":
+        return cls(int(os.environ.get(SHARD_INDEX_ENV, "0")), int(os.environ.get(SHARD_COUNT_ENV, "1")))
+
+    def owns(self, auction_id: str) -> bool:
+        return self.count == 1 or shard_for(auction_id, self.count) == self.index
+
+
+def create_proxy_app(socket_paths: Sequence[str], transports: Optional[Sequence[object]] = None):
+    """
+    App del processo front. `transports` (uno per shard) sostituisce i socket unix
+    per le richieste HTTP, ad esempio nei test.
+    """
+    # dipendenze del solo processo front (incluse in fastapi[standard] / uvicorn[standard])
+    import httpx
+    from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+    from fastapi.staticfiles import StaticFiles
+    from websockets.asyncio.client import unix_connect
+    from websockets.exceptions import ConnectionClosed, InvalidStatus
+
+    from api.main import FRONTEND_DIR
+
+    if transports is None:
+        transports = [httpx.AsyncHTTPTransport(uds=path) for path in socket_paths]
+    clients = [httpx.AsyncClient(transport=t, base_url="http://shard", timeout=None) for t in transports]
+    shard_count = len(clients)
+
+    async def lifespan(app):
+        yield
+        for client in clients:
+            await client.aclose()
+
+    app = FastAPI(lifespan=lifespan)
+
+    def _headers(headers) -> dict:
+        return {k: v for k, v in headers.items() if k.lower() not in HOP_BY_HOP_HEADERS}
+
+    def _response(upstream) -> Response:
+        return Response(upstream.content, status_code=upstream.status_code, headers=_headers(upstream.headers))
+
+    @app.get("/auctions/")
+    async def list_auctions() -> List[dict]:
+        responses = await asyncio.gather(*(client.get("/auctions/") for client in clients))
+        auctions: List[dict] = []
+        for response in responses:
+            response.raise_for_status()
+            auctions.extend(response.json())
+        return auctions
+
+    @app.post("/auctions/")
+    async def create_auction(request: Request) -> Response:
+        # l'id viene scelto qui, così si sa già quale shard creerà l'asta
+        body = await request.json()
+        if not isinstance(body, dict):
+            raise HTTPException(status_code=422, detail="Expected a JSON object")
+        body.setdefault("auction_id", str(uuid.uuid4()))
+        if not is_valid_auction_id(body["auction_id"]):
+            raise HTTPException(status_code=422, detail="Invalid auction_id")
+        shard = shard_for(body["auction_id"], shard_count)
+        return _response(await clients[shard].post("/auctions/", json=body))
+
+    @app.websocket("/auctions/{auction_id}/{channel:path}")
+    async def auction_ws(ws: WebSocket, auction_id: str, channel: str):
+        # qualsiasi socket di un'asta (/ws dei partecipanti, /spectate, ...) va allo shard proprietario
+        path = socket_paths[shard_for(auction_id, shard_count)]
+        query = ws.url.query
+        target = f"ws://shard/auctions/{auction_id}/{channel}" + (f"?{query}" if query else "")
+        try:
+            upstream = await unix_connect(path, target)
+        except InvalidStatus:
+            await ws.close(code=1008)
+            return
+        await ws.accept()
+
+        async def client_to_shard():
+            try:
+                while True:
+                    await upstream.send(await ws.receive_text())
+            except WebSocketDisconnect:
+                pass
+
+        async def shard_to_client():
+            try:
+                async for message in upstream:
+                    await ws.send_text(message)
+            except ConnectionClosed:
+                pass
+
+        tasks = [asyncio.create_task(client_to_shard()), asyncio.create_task(shard_to_client())]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await upstream.close()
+            # 1005/1006 descrivono chiusure senza codice: non si possono inviare
+            close_code = upstream.close_code if upstream.close_code not in (None, 1005, 1006) else 1000
+            try:
+                await ws.close(code=close_code)
+            except (RuntimeError, WebSocketDisconnect):
+                pass  # il client ha già chiuso
+
+    @app.api_route("/auctions/{target:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
+    async def proxy(request: Request, target: str) -> Response:
+        # /auctions/{auction_id}/...: il corpo (es. import del listone) viene inoltrato in streaming
+        auction_id = target.split("/", 1)[0]
+        upstream = await clients[shard_for(auction_id, shard_count)].request(
+            request.method,
+            request.url.path,
+            params=request.query_params,
+            headers=_headers(request.headers),
+            content=request.stream(),
+        )
+        return _response(upstream)
+
+    app.mount("/app", StaticFiles(directory=FRONTEND_DIR, html=True), name="frontend")
+    return app
+
+
+def _spawn_worker(index: int, count: int, socket_path: str) -> subprocess.Popen:
+    env = {**os.environ, SHARD_INDEX_ENV: str(index), SHARD_COUNT_ENV: str(count)}
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--app-dir", SRC_DIR, "--uds", socket_path, "--log-level", "warning"],
+        env=env,
+    )
+
+
+async def _wait_for_sockets(paths: Sequence[str], workers: Sequence[subprocess.Popen], timeout: float = 30.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not all(os.path.exists(path) for path in paths):
+        if any(worker.poll() is not None for worker in workers):
+            raise RuntimeError("A shard worker exited during startup")
+        if loop.time() > deadline:
+            raise RuntimeError("Shard workers did not start in time")
+        await asyncio.sleep(0.05)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run fantapy as N shard workers behind a front proxy")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--socket-dir", default=None, help="directory for the shard unix sockets")
+    args = parser.parse_args(argv)
+
+    socket_dir = args.socket_dir or tempfile.mkdtemp(prefix="fantapy-shards-")
+    socket_paths = [os.path.join(socket_dir, f"shard-{i}.sock") for i in range(args.workers)]
+    for path in socket_paths:
+        if os.path.exists(path):
+            os.unlink(path)
+
+    workers = [_spawn_worker(i, args.workers, path) for i, path in enumerate(socket_paths)]
+    try:
+        asyncio.run(_wait_for_sockets(socket_paths, workers))
+        uvicorn.run(create_proxy_app(socket_paths), host=args.host, port=args.port)
+    finally:
+        for worker in workers:
+            if worker.poll() is None:
+                worker.send_signal(signal.SIGTERM)
+        for worker in workers:
+            try:
+                worker.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import asyncio
+from typing import Callable, List, Optional, Set
+
+from fastapi import WebSocket
+
+from api.connection import OutboundConnection
+from api.encoding import encode_message
+
+
+class SpectatorRelay:
+    """
+    Canale in sola lettura per chi guarda l'asta. I broadcast della stanza vengono
+    solo accodati (publish non fa altro lavoro) e inviati al massimo max_fps volte
+    al secondo come un unico frame "spectator_batch", serializzato una volta per
+    tutti gli spettatori. Ogni spettatore ha la sua OutboundConnection: chi resta
+    indietro riceve lo snapshot al posto dei messaggi persi.
+    """
+
+    def __init__(
+        self,
+        snapshot_factory: Callable[[], dict],
+        max_fps: float = 4.0,
+        max_queue: int = 64,
+        send_timeout: float = 5.0,
+        max_batch: int = 256,
+    ):
+        self.snapshot_factory = snapshot_factory
+        self.max_fps = max_fps
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        # oltre questo numero di messaggi in un frame conviene mandare lo snapshot
+        self.max_batch = max_batch
+        self.viewers: Set[OutboundConnection] = set()
+
+        self._pending: List[dict] = []
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._last_flush = float("-inf")
+        self._snapshot_frame: Optional[str] = None
+
+        self.frames = 0
+        self.messages = 0
+        self.snapshots = 0
+
+    def add(self, ws: WebSocket) -> OutboundConnection:
+        connection = OutboundConnection(
+            ws,
+            max_queue=self.max_queue,
+            send_timeout=self.send_timeout,
+            overflow_policy=OutboundConnection.RESYNC,
+            resync_factory=self.snapshot_frame,
+            on_close=self._on_close,
+        )
+        self.viewers.add(connection)
+        connection.start()
+        connection.send(self.snapshot_frame())
+        return connection
+
+    def _on_close(self, connection: OutboundConnection) -> None:
+        self.viewers.discard(connection)
+
+    def snapshot_frame(self) -> str:
+        """Snapshot serializzato, condiviso finché lo stato non cambia."""
+        if self._snapshot_frame is None:
+            self._snapshot_frame = encode_message(self.snapshot_factory())
+            self.snapshots += 1
+        return self._snapshot_frame
+
+    def publish(self, message: dict) -> None:
+        self._snapshot_frame = None
+        if not self.viewers:
+            return
+        self._pending.append(message)
+        if self._handle is None:
+            loop = asyncio.get_running_loop()
+            when = max(loop.time(), self._last_flush + 1.0 / self.max_fps)
+            self._handle = loop.call_at(when, self._flush, loop)
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._handle = None
+        self._last_flush = loop.time()
+        messages, self._pending = self._pending, []
+        if not messages or not self.viewers:
+            return
+        if len(messages) > self.max_batch:
+            frame = self.snapshot_frame()
+        else:
+            frame = encode_message({"type": "spectator_batch", "payload": {"messages": messages}})
+        for connection in list(self.viewers):
+            connection.send(frame)
+        self.frames += 1
+        self.messages += len(messages)
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        for connection in list(self.viewers):
+            connection.close()
+
+    def stats(self) -> dict:
+        return {
+            "viewers": len(self.viewers),
+            "frames": self.frames,
+            "messages": self.messages,
+            "snapshots": self.snapshots,
+            "max_fps": self.max_fps,
+        }
@@ -1,33 +1,65 @@
 import asyncio
+import random
 import uuid
 from core.auction import Auction
-from core.player import Player
-from core.enums import PlayerRole
 from core.budget_strategies import LimitedBudgetStrategy
+from core.events import PlayerAssigned
 from core.market_rules import UniquePlayerMarket
 from core.ownership_policies import NoDuplicatesOwnershipPolicy
+from core.simulation import DEFAULT_ROSTER, AuctionSimulation, BotParticipant, generate_players
 from core.team_building_strategies.fixed_max_strategy import FixedMaxStrategy
 from core.user import User
 
+BUDGET = 500
+
 
 async def main():
    user_name = input("Ciao, come ti chiami: ")
-   user = User(str(uuid.uuid4), user_name)
+   user = User(str(uuid.uuid4()), user_name)
 
    auction_name = input("Inserisci nome asta: ")
    teams = int(input("Quanti team: "))
+   seed = int(input("Seed della simulazione [0]: ") or 0)
+
+   auction = await create_auction(auction_name, teams)
+   print(f"Auction created by {user.name}: {auction.auction_id}")
+
+   # listone sintetico: tre giocatori per ogni posto in rosa di ogni squadra
+   auction.player_pool.add_players(generate_players({role: count * teams * 3 for role, count in DEFAULT_ROSTER.items()}, seed))
+   auction.subscribe(PlayerAssigned, lambda e: print(f"  {e.player_name} -> {e.team_name} ({e.price:g})"))
+
+   # ogni squadra dell'asta è guidata da un bot
+   rng = random.Random(seed)
+   bots = []
+   for team in auction.teams.values():
+      team.budget = BUDGET
+      bots.append(BotParticipant(f"Bot {team.name}", team, rng))
 
-   auction = await create_auction(auction_name, user.name, teams)
-   
-   print(f"Auction creted: {auction.auction_id}")
+   # regola e policy leggono lo stesso store, come nelle stanze dell'API
+   market_rule = UniquePlayerMarket()
+   simulation = AuctionSimulation(
+      auction.player_pool.players,
+      seed=seed,
+      budget=BUDGET,
+      market_rule=market_rule,
+      ownership_policy=NoDuplicatesOwnershipPolicy(market_rule.store),
+      budget_strategy=LimitedBudgetStrategy(BUDGET),
+      team_building=FixedMaxStrategy(dict(DEFAULT_ROSTER)),
+      participants=bots,
+      events=auction.events,
+   )
+   result = await simulation.run_async()
 
-   await auction.join(user.name)
+   print(f"\n{result.lots} lots, complete: {result.complete}")
+   for team in result.teams:
+      print(f"\n{team.name}: spent {team.spent:g}/{team.budget:g}")
+      for role, players in team.get_roster_by_role().items():
+         print(f"  {role.name}: {', '.join(p.name for p in players)}")
 
-async def create_auction(name, user, teams):
+async def create_auction(name, teams):
     return Auction(
-        str(uuid.uuid4),
+        str(uuid.uuid4()),
         auction_name=name,
-        host_name=user,
         teams=teams
     )
 
@@ -4,9 +4,11 @@ from core.bid import Bid
 from core.bidder import IBidder
 from core.caller import ICaller
 from core.calling_strategy.base import CallingStrategy
+from core.event_bus import AsyncSubscriber, EventBus, EventKey
 from core.events import AuctionEvent, BidPlaced
 from core.player_pool import PlayerPool
 from core.team import Team
+from core.team_building_strategies.base import TeamBuildingStrategy
 from core.turn import Turn
 
 
@@ -30,39 +32,34 @@ class Auction:
         self.started = False
 
         self.current_turn:Optional[Turn] = None
-        # lista di callback sottoscritte
-        self._subscribers: Dict[str, List[Callable[[AuctionEvent], None]]] = {}
+        # regole di composizione della rosa (set_team_building_strategy); None: rosa libera
+        self.team_building_strategy: Optional[TeamBuildingStrategy] = None
+        # bus degli eventi: dispatch table per classe, sottoscrittori sincroni e asincroni
+        self.events = EventBus()
 
-    def subscribe(self, event_type: str, callback: Callable[[AuctionEvent], None]) -> None:
+    def subscribe(self, event_type: EventKey, callback: Callable[[AuctionEvent], None]) -> None:
         """
-        Sottoscrivi una callback ad un tipo di evento.
+        Sottoscrivi una callback ad un tipo di evento (stringa, classe o "*").
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+        self.events.subscribe(event_type, callback)
 
-    def unsubscribe(self, event_type: str, callback: Callable[[AuctionEvent], None]) -> None:
+    def unsubscribe(self, event_type: EventKey, callback: Callable[[AuctionEvent], None]) -> None:
         """
         Rimuovi una sottoscrizione.
         """
-        if event_type in self._subscribers:
-            self._subscribers[event_type] = [
-                cb for cb in self._subscribers[event_type] if cb != callback
-            ]
+        self.events.unsubscribe(event_type, callback)
+
+    def subscribe_async(self, event_type: EventKey, handler: Callable[[List[AuctionEvent]], object], max_queue: Optional[int] = 1024) -> AsyncSubscriber:
+        """
+        Sottoscrivi un handler che riceve gli eventi a blocchi, una volta per giro dell'event loop.
+        """
+        return self.events.subscribe_async(event_type, handler, max_queue)
 
     def _publish(self, event: AuctionEvent) -> None:
         """
         Pubblica un evento a tutti i sottoscrittori registrati.
         """
-        # notifica sottoscrittori specifici per tipo
-        if event.type in self._subscribers:
-            for cb in list(self._subscribers[event.type]):
-                cb(event)
-
-        # notifica sottoscrittori "wildcard" (se registrati con "*")
-        if "*" in self._subscribers:
-            for cb in list(self._subscribers["*"]):
-                cb(event)
+        self.events.publish(event)
 
     def _generate_teams(self, n: int) -> dict[int, Team]:
         return {
@@ -131,4 +128,13 @@ class Auction:
     def set_calling_strategy(self,strategy:CallingStrategy):
         self.calling_strategy = strategy
 
+    def set_team_building_strategy(self, strategy: TeamBuildingStrategy, min_price: float = 1):
+        """
+        Regole di composizione della rosa: ogni squadra riserva min_price per
+        ciascuno slot ancora da riempire e ne tiene in cache l'offerta massima.
+        """
+        self.team_building_strategy = strategy
+        for team in self.teams.values():
+            team.set_requirements(strategy.roles_remaining(team), min_price)
+
     
\ No newline at end of file
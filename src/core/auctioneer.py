@@ -1,49 +1,157 @@
 # core/auctioneer.py
+import asyncio
+import inspect
+import logging
 from abc import ABC
-import threading
-import time
-from typing import Callable, Optional
+from typing import Callable, Optional, Set, Tuple
 
+from core.bid import Bid
 from core.player import Player
 from core.team import Team
 
+logger = logging.getLogger(__name__)
+
 class IAuctioneer(ABC):
     pass
 
 class Auctioneer:
-    def __init__(self, countdown_seconds: int = 10, tick_callback: Optional[Callable] = None):
+    """
+    Countdown di un lotto gestito interamente dall'event loop: nessun thread,
+    un solo TimerHandle per lotto (più quello dei tick, se attivi).
+    """
+
+    def __init__(
+        self,
+        countdown_seconds: float = 10,
+        tick_callback: Optional[Callable] = None,
+        tick_interval: Optional[float] = 1.0,
+        reset_on_bid: bool = False,
+        late_bid_window: float = 0,
+        late_bid_extension: float = 0,
+    ):
         """
         countdown_seconds: durata di un turno d'asta per un giocatore
-        tick_callback: funzione richiamata ogni secondo, utile per notifiche UI/WebSocket
+        tick_callback: funzione (o coroutine) richiamata ad ogni tick con i secondi rimanenti
+        tick_interval: granularità dei tick in secondi; None li disattiva
+        reset_on_bid: ogni rilancio riporta il countdown a countdown_seconds
+        late_bid_window, late_bid_extension: anti-sniping, un rilancio negli ultimi
+            late_bid_window secondi porta il tempo rimanente ad almeno late_bid_extension
         """
         self.countdown_seconds = countdown_seconds
         self.tick_callback = tick_callback
-        self._timer_thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
-        self.on_finish: Optional[Callable[[Player, Team, int], None]] = None
-
-    def start(self, player: Player, best_bid):
-        """Avvia countdown sul giocatore corrente"""
-        self._stop_event.clear()
-
-        def run():
-            remaining = self.countdown_seconds
-            while remaining > 0 and not self._stop_event.is_set():
-                if self.tick_callback:
-                    self.tick_callback(remaining)
-                time.sleep(1)
-                remaining -= 1
-
-            if not self._stop_event.is_set() and self.on_finish:
-                # Alla fine assegna il giocatore al miglior offerente
-                if best_bid:
-                    self.on_finish(player, best_bid.team, best_bid.amount)
-                else:
-                    self.on_finish(player, None, 0)
-
-        self._timer_thread = threading.Thread(target=run, daemon=True)
-        self._timer_thread.start()
-
-    def stop(self):
-        """Ferma il countdown (es. se arriva nuovo rilancio)"""
-        self._stop_event.set()
+        self.tick_interval = tick_interval
+        self.reset_on_bid = reset_on_bid
+        self.late_bid_window = late_bid_window
+        self.late_bid_extension = late_bid_extension
+        self.on_finish: Optional[Callable[[Player, Optional[Team], float], None]] = None
+
+        self.player: Optional[Player] = None
+        self.best_bid: Optional[Bid] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._deadline = 0.0
+        self._next_tick: Optional[float] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._result: Optional[asyncio.Future] = None
+        # task delle callback asincrone: tenuti vivi fino alla fine (il loop ha solo riferimenti deboli)
+        self._tasks: Set[asyncio.Future] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._result is not None and not self._result.done()
+
+    @property
+    def remaining(self) -> float:
+        if not self.running:
+            return 0.0
+        return max(0.0, self._deadline - self._loop.time())
+
+    def start(self, player: Player, best_bid: Optional[Bid] = None) -> None:
+        """Avvia countdown sul giocatore corrente (da chiamare dentro l'event loop)"""
+        self.stop()
+        self._loop = asyncio.get_running_loop()
+        self.player = player
+        self.best_bid = best_bid
+        now = self._loop.time()
+        self._deadline = now + self.countdown_seconds
+        self._next_tick = now if self.tick_interval else None
+        self._result = self._loop.create_future()
+        self._schedule()
+
+    def register_bid(self, bid: Bid) -> bool:
+        """Registra un rilancio e applica le regole di reset/estensione. False se il lotto è chiuso."""
+        if not self.running:
+            return False
+        if self.best_bid is None or bid.amount > self.best_bid.amount:
+            self.best_bid = bid
+
+        now = self._loop.time()
+        deadline = self._deadline
+        if self.reset_on_bid:
+            deadline = now + self.countdown_seconds
+        if self.late_bid_window and deadline - now <= self.late_bid_window:
+            deadline = max(deadline, now + self.late_bid_extension)
+        if deadline != self._deadline:
+            self._deadline = deadline
+            self._schedule()
+        return True
+
+    def stop(self) -> None:
+        """Ferma il countdown senza aggiudicare il giocatore"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._result is not None and not self._result.done():
+            self._result.cancel()
+
+    async def wait(self) -> Tuple[Player, Optional[Team], float]:
+        """Attende la fine del countdown: (giocatore, team vincitore o None, prezzo)"""
+        if self._result is None:
+            raise RuntimeError("Countdown not started")
+        return await self._result
+
+    def _schedule(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        when = self._deadline
+        if self._next_tick is not None and self._next_tick < when:
+            when = self._next_tick
+        self._handle = self._loop.call_at(when, self._wake)
+
+    def _wake(self) -> None:
+        self._handle = None
+        now = self._loop.time()
+        if now >= self._deadline:
+            self._finish()
+            return
+        if self._next_tick is not None and now >= self._next_tick:
+            self._call(self.tick_callback, round(self._deadline - now, 3))
+            self._next_tick = max(self._next_tick + self.tick_interval, now)
+        self._schedule()
+
+    def _finish(self) -> None:
+        # Alla fine assegna il giocatore al miglior offerente
+        if self.best_bid:
+            outcome = (self.player, self.best_bid.team, self.best_bid.amount)
+        else:
+            outcome = (self.player, None, 0)
+        self._result.set_result(outcome)
+        self._call(self.on_finish, *outcome)
+
+    def _call(self, callback: Optional[Callable], *args) -> None:
+        # un errore nella callback non deve fermare il countdown né lasciare wait() appeso
+        if callback is None:
+            return
+        try:
+            result = callback(*args)
+        except Exception:
+            logger.exception("Auctioneer callback %r failed", callback)
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Future) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Auctioneer callback task failed", exc_info=task.exception())
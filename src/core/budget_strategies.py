@@ -20,7 +20,8 @@ class LimitedBudgetStrategy(BudgetStrategy):
         self.budget = initial_budget
 
     def can_afford(self, team, player, price):
-        return self.budget - team.spent >= price
+        # il budget della strategia meno quanto riservato agli slot obbligatori della squadra
+        return self.budget - team.spent - team.reserve_for(player.role) >= price
 
     def apply_purchase(self, team, player, price):
         team.add_player(player,price)
@@ -32,4 +33,5 @@ class UnlimitedBudgetStrategy(BudgetStrategy):
 
     def apply_purchase(self, team, player, price):
         # non tocca il budget, ma traccia comunque la spesa
+        team.add_player(player, price)
         team.spent += price
@@ -1,8 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from fastapi import WebSocket
-
 from core.bidding_strategies import BiddingStrategy
 from core.player import Player
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from core.caller import ICaller
 from core.calling_strategy.base import CallingStrategy
@@ -20,8 +20,27 @@ class SequentialCallingStrategy(CallingStrategy):
         return [self._callers[self._index]]
 
     def update_callers(self, callers: List[ICaller]) -> None:
+        # la rotazione riprende dopo l'ultimo caller, se è ancora presente
+        last_caller_id = self.last_caller_id
         self._callers = callers
+        self.resume_after(last_caller_id)
+
+    @property
+    def last_caller_id(self) -> Optional[object]:
+        """Id dell'ultimo caller restituito (la posizione nella rotazione)."""
+        if 0 <= self._index < len(self._callers):
+            return getattr(self._callers[self._index], "id", None)
+        return None
+
+    def resume_after(self, caller_id: Optional[object]) -> None:
+        """Riprende la rotazione dopo il caller indicato (dall'inizio se non c'è)."""
         self._index = -1
+        if caller_id is None:
+            return
+        for index, caller in enumerate(self._callers):
+            if getattr(caller, "id", None) == caller_id:
+                self._index = index
+                return
 
     @property
     def callers(self) -> List[ICaller]:
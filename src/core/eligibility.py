@@ -0,0 +1,159 @@
+"""
+Idoneità squadre × ruoli tenuta come bitmask intere, un bit per squadra.
+
+Per ogni ruolo si conservano i posti liberi di ciascuna squadra (la matrice
+squadre × ruoli) e due maschere: le squadre con posto libero e quelle che
+possono ancora offrire il prezzo minimo (vedi Team.max_bid_for). Per ogni
+giocatore le copie e le squadre proprietarie si leggono dall'OwnershipStore
+del pool, con i limiti di MarketRule e OwnershipPolicy dell'asta.
+"Chi può offrire per questo giocatore" diventa un AND fra interi e "quali
+giocatori si possono chiamare" un test per ruolo invece che per coppia
+giocatore × squadra. Una assegnazione aggiorna solo la riga della squadra.
+"""
+from typing import Dict, Iterable, List, Optional
+
+from core.enums import PlayerRole
+from core.event_bus import EventBus
+from core.events import PlayerAssigned
+from core.market_rules import MarketRule
+from core.ownership_policies import OwnershipPolicy
+from core.player import Player
+from core.player_pool import PlayerPool
+from core.team import Team
+from core.team_building_strategies.base import TeamBuildingStrategy
+
+
+class EligibilityEngine:
+    def __init__(
+        self,
+        teams: Iterable[Team],
+        pool: PlayerPool,
+        team_building: Optional[TeamBuildingStrategy] = None,
+        min_price: float = 1,
+        market_rule: Optional[MarketRule] = None,
+        ownership_policy: Optional[OwnershipPolicy] = None,
+    ):
+        self.teams: List[Team] = list(teams)
+        self.pool = pool
+        self.store = pool.ownership
+        self.team_building = team_building
+        self.min_price = min_price
+        # copie massime in totale (None: nessun limite) e per squadra; senza regole
+        # esplicite valgono quelle del pool
+        if market_rule is not None:
+            self.max_copies: Optional[int] = market_rule.max_copies
+        else:
+            self.max_copies = None if pool.allow_duplicates else 1
+        self.max_per_team = ownership_policy.max_copies_per_player if ownership_policy else OwnershipPolicy.max_copies_per_player
+        self._index: Dict[int, int] = {team.id: i for i, team in enumerate(self.teams)}
+        # posti liberi per ruolo e squadra (None: nessun massimo)
+        self._capacity: Dict[PlayerRole, List[Optional[int]]] = {}
+        self._open: Dict[PlayerRole, int] = {}
+        self._solvent: Dict[PlayerRole, int] = {}
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Ricalcola tutto dallo stato di squadre e pool (es. dopo un ripristino)."""
+        count = len(self.teams)
+        self._capacity = {role: [None] * count for role in PlayerRole}
+        self._open = {role: 0 for role in PlayerRole}
+        self._solvent = {role: 0 for role in PlayerRole}
+        for team in self.teams:
+            self.refresh_team(team)
+
+    def refresh_team(self, team: Team) -> None:
+        """Ricalcola la riga di una squadra: O(ruoli)."""
+        index = self._index[team.id]
+        bit = 1 << index
+        for role in PlayerRole:
+            capacity = self.team_building.role_capacity(team, role) if self.team_building else None
+            self._capacity[role][index] = capacity
+            if capacity is None or capacity > 0:
+                self._open[role] |= bit
+            else:
+                self._open[role] &= ~bit
+            if team.max_bid_for(role) >= self.min_price:
+                self._solvent[role] |= bit
+            else:
+                self._solvent[role] &= ~bit
+
+    def record_assignment(self, team: Team, player: Player) -> None:
+        # la proprietà è già nello store del pool: cambia solo la riga della squadra
+        self.refresh_team(team)
+
+    def attach(self, bus: EventBus) -> None:
+        """Tiene il motore allineato alle assegnazioni pubblicate sul bus dell'asta."""
+        bus.subscribe(PlayerAssigned, self._on_assigned)
+
+    def detach(self, bus: EventBus) -> None:
+        bus.unsubscribe(PlayerAssigned, self._on_assigned)
+
+    def _on_assigned(self, event: PlayerAssigned) -> None:
+        index = self._index.get(event.team_id)
+        player = self.pool.get(event.player_id)
+        if index is not None and player is not None:
+            self.record_assignment(self.teams[index], player)
+
+    # --- interrogazioni ----------------------------------------------------------
+
+    def capacity(self, team: Team, role: PlayerRole) -> Optional[int]:
+        return self._capacity[role][self._index[team.id]]
+
+    def role_mask(self, role: PlayerRole) -> int:
+        """Squadre con un posto libero nel ruolo e il prezzo minimo a disposizione."""
+        return self._open[role] & self._solvent[role]
+
+    def owners_mask(self, player: Player) -> int:
+        """Squadre che hanno già tutte le copie del giocatore ammesse per squadra."""
+        mask = 0
+        for team_id in self.store.owners(player.player_id, self.max_per_team):
+            index = self._index.get(team_id)
+            if index is not None:
+                mask |= 1 << index
+        return mask
+
+    def bidder_mask(self, player: Player) -> int:
+        return self._open_for(player, self.role_mask(player.role))
+
+    def _open_for(self, player: Player, mask: int) -> int:
+        copies = self.store.copies(player.player_id)
+        if not copies:
+            return mask
+        if self.max_copies is not None and copies >= self.max_copies:
+            return 0
+        return mask & ~self.owners_mask(player)
+
+    def bit(self, team: Team) -> int:
+        """Bit della squadra nelle maschere; 0 per una squadra sconosciuta."""
+        index = self._index.get(team.id)
+        return 0 if index is None else 1 << index
+
+    def can_bid(self, team: Team, player: Player) -> bool:
+        return bool(self.bidder_mask(player) & self.bit(team))
+
+    def eligible_teams(self, player: Player) -> List[Team]:
+        mask = self.bidder_mask(player)
+        teams = []
+        while mask:
+            low = mask & -mask
+            teams.append(self.teams[low.bit_length() - 1])
+            mask ^= low
+        return teams
+
+    def callable_roles(self) -> List[PlayerRole]:
+        return [role for role in PlayerRole if self.role_mask(role)]
+
+    def callable_players(self, role: Optional[PlayerRole] = None) -> List[Player]:
+        """Giocatori disponibili per cui almeno una squadra può offrire."""
+        roles = [role] if role is not None else PlayerRole
+        players: List[Player] = []
+        for r in roles:
+            mask = self.role_mask(r)
+            if not mask:
+                continue
+            available = self.pool.get_available_by_role(r)
+            if self.pool.allow_duplicates and self.store.owned_mask():
+                # con i duplicati un giocatore resta chiamabile finché qualcuna può ancora prenderlo
+                available = [p for p in available if self._open_for(p, mask)]
+            players.extend(available)
+        return players
@@ -6,6 +6,10 @@ class PlayerRole(Enum):
     MIDFIELDER = C = Md = Cc = auto()
     FORWARD = A = Fw = auto()
 
+    # i membri sono singleton: basta l'hash per identità (Enum.__hash__ è in Python
+    # e i ruoli fanno da chiave nei contatori di rosa)
+    __hash__ = object.__hash__
+
 class AuctionMode(str, Enum):
     TEAM_DRIVEN = "team_driven"
     HOST_DRIVEN = "host_driven"
@@ -0,0 +1,163 @@
+# core/event_bus.py
+import asyncio
+import inspect
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Type, Union
+
+from core.events import AuctionEvent
+
+EventKey = Union[str, Type[AuctionEvent]]
+Callback = Callable[[AuctionEvent], None]
+
+
+class AsyncSubscriber:
+    """
+    Sottoscrittore asincrono: gli eventi vengono accodati (coda limitata, in caso
+    di overflow si scartano i più vecchi; max_queue=None per una coda illimitata)
+    e consegnati in blocco all'handler una volta per giro dell'event loop.
+    L'handler riceve una lista di eventi e può essere una funzione o una coroutine;
+    finché un blocco è in elaborazione i nuovi eventi si accumulano per il successivo.
+    """
+
+    def __init__(self, handler: Callable[[List[AuctionEvent]], object], max_queue: Optional[int] = 1024):
+        self.handler = handler
+        self.max_queue = max_queue
+        self._buffer: Deque[AuctionEvent] = deque()
+        self._scheduled = False
+        self._running: Optional[asyncio.Future] = None
+
+        self.delivered = 0
+        self.batches = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_error: Optional[BaseException] = None
+
+    def __call__(self, event: AuctionEvent) -> None:
+        if self.max_queue is not None and len(self._buffer) >= self.max_queue:
+            self._buffer.popleft()
+            self.dropped += 1
+        self._buffer.append(event)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if self._scheduled or self._running is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # pubblicato fuori dall'event loop: resta in coda fino a drain()
+            return
+        self._scheduled = True
+        loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._scheduled = False
+        if not self._buffer:
+            return
+        batch = list(self._buffer)
+        self._buffer.clear()
+        self.batches += 1
+        self.delivered += len(batch)
+        try:
+            result = self.handler(batch)
+        except Exception as exc:
+            self._failed(exc)
+            return
+        if inspect.isawaitable(result):
+            self._running = asyncio.ensure_future(result)
+            self._running.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Future) -> None:
+        self._running = None
+        if not task.cancelled() and task.exception() is not None:
+            self._failed(task.exception())
+        if self._buffer:
+            self._schedule()
+
+    def _failed(self, exc: BaseException) -> None:
+        self.errors += 1
+        self.last_error = exc
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    async def drain(self) -> None:
+        """Consegna gli eventi in coda e attende il blocco in corso."""
+        while self._buffer or self._running is not None:
+            if self._running is not None:
+                await asyncio.wait([self._running])
+                continue
+            self._flush()
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.pending,
+            "delivered": self.delivered,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+
+class EventBus:
+    """
+    Bus degli eventi di un'asta. Le sottoscrizioni si fanno per classe di evento
+    (valgono anche per le sottoclassi), per stringa di tipo ("bid_placed") o con
+    "*" per tutti gli eventi. Per ogni classe pubblicata si calcola una volta la
+    tupla di callback da invocare; sottoscrivere o disiscriversi invalida la tabella.
+    """
+
+    WILDCARD = "*"
+
+    def __init__(self):
+        self._subscribers: Dict[EventKey, Tuple[Callback, ...]] = {}
+        self._dispatch: Dict[type, Tuple[Callback, ...]] = {}
+
+    def subscribe(self, event_type: EventKey, callback: Callback) -> None:
+        self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (callback,)
+        self._dispatch.clear()
+
+    def unsubscribe(self, event_type: EventKey, callback: Callback) -> None:
+        callbacks = self._subscribers.get(event_type)
+        if not callbacks:
+            return
+        remaining = tuple(cb for cb in callbacks if cb != callback)
+        if remaining:
+            self._subscribers[event_type] = remaining
+        else:
+            del self._subscribers[event_type]
+        self._dispatch.clear()
+
+    def subscribe_async(
+        self,
+        event_type: EventKey,
+        handler: Callable[[List[AuctionEvent]], object],
+        max_queue: Optional[int] = 1024,
+    ) -> AsyncSubscriber:
+        """Registra un handler che riceve gli eventi a blocchi; ritorna il sottoscrittore (per unsubscribe e statistiche)."""
+        subscriber = AsyncSubscriber(handler, max_queue=max_queue)
+        self.subscribe(event_type, subscriber)
+        return subscriber
+
+    def publish(self, event: AuctionEvent) -> None:
+        callbacks = self._dispatch.get(event.__class__)
+        if callbacks is None:
+            callbacks = self._dispatch_for(event.__class__)
+        for cb in callbacks:
+            cb(event)
+
+    def has_subscribers(self, event_class: Type[AuctionEvent]) -> bool:
+        callbacks = self._dispatch.get(event_class)
+        if callbacks is None:
+            callbacks = self._dispatch_for(event_class)
+        return bool(callbacks)
+
+    def _dispatch_for(self, event_class: type) -> Tuple[Callback, ...]:
+        subscribers = self._subscribers
+        callbacks: Tuple[Callback, ...] = subscribers.get(event_class.type, ())
+        for klass in event_class.__mro__:
+            callbacks += subscribers.get(klass, ())
+        callbacks += subscribers.get(self.WILDCARD, ())
+        self._dispatch[event_class] = callbacks
+        return callbacks
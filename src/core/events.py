@@ -1,95 +1,159 @@
 # core/events.py
-from dataclasses import dataclass, field
-from typing import Dict
+from dataclasses import dataclass
+from typing import ClassVar, Dict, List, Optional
 
 
-@dataclass
+# Eventi slotted: il tipo è un attributo di classe (usato dall'EventBus per la
+# dispatch table) e il payload viene costruito solo quando qualcuno lo legge.
+
+
+@dataclass(slots=True)
 class AuctionEvent:
-    type: str
-    payload: Dict = field(init=False)  # popolato in __post_init__ dai figli
+    type: ClassVar[str] = "auction_event"
+
+    @property
+    def payload(self) -> Dict:
+        return self._payload()
+
+    def _payload(self) -> Dict:
+        return {}
+
+
+@dataclass(slots=True)
+class AuctionCreated(AuctionEvent):
+    auction_id: str
+    name: str
+    max_teams: int
+    options: Dict
+    type: ClassVar[str] = "auction_created"
+
+    def _payload(self) -> Dict:
+        return {"auction_id": self.auction_id, "name": self.name, "max_teams": self.max_teams}
+
+
+@dataclass(slots=True)
+class PlayersAdded(AuctionEvent):
+    players: List  # [player_id, name, ruolo, squadra reale]
+    type: ClassVar[str] = "players_added"
+
+    def _payload(self) -> Dict:
+        return {"count": len(self.players)}
 
 
-@dataclass
+@dataclass(slots=True)
 class AuctionStarted(AuctionEvent):
     auction_id: str
-    type: str = field(init=False, default="auction_started")
+    type: ClassVar[str] = "auction_started"
 
-    def __post_init__(self):
-        self.payload = {"auction_id": self.auction_id}
+    def _payload(self) -> Dict:
+        return {"auction_id": self.auction_id}
 
 
-@dataclass
+@dataclass(slots=True)
 class CallerChanged(AuctionEvent):
     caller_id: str
     caller_name: str
-    type: str = field(init=False, default="caller_changed")
+    type: ClassVar[str] = "caller_changed"
 
-    def __post_init__(self):
-        self.payload = {"caller_id": self.caller_id, "caller_name": self.caller_name}
+    def _payload(self) -> Dict:
+        return {"caller_id": self.caller_id, "caller_name": self.caller_name}
 
-@dataclass
+@dataclass(slots=True)
 class ParticipantJoined(AuctionEvent):
     participant_id: int
     name: str
-    type: str = field(init=False, default="participant_joined")
+    type: ClassVar[str] = "participant_joined"
 
-    def __post_init__(self):
-        self.payload = {"id": self.participant_id, "name": self.name}
+    def _payload(self) -> Dict:
+        return {"id": self.participant_id, "name": self.name}
 
 
-@dataclass
+@dataclass(slots=True)
+class ParticipantAssigned(AuctionEvent):
+    participant_id: str
+    team_id: int
+    type: ClassVar[str] = "participant_assigned"
+
+    def _payload(self) -> Dict:
+        return {"participant_id": self.participant_id, "team_id": self.team_id}
+
+
+@dataclass(slots=True)
+class ParticipantLeft(AuctionEvent):
+    participant_id: str
+    type: ClassVar[str] = "participant_left"
+
+    def _payload(self) -> Dict:
+        return {"participant_id": self.participant_id}
+
+
+@dataclass(slots=True)
 class TurnStarted(AuctionEvent):
     turn_number: int
     caller_id: int
     caller_name: str
-    type: str = field(init=False, default="turn_started")
+    type: ClassVar[str] = "turn_started"
 
-    def __post_init__(self):
-        self.payload = {"caller_name": self.caller_name, "turn_number": self.turn_number, "caller_id": self.caller_id}
+    def _payload(self) -> Dict:
+        return {"caller_name": self.caller_name, "turn_number": self.turn_number, "caller_id": self.caller_id}
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerCalled(AuctionEvent):
     player_id: int
     player_name: str
     role: str
-    type: str = field(init=False, default="player_called")
+    caller_id: Optional[str] = None
+    type: ClassVar[str] = "player_called"
 
-    def __post_init__(self):
-        self.payload = {
+    def _payload(self) -> Dict:
+        return {
             "player_id": self.player_id,
             "player": self.player_name,
             "role": self.role,
+            "caller_id": self.caller_id,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BidPlaced(AuctionEvent):
     team_id: int
     team_name: str
     amount: float
-    type: str = field(init=False, default="bid_placed")
+    type: ClassVar[str] = "bid_placed"
 
-    def __post_init__(self):
-        self.payload = {
+    def _payload(self) -> Dict:
+        return {
             "team_id": self.team_id,
             "team": self.team_name,
             "amount": self.amount,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerAssigned(AuctionEvent):
     team_id: str
     team_name: str
     player_id: str
     player_name: str
-    type: str = field(init=False, default="player_assigned")
+    price: float = 0
+    type: ClassVar[str] = "player_assigned"
 
-    def __post_init__(self):
-        self.payload = {
+    def _payload(self) -> Dict:
+        return {
             "team_id": self.team_id,
             "team": self.team_name,
             "player_id": self.player_id,
             "player": self.player_name,
+            "price": self.price,
         }
+
+
+@dataclass(slots=True)
+class AuctionFinished(AuctionEvent):
+    auction_id: str
+    reason: Optional[str] = None
+    type: ClassVar[str] = "auction_finished"
+
+    def _payload(self) -> Dict:
+        return {"auction_id": self.auction_id, "reason": self.reason}
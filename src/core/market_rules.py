@@ -1,43 +1,47 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
+from core.ownership_policies import OwnershipPolicy
+from core.ownership_store import OwnershipStore
 from core.player import Player
 from core.team import Team
 
 class MarketRule(ABC):
-    @abstractmethod
+    # copie massime di un giocatore fra tutte le squadre
+    max_copies = 1
+
+    def __init__(self, store: Optional[OwnershipStore] = None):
+        # lo store dell'asta, condiviso con pool e policy; senza, la regola ne tiene
+        # uno proprio e register_assignment ne è l'unico scrittore (es. la simulazione)
+        self.store = store if store is not None else OwnershipStore()
+
     def is_available(self, player: Player) -> bool:
         """C'è ancora disponibilità globale del player?"""
-        ...
+        return self.store.is_available(player.player_id, self.max_copies)
 
-    @abstractmethod
     def register_assignment(self, team: Team, player: Player) -> None:
-        ...
+        self.store.register(team.id, player.player_id)
 
     # helper per pool/bidding
-    def available_for_any_team(self, player: Player, teams: List[Team]) -> bool:
-        if not self.is_available(player):
-            return False
-        # delega all’ownership per-team
-        return any(t.ownership_policy.can_own(t, player) for t in teams)
+    def available_for_any_team(self, player: Player, teams: List[Team], policy: Optional[OwnershipPolicy] = None) -> bool:
+        max_per_team = policy.max_copies_per_player if policy is not None else OwnershipPolicy.max_copies_per_player
+        return self.store.available_for_any_team(player.player_id, [t.id for t in teams], self.max_copies, max_per_team)
+
+    def available_players(self, players: List[Player], teams: List[Team], policy: Optional[OwnershipPolicy] = None) -> List[Player]:
+        """Forma bulk di available_for_any_team: filtra tutto il pool con una maschera."""
+        if not teams:
+            return []
+        store = self.store
+        max_per_team = policy.max_copies_per_player if policy is not None else OwnershipPolicy.max_copies_per_player
+        mask = store.available_for_any_team_mask([t.id for t in teams], self.max_copies, max_per_team)
+        selected = set(store.player_ids(mask))
+        # un giocatore che lo store non ha mai visto non ha copie assegnate: è disponibile
+        return [p for p in players if p.player_id in selected or p.player_id not in store]
 
 class UniquePlayerMarket(MarketRule):
-    def __init__(self):
-        self.assigned: set[int] = set()
-
-    def is_available(self, player: Player) -> bool:
-        return player.player_id not in self.assigned
-
-    def register_assignment(self, team: Team, player: Player) -> None:
-        self.assigned.add(player.player_id)
+    pass
 
 class MultiCopyMarket(MarketRule):
-    def __init__(self, max_copies: int):
+    def __init__(self, max_copies: int, store: Optional[OwnershipStore] = None):
+        super().__init__(store)
         self.max_copies = max_copies
-        self.counts: dict[int, int] = {}
-
-    def is_available(self, player: Player) -> bool:
-        return self.counts.get(player.player_id, 0) < self.max_copies
-
-    def register_assignment(self, team: Team, player: Player) -> None:
-        self.counts[player.player_id] = self.counts.get(player.player_id, 0) + 1
\ No newline at end of file
@@ -1,13 +1,22 @@
 # auction/core/policies/ownership.py
 from abc import ABC, abstractmethod
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+from core.ownership_store import OwnershipStore
 from core.player import Player
 if TYPE_CHECKING:
     from core.team import Team
 
 class OwnershipPolicy(ABC):
+    # copie massime dello stesso giocatore in una squadra
+    max_copies_per_player = 1
+
+    def __init__(self, store: Optional[OwnershipStore] = None):
+        # con lo store dell'asta (condiviso con pool e MarketRule) il controllo legge
+        # i contatori delle copie; senza, quelli per giocatore della squadra
+        self.store = store
+
     @abstractmethod
     def can_own(self, team: "Team", player: Player) -> bool:
         """Se il team può possedere (ancora) questo giocatore, a prescindere dal prezzo."""
@@ -19,13 +28,18 @@ class OwnershipPolicy(ABC):
 # Nessun clone: massimo 1 per team
 class NoDuplicatesOwnershipPolicy(OwnershipPolicy):
     def can_own(self, team: "Team", player: Player) -> bool:
+        if self.store is not None:
+            return self.store.can_own(team.id, player.player_id)
         return not team.has_player(player)
 
 # Modalità “pazza”: fino a N cloni per team
 class MaxCopiesOwnershipPolicy(OwnershipPolicy):
-    def __init__(self, max_copies_per_player: int):
+    def __init__(self, max_copies_per_player: int, store: Optional[OwnershipStore] = None):
         assert max_copies_per_player >= 1
+        super().__init__(store)
         self.max_copies_per_player = max_copies_per_player
 
     def can_own(self, team: "Team", player: Player) -> bool:
+        if self.store is not None:
+            return self.store.can_own(team.id, player.player_id, self.max_copies_per_player)
         return team.player_count(player) < self.max_copies_per_player
@@ -0,0 +1,159 @@
+"""
+Proprietà dei giocatori condivisa fra regole di mercato, policy e pool.
+
+Ogni giocatore riceve un indice denso (l'ordine in cui viene visto). Per
+l'indice si tengono le copie assegnate in totale (array di interi) e, per
+soglia di copie k, una bitset dei giocatori che ne hanno almeno k: così "è
+ancora disponibile con al massimo N copie" è un test su un bit. Allo stesso
+modo ogni squadra ha, per soglia, la bitset dei giocatori di cui possiede
+almeno k copie. Le forme "bulk" lavorano su tutto il pool con poche
+operazioni fra interi, una per squadra, invece che giocatore per giocatore.
+
+In un'asta lo store è uno solo: il pool vi registra le assegnazioni, regola
+di mercato, policy e motore di idoneità lo leggono.
+"""
+from array import array
+from functools import reduce
+from typing import Dict, Iterable, List, Optional
+
+
+class OwnershipStore:
+    def __init__(self, player_ids: Iterable[int] = ()):
+        self._index: Dict[int, int] = {}  # player_id -> indice denso
+        self._player_ids: List[int] = []
+        self._copies = array("I")  # copie totali per indice
+        # _owned[k - 1]: bitset dei giocatori con almeno k copie in totale
+        self._owned: List[int] = []
+        # team_id -> [bitset dei giocatori con almeno k copie nella squadra, per k = 1..]
+        self._teams: Dict[int, List[int]] = {}
+        # player_id -> {team_id: copie}, in ordine di prima assegnazione; più di una copia solo
+        # con i cloni. Chiave player_id: i controlli singoli non passano dall'indice
+        self._holders: Dict[int, Dict[int, int]] = {}
+        for player_id in player_ids:
+            self.index(player_id)
+
+    def __len__(self) -> int:
+        return len(self._player_ids)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._index
+
+    def index(self, player_id: int) -> int:
+        """Indice denso del giocatore, assegnato alla prima richiesta."""
+        index = self._index.get(player_id)
+        if index is None:
+            index = self._index[player_id] = len(self._player_ids)
+            self._player_ids.append(player_id)
+            self._copies.append(0)
+        return index
+
+    def register(self, team_id: int, player_id: int) -> None:
+        index = self._index.get(player_id)
+        if index is None:
+            index = self.index(player_id)
+        bit = 1 << index
+        copies = self._copies[index] = self._copies[index] + 1
+        owned = self._owned
+        if copies > len(owned):
+            owned.append(0)
+        owned[copies - 1] |= bit
+        holders = self._holders.get(player_id)
+        if holders is None:
+            holders = self._holders[player_id] = {}
+        team_copies = holders[team_id] = holders.get(team_id, 0) + 1
+        masks = self._teams.get(team_id)
+        if masks is None:
+            masks = self._teams[team_id] = []
+        if team_copies > len(masks):
+            masks.append(0)
+        masks[team_copies - 1] |= bit
+
+    # --- singolo giocatore -------------------------------------------------------
+
+    def copies(self, player_id: int) -> int:
+        index = self._index.get(player_id)
+        return 0 if index is None else self._copies[index]
+
+    def team_copies(self, team_id: int, player_id: int) -> int:
+        holders = self._holders.get(player_id)
+        return holders.get(team_id, 0) if holders else 0
+
+    def owners(self, player_id: int, min_copies: int = 1) -> List[int]:
+        """Squadre che possiedono almeno `min_copies` copie del giocatore."""
+        holders = self._holders.get(player_id)
+        if not holders:
+            return []
+        return [team_id for team_id, copies in holders.items() if copies >= min_copies]
+
+    def assignments(self) -> Dict[int, List[int]]:
+        """player_id -> squadre proprietarie, ripetute per ogni copia."""
+        return {
+            player_id: [team_id for team_id, copies in holders.items() for _ in range(copies)]
+            for player_id, holders in self._holders.items()
+        }
+
+    # per un solo giocatore bastano i contatori; le bitset servono alle forme bulk
+
+    def is_available(self, player_id: int, max_copies: int = 1) -> bool:
+        index = self._index.get(player_id)
+        return index is None or self._copies[index] < max_copies
+
+    def can_own(self, team_id: int, player_id: int, max_copies: int = 1) -> bool:
+        holders = self._holders.get(player_id)
+        return not holders or holders.get(team_id, 0) < max_copies
+
+    def can_take(self, team_id: int, player_id: int, max_copies: Optional[int] = 1, max_per_team: int = 1) -> bool:
+        """is_available e can_own insieme; max_copies None: nessun limite totale."""
+        holders = self._holders.get(player_id)
+        if not holders:
+            return True  # caso comune durante l'asta: nessuna copia assegnata
+        if max_copies is not None and self._copies[self._index[player_id]] >= max_copies:
+            return False
+        return holders.get(team_id, 0) < max_per_team
+
+    def available_for_any_team(self, player_id: int, team_ids: Iterable[int], max_copies: int = 1, max_per_team: int = 1) -> bool:
+        holders = self._holders.get(player_id)
+        if not holders:
+            return any(True for _ in team_ids)
+        if self._copies[self._index[player_id]] >= max_copies:
+            return False
+        return any(holders.get(team_id, 0) < max_per_team for team_id in team_ids)
+
+    # --- maschere (bulk) ---------------------------------------------------------
+
+    @property
+    def universe(self) -> int:
+        return (1 << len(self._player_ids)) - 1
+
+    def owned_mask(self, min_copies: int = 1) -> int:
+        """Giocatori con almeno `min_copies` copie assegnate in totale."""
+        return self._owned[min_copies - 1] if min_copies <= len(self._owned) else 0
+
+    def team_mask(self, team_id: int, min_copies: int = 1) -> int:
+        masks = self._teams.get(team_id)
+        return masks[min_copies - 1] if masks and min_copies <= len(masks) else 0
+
+    def available_mask(self, max_copies: int = 1) -> int:
+        return self.universe & ~self.owned_mask(max_copies)
+
+    def available_for_any_team_mask(self, team_ids: Iterable[int], max_copies: int = 1, max_per_team: int = 1) -> int:
+        """Giocatori disponibili che almeno una delle squadre può ancora prendere."""
+        team_ids = list(team_ids)
+        if not team_ids:
+            return 0
+        # posseduti al limite da tutte le squadre: nessuna può prenderli
+        full = reduce(int.__and__, (self.team_mask(team_id, max_per_team) for team_id in team_ids))
+        return self.available_mask(max_copies) & ~full
+
+    def mask_of(self, player_ids: Iterable[int]) -> int:
+        mask = 0
+        for player_id in player_ids:
+            mask |= 1 << self.index(player_id)
+        return mask
+
+    def player_ids(self, mask: int) -> List[int]:
+        """player_id dei bit accesi, in ordine di indice."""
+        ids = self._player_ids
+        # la stringa binaria letta dal bit meno significativo: un solo passaggio sulla maschera
+        return [ids[i] for i, bit in enumerate(bin(mask)[:1:-1]) if bit == "1"]
+
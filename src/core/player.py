@@ -1,6 +1,8 @@
 from .enums import PlayerRole
 
 class Player:
+    __slots__ = ("player_id", "name", "role", "realTeam")
+
     def __init__(self, player_id: int, name: str, role: PlayerRole, realTeam: str):
         self.player_id = player_id
         self.name = name
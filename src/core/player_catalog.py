@@ -0,0 +1,153 @@
+# core/player_catalog.py
+from array import array
+from bisect import bisect_left
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.enums import PlayerRole
+from core.player import Player
+
+# codice compatto (1 byte) <-> PlayerRole
+_ROLES_BY_CODE: Dict[int, PlayerRole] = {role.value: role for role in PlayerRole}
+
+
+class CatalogPlayer:
+    """
+    Vista leggera su una riga del PlayerCatalog.
+    Espone gli stessi attributi di Player, ma legge i dati dalle colonne del catalogo.
+    """
+
+    __slots__ = ("_catalog", "_row")
+
+    def __init__(self, catalog: "PlayerCatalog", row: int):
+        self._catalog = catalog
+        self._row = row
+
+    @property
+    def player_id(self) -> int:
+        return self._catalog.ids[self._row]
+
+    @property
+    def name(self) -> str:
+        return self._catalog.names[self._row]
+
+    @property
+    def role(self) -> PlayerRole:
+        return _ROLES_BY_CODE[self._catalog.role_codes[self._row]]
+
+    @property
+    def realTeam(self) -> str:
+        return self._catalog.real_teams[self._catalog.real_team_codes[self._row]]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CatalogPlayer):
+            return self._catalog is other._catalog and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._catalog), self._row))
+
+    def __repr__(self):
+        return f"<Player {self.player_id}: {self.name} ({self.role.name})>"
+
+
+class PlayerCatalog:
+    """
+    Catalogo colonnare dei giocatori, condivisibile tra più aste.
+    Ogni giocatore occupa una riga: id, codice ruolo e indice della squadra reale
+    stanno in array compatti, i nomi in una tabella separata e le squadre reali
+    sono internate (una sola stringa per squadra).
+    """
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.role_codes = array("B")
+        self.real_team_codes = array("I")
+        self.names: List[str] = []
+        self.real_teams: List[str] = []
+        self._real_team_index: Dict[str, int] = {}
+        # finché gli id arrivano in ordine crescente (il caso dei listoni) la ricerca
+        # per id è una bisezione sulla colonna; altrimenti si costruisce un indice
+        self._ids_sorted = True
+        self._rows: Optional[Dict[int, int]] = None  # player_id -> riga
+
+    @classmethod
+    def from_players(cls, players: Iterable[Player]) -> "PlayerCatalog":
+        catalog = cls()
+        catalog.extend((p.player_id, p.name, p.role, p.realTeam) for p in players)
+        return catalog
+
+    def add(self, player_id: int, name: str, role: PlayerRole, real_team: str) -> CatalogPlayer:
+        if not self._ids_sorted or (self.ids and player_id <= self.ids[-1]):
+            if player_id in self:
+                raise ValueError(f"Duplicate player id: {player_id}")
+            self._ids_sorted = False
+        team_code = self._real_team_index.get(real_team)
+        if team_code is None:
+            team_code = len(self.real_teams)
+            self._real_team_index[real_team] = team_code
+            self.real_teams.append(real_team)
+
+        row = len(self.names)
+        self.ids.append(player_id)
+        self.role_codes.append(role.value)
+        self.real_team_codes.append(team_code)
+        self.names.append(name)
+        if self._rows is not None:
+            self._rows[player_id] = row
+        return CatalogPlayer(self, row)
+
+    def extend(self, rows: Iterable[Tuple[int, str, PlayerRole, str]]) -> None:
+        for player_id, name, role, real_team in rows:
+            self.add(player_id, name, role, real_team)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[CatalogPlayer]:
+        return (CatalogPlayer(self, row) for row in range(len(self.names)))
+
+    def __contains__(self, player_id: int) -> bool:
+        return self._row_of(player_id) is not None
+
+    def get(self, player_id: int) -> Optional[CatalogPlayer]:
+        row = self._row_of(player_id)
+        return CatalogPlayer(self, row) if row is not None else None
+
+    def _row_of(self, player_id: int) -> Optional[int]:
+        if self._ids_sorted:
+            row = bisect_left(self.ids, player_id)
+            if row < len(self.ids) and self.ids[row] == player_id:
+                return row
+            return None
+        if self._rows is None:
+            self._rows = {pid: row for row, pid in enumerate(self.ids)}
+        return self._rows.get(player_id)
+
+    def players(self) -> List[CatalogPlayer]:
+        """Viste su tutte le righe, pronte per PlayerPool.add_players."""
+        return [CatalogPlayer(self, row) for row in range(len(self.names))]
+
+    # --- filtri per colonna (il confronto gira in C, senza oggetti Player) ---
+
+    def rows_by_role(self, role: PlayerRole) -> List[int]:
+        return list(compress(range(len(self.names)), map(role.value.__eq__, self.role_codes)))
+
+    def rows_by_real_team(self, real_team: str) -> List[int]:
+        team_code = self._real_team_index.get(real_team)
+        if team_code is None:
+            return []
+        return list(compress(range(len(self.names)), map(team_code.__eq__, self.real_team_codes)))
+
+    def filter(self, role: Optional[PlayerRole] = None, real_team: Optional[str] = None) -> List[CatalogPlayer]:
+        if role is None and real_team is None:
+            return self.players()
+        if real_team is None:
+            rows = self.rows_by_role(role)
+        elif role is None:
+            rows = self.rows_by_real_team(real_team)
+        else:
+            role_rows = self.rows_by_role(role)
+            team_code = self._real_team_index.get(real_team)
+            rows = [r for r in role_rows if self.real_team_codes[r] == team_code]
+        return [CatalogPlayer(self, row) for row in rows]
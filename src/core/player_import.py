@@ -0,0 +1,328 @@
+# core/player_import.py
+import csv
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple
+
+from core.enums import PlayerRole
+from core.player import Player
+from core.player_catalog import PlayerCatalog
+from core.player_pool import PlayerPool
+
+# alias dei ruoli: quelli di PlayerRole (P/D/C/A, Pt, Cc, ...) più i nomi estesi
+ROLE_ALIASES: Dict[str, PlayerRole] = {
+    **{alias.lower(): role for alias, role in PlayerRole.__members__.items()},
+    "portiere": PlayerRole.GOALKEEPER,
+    "difensore": PlayerRole.DEFENDER,
+    "centrocampista": PlayerRole.MIDFIELDER,
+    "attaccante": PlayerRole.FORWARD,
+}
+
+# intestazioni accettate per ciascuna colonna
+FIELD_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "player_id": ("player_id", "id", "cod", "codice"),
+    "name": ("name", "nome"),
+    "role": ("role", "ruolo", "r"),
+    "real_team": ("real_team", "realteam", "team", "squadra"),
+}
+_FIELD_BY_ALIAS: Dict[str, str] = {
+    alias: field_name for field_name, aliases in FIELD_ALIASES.items() for alias in aliases
+}
+
+# (numero riga, id, nome, ruolo, squadra reale) ancora da validare
+RawRow = Tuple[int, object, object, object, object]
+
+# un record incompleto in attesa del pezzo successivo non può superare questa
+# dimensione: un apice o una graffa mai chiusi non devono bufferizzare tutto l'upload
+MAX_RECORD_CHARS = 64 * 1024
+
+
+class PlayerImportError(ValueError):
+    """Errore di formato che impedisce di proseguire con l'import."""
+
+
+def parse_role(value: object) -> PlayerRole:
+    if isinstance(value, PlayerRole):
+        return value
+    role = ROLE_ALIASES.get(str(value).strip().lower())
+    if role is None:
+        raise ValueError(f"unknown role {value!r}")
+    return role
+
+
+class PlayerRowReader(ABC):
+    """Trasforma il testo ricevuto a pezzi in righe grezze, senza tenere l'intero file in memoria."""
+
+    @abstractmethod
+    def feed(self, text: str) -> List[RawRow]:
+        """Consuma un pezzo di testo e restituisce le righe complete trovate."""
+        ...
+
+    @abstractmethod
+    def close(self) -> List[RawRow]:
+        """Segnala la fine dello stream e restituisce le righe rimaste."""
+        ...
+
+
+class CsvRowReader(PlayerRowReader):
+    """CSV con intestazione; il separatore (',', ';' o tab) è dedotto dall'intestazione."""
+
+    def __init__(self, delimiter: Optional[str] = None):
+        self.delimiter = delimiter
+        self._buffer = ""  # record non ancora terminato (riga spezzata o campo quotato aperto)
+        self._columns: Optional[Tuple[int, int, int, int]] = None
+        self._line_no = 0
+
+    def feed(self, text: str) -> List[RawRow]:
+        return self._parse(self._records(text))
+
+    def close(self) -> List[RawRow]:
+        records = [self._buffer] if self._buffer.strip() else []
+        self._buffer = ""
+        rows = self._parse(records)
+        if self._columns is None:
+            raise PlayerImportError("Missing CSV header")
+        return rows
+
+    def _records(self, text: str) -> List[str]:
+        """
+        Record completi contenuti nel testo: un "\n" chiude il record solo se gli
+        apici sono bilanciati, così un campo quotato può contenere degli a capo.
+        """
+        records: List[str] = []
+        pending = self._buffer
+        for line in text.splitlines(keepends=True):
+            pending += line
+            if pending.endswith("\n") and pending.count('"') % 2 == 0:
+                records.append(pending)
+                pending = ""
+        if len(pending) > MAX_RECORD_CHARS:
+            raise PlayerImportError(f"Record too large at row {self._line_no + len(records) + 1}")
+        self._buffer = pending
+        return records
+
+    def _parse(self, records: List[str]) -> List[RawRow]:
+        if not records:
+            return []
+        if self._columns is None:
+            header = records.pop(0).lstrip("\ufeff").rstrip("\r\n")
+            self._line_no += 1
+            self._read_header(header)
+        rows: List[RawRow] = []
+        id_col, name_col, role_col, team_col = self._columns
+        width = max(self._columns) + 1
+        for values in csv.reader(records, delimiter=self.delimiter):
+            self._line_no += 1
+            if not values:
+                continue
+            if len(values) < width:
+                rows.append((self._line_no, None, None, None, None))
+                continue
+            rows.append((self._line_no, values[id_col], values[name_col], values[role_col], values[team_col]))
+        return rows
+
+    def _read_header(self, header: str) -> None:
+        if self.delimiter is None:
+            self.delimiter = max((";", ",", "\t"), key=header.count)
+        names = next(csv.reader([header], delimiter=self.delimiter))
+        positions: Dict[str, int] = {}
+        for index, name in enumerate(names):
+            field_name = _FIELD_BY_ALIAS.get(name.strip().lower())
+            if field_name and field_name not in positions:
+                positions[field_name] = index
+        missing = [f for f in FIELD_ALIASES if f not in positions]
+        if missing:
+            raise PlayerImportError(f"Missing CSV columns: {', '.join(missing)}")
+        self._columns = (
+            positions["player_id"],
+            positions["name"],
+            positions["role"],
+            positions["real_team"],
+        )
+
+
+class JsonRowReader(PlayerRowReader):
+    """Array JSON di oggetti oppure JSON Lines (un oggetto per riga)."""
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        self._is_array = False
+        self._count = 0
+
+    def feed(self, text: str) -> List[RawRow]:
+        self._buffer += text
+        return self._drain(final=False)
+
+    def close(self) -> List[RawRow]:
+        rows = self._drain(final=True)
+        if self._buffer.strip() or (self._is_array and not self._finished):
+            raise PlayerImportError("Truncated JSON document")
+        return rows
+
+    def _drain(self, final: bool) -> List[RawRow]:
+        rows: List[RawRow] = []
+        buffer = self._buffer
+        pos = 0
+        length = len(buffer)
+        while pos < length and not self._finished:
+            char = buffer[pos]
+            if char in " \t\r\n,":
+                pos += 1
+                continue
+            if not self._started:
+                self._started = True
+                self._is_array = char == "["
+                if self._is_array:
+                    pos += 1
+                    continue
+            if self._is_array and char == "]":
+                self._finished = True
+                pos += 1
+                break
+            if char != "{":
+                raise PlayerImportError(f"Expected a JSON object at item {self._count + 1}")
+            try:
+                obj, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise PlayerImportError(f"Invalid JSON at item {self._count + 1}")
+                if length - pos > MAX_RECORD_CHARS:
+                    # non è un oggetto incompleto ma uno malformato (o enorme)
+                    raise PlayerImportError(f"Invalid JSON at item {self._count + 1}")
+                break  # oggetto incompleto: aspetta il prossimo pezzo
+            pos = end
+            self._count += 1
+            rows.append(self._to_row(obj))
+        self._buffer = buffer[pos:]
+        return rows
+
+    def _to_row(self, obj: dict) -> RawRow:
+        values: Dict[str, object] = {}
+        for key, value in obj.items():
+            field_name = _FIELD_BY_ALIAS.get(key.lower())
+            if field_name and field_name not in values:
+                values[field_name] = value
+        return (
+            self._count,
+            values.get("player_id"),
+            values.get("name"),
+            values.get("role"),
+            values.get("real_team"),
+        )
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    rejected: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {"imported": self.imported, "rejected": self.rejected, "errors": self.errors}
+
+
+class PlayerImporter:
+    """
+    Valida le righe prodotte da un PlayerRowReader e le inserisce nel pool a blocchi
+    di chunk_size giocatori. Se viene passato un PlayerCatalog, i giocatori sono
+    aggiunti al catalogo e nel pool finiscono le viste.
+    """
+
+    def __init__(
+        self,
+        pool: PlayerPool,
+        reader: PlayerRowReader,
+        chunk_size: int = 1000,
+        max_errors: int = 100,
+        catalog: Optional[PlayerCatalog] = None,
+    ):
+        self.pool = pool
+        self.reader = reader
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.catalog = catalog
+        self.report = ImportReport()
+        self._batch: List[Player] = []
+        self._batch_ids: Set[int] = set()
+
+    def feed(self, text: str) -> None:
+        self._consume(self.reader.feed(text))
+
+    def close(self) -> ImportReport:
+        self._consume(self.reader.close())
+        self._flush()
+        return self.report
+
+    def _consume(self, rows: Iterable[RawRow]) -> None:
+        for row in rows:
+            try:
+                player = self._to_player(row)
+            except ValueError as exc:
+                self._reject(row[0], str(exc))
+                continue
+            self._batch.append(player)
+            self._batch_ids.add(player.player_id)
+            if len(self._batch) >= self.chunk_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._batch:
+            return
+        self.pool.add_players(self._batch)
+        self.report.imported += len(self._batch)
+        self._batch = []
+        self._batch_ids = set()
+
+    def _to_player(self, row: RawRow) -> Player:
+        _, raw_id, raw_name, raw_role, raw_team = row
+        if raw_id is None or raw_name is None or raw_role is None:
+            raise ValueError("missing fields")
+        try:
+            player_id = int(raw_id)
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid id {raw_id!r}")
+        name = str(raw_name).strip()
+        if not name:
+            raise ValueError("empty name")
+        role = parse_role(raw_role)
+        real_team = str(raw_team).strip() if raw_team is not None else ""
+        if player_id in self._batch_ids or self.pool.get(player_id) is not None:
+            raise ValueError(f"duplicate id {player_id}")
+        if self.catalog is not None:
+            return self.catalog.add(player_id, name, role, real_team)
+        return Player(player_id, name, role, real_team)
+
+    def _reject(self, line_no: int, reason: str) -> None:
+        self.report.rejected += 1
+        if len(self.report.errors) < self.max_errors:
+            self.report.errors.append(f"row {line_no}: {reason}")
+
+
+def make_reader(fmt: str) -> PlayerRowReader:
+    if fmt == "csv":
+        return CsvRowReader()
+    if fmt in ("json", "jsonl"):
+        return JsonRowReader()
+    raise PlayerImportError(f"Unsupported format: {fmt}")
+
+
+def import_players(
+    pool: PlayerPool,
+    stream: TextIO,
+    fmt: str = "csv",
+    chunk_size: int = 1000,
+    read_size: int = 64 * 1024,
+    catalog: Optional[PlayerCatalog] = None,
+) -> ImportReport:
+    """Importa un listone da un file di testo leggendolo a blocchi di read_size caratteri."""
+    importer = PlayerImporter(pool, make_reader(fmt), chunk_size=chunk_size, catalog=catalog)
+    while True:
+        text = stream.read(read_size)
+        if not text:
+            break
+        importer.feed(text)
+    return importer.close()
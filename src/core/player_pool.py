@@ -1,54 +1,153 @@
 # core/player_pool.py
-from typing import List, Optional
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from core.ownership_store import OwnershipStore
 from core.player import Player, PlayerRole
+from core.player_search import PlayerSearchIndex, SearchPage
 from core.team import Team
 
 
 class PlayerPool:
-    def __init__(self, players: Optional[List[Player]] = None, allow_duplicates: bool = False):
-        self.players: List[Player] = players or []
+    JOURNAL_SIZE = 4096
+
+    def __init__(self, players: Optional[List[Player]] = None, allow_duplicates: bool = False, store: Optional[OwnershipStore] = None):
+        self.players: List[Player] = []
         self.allow_duplicates = allow_duplicates
-        self.assigned_players: dict[int, List[int]] = {}  # player_id -> [team_id]
+        # unica fonte delle assegnazioni (copie e squadre proprietarie, vedi core.ownership_store);
+        # passandolo, regola di mercato e policy della stessa asta leggono lo stesso stato
+        self.ownership = store if store is not None else OwnershipStore()
+
+        # indici mantenuti incrementalmente (add_player / assign_to_team)
+        self._by_id: Dict[int, Player] = {}
+        self._available: Dict[int, Player] = {}  # player_id -> Player, in ordine di inserimento
+        self._by_role: Dict[PlayerRole, List[Player]] = {}
+        self._available_by_role: Dict[PlayerRole, Dict[int, Player]] = {}
+        self._by_real_team: Dict[str, List[Player]] = {}
+        self._team_players: Dict[int, List[Player]] = {}  # team_id -> [Player]
+        # indice di ricerca per nome: costruito alla prima ricerca, poi aggiornato da add_player
+        self._search_index: Optional[PlayerSearchIndex] = None
+
+        # versione della disponibilità: cresce quando un giocatore entra o esce dai
+        # disponibili; il journal permette ai client di ricevere solo le differenze
+        self.version = 0
+        self._journal: Deque[Tuple[int, bool, int]] = deque(maxlen=self.JOURNAL_SIZE)  # (versione, aggiunto?, player_id)
+
+        if players:
+            self.add_players(players)
 
     def add_player(self, player: Player):
         self.players.append(player)
+        self._by_id[player.player_id] = player
+        self.ownership.index(player.player_id)
+        if self._search_index is not None:
+            self._search_index.add(player)
+        self._by_role.setdefault(player.role, []).append(player)
+        self._by_real_team.setdefault(player.realTeam, []).append(player)
+        if self.allow_duplicates or not self.ownership.copies(player.player_id):
+            self._available[player.player_id] = player
+            self._available_by_role.setdefault(player.role, {})[player.player_id] = player
+            self._record(True, player.player_id)
 
     def add_players(self, players: List[Player]):
-        self.players.extend(players)
+        for player in players:
+            self.add_player(player)
+
+    @property
+    def assigned_players(self) -> Dict[int, List[int]]:
+        """player_id -> [team_id], una voce per copia; vista calcolata dallo store."""
+        return self.ownership.assignments()
+
+    def get(self, player_id: int) -> Optional[Player]:
+        return self._by_id.get(player_id)
 
     def get_all(self) -> List[Player]:
         return list(self.players)
 
     def get_by_role(self, role: PlayerRole) -> List[Player]:
-        return [p for p in self.players if p.role == role]
+        return list(self._by_role.get(role, ()))
+
+    def get_by_real_team(self, real_team: str) -> List[Player]:
+        return list(self._by_real_team.get(real_team, ()))
 
     def get_available(self) -> List[Player]:
         """Ritorna i giocatori non ancora assegnati, o gestiti con duplicati se permesso."""
         if self.allow_duplicates:
-            return self.players
-        else:
-            return [p for p in self.players if p.player_id not in self.assigned_players]
+            return list(self.players)
+        return list(self._available.values())
 
-    def assign_to_team(self, player: Player, team: Team, price:Optional[float]=None) -> bool:
-        """Tenta di assegnare un giocatore a un team. Ritorna True se l’assegnazione va a buon fine."""
-        if not self.allow_duplicates and player.player_id in self.assigned_players:
-            return False
+    def get_available_by_role(self, role: PlayerRole) -> List[Player]:
+        return list(self._available_by_role.get(role, {}).values())
 
-        if player.player_id not in self.assigned_players:
-            self.assigned_players[player.player_id] = []
+    def available_count(self) -> int:
+        return len(self.players) if self.allow_duplicates else len(self._available)
 
-        # evita che lo stesso team abbia due volte lo stesso giocatore
-        if team.id in self.assigned_players[player.player_id]:
+    def is_available(self, player: Player) -> bool:
+        return player.player_id in self._available
+
+    def get_team_players(self, team_id: int) -> List[Player]:
+        return list(self._team_players.get(team_id, ()))
+
+    def assign_to_team(self, player: Player, team: Team, price:Optional[float]=None) -> bool:
+        """Tenta di assegnare un giocatore a un team. Ritorna True se l’assegnazione va a buon fine."""
+        # senza duplicati basta una copia in totale; con i duplicati una per squadra
+        if not self.ownership.can_take(team.id, player.player_id, None if self.allow_duplicates else 1):
             return False
 
-        self.assigned_players[player.player_id].append(team.id)
+        self.ownership.register(team.id, player.player_id)
+        self._team_players.setdefault(team.id, []).append(player)
+        if not self.allow_duplicates:
+            self._available.pop(player.player_id, None)
+            self._available_by_role.get(player.role, {}).pop(player.player_id, None)
+            self._record(False, player.player_id)
         team.add_player(player, price if price is not None else 0)
         return True
 
+    def _record(self, added: bool, player_id: int) -> None:
+        self.version += 1
+        self._journal.append((self.version, added, player_id))
+
+    def changes_since(self, version: int) -> Optional[Tuple[List[int], List[int]]]:
+        """
+        Giocatori aggiunti e rimossi dai disponibili dopo la versione indicata.
+        Ritorna None se il journal non copre più quella versione: serve il pool completo.
+        """
+        if version > self.version:
+            return None
+        if version < self.version and (not self._journal or self._journal[0][0] > version + 1):
+            return None
+        added: Dict[int, None] = {}
+        removed: Dict[int, None] = {}
+        for entry_version, was_added, player_id in reversed(self._journal):
+            if entry_version <= version:
+                break
+            # vince l'ultima modifica di ciascun giocatore
+            if player_id in added or player_id in removed:
+                continue
+            if was_added:
+                added[player_id] = None
+            else:
+                removed[player_id] = None
+        return list(reversed(added)), list(reversed(removed))
+
+    def search(
+        self,
+        query: str = "",
+        role: Optional[PlayerRole] = None,
+        real_team: Optional[str] = None,
+        available: Optional[bool] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> SearchPage:
+        """Ricerca per nome con filtri; available=None non filtra per disponibilità."""
+        if self._search_index is None:
+            self._search_index = PlayerSearchIndex()
+            for player in self.players:
+                self._search_index.add(player)
+        is_available = None
+        if available is not None:
+            is_available = self.is_available if available else (lambda p: not self.is_available(p))
+        return self._search_index.search(query, role, real_team, is_available, limit, cursor)
+
     def is_available_for_team(self, player: Player, team: Team) -> bool:
         """Controlla se un player può essere assegnato al team (regole duplicate incluse)."""
-        if not self.allow_duplicates and player.player_id in self.assigned_players:
-            return False
-        if player.player_id in self.assigned_players and team.id in self.assigned_players[player.player_id]:
-            return False
-        return True
+        return self.ownership.can_take(team.id, player.player_id, None if self.allow_duplicates else 1)
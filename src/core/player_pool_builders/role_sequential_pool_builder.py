@@ -1,28 +1,35 @@
-from typing import List
+from typing import List, Optional
+from core.eligibility import EligibilityEngine
 from core.enums import PlayerRole
 from core.player_pool_builders.base import PlayerPoolBuilder
 from core.team_building_strategies.base import TeamBuildingStrategy
 
 
 class RoleSequentialPoolBuilder(PlayerPoolBuilder):
-    def __init__(self, role_order: list[PlayerRole], team_building: TeamBuildingStrategy):
+    def __init__(
+        self,
+        role_order: list[PlayerRole],
+        team_building: TeamBuildingStrategy,
+        eligibility: Optional[EligibilityEngine] = None,
+    ):
         self.role_order = role_order
         self.current_role_index = 0
         self.team_building = team_building
+        # se presente, l'idoneità per ruolo si legge dalle maschere del motore
+        self.eligibility = eligibility
 
-    def build_pool(self, all_players, teams):
-        role = self.role_order[self.current_role_index]
-        candidates = [p for p in all_players if p.role == role]
-
-        # escludi giocatori che nessun team potrebbe assegnarsi
-        valid = [
-            p for p in candidates
-            if any(self.team_building.can_assign(t, p, 1) for t in teams)
-        ]
+    def _role_is_open(self, role: PlayerRole, candidates, teams) -> bool:
+        if self.eligibility is not None:
+            return bool(self.eligibility.role_mask(role))
+        # can_assign dipende dal ruolo, non dal singolo giocatore: basta provarlo su uno
+        return any(self.team_building.can_assign(t, candidates[0], 1) for t in teams)
 
-        if not valid:
-            # passa al ruolo successivo
+    def build_pool(self, all_players, teams):
+        # passa al ruolo successivo finché nessun team può assegnarsi quello corrente
+        while self.current_role_index < len(self.role_order):
+            role = self.role_order[self.current_role_index]
+            candidates = [p for p in all_players if p.role == role]
+            if candidates and self._role_is_open(role, candidates, teams):
+                return candidates
             self.current_role_index += 1
-            return self.build_pool(all_players, teams)
-
-        return valid
+        return []
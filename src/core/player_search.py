@@ -0,0 +1,181 @@
+# core/player_search.py
+"""
+Indice di ricerca per nome sui giocatori di un PlayerPool.
+
+I nomi sono normalizzati (minuscole, senza accenti né punteggiatura):
+"R. Leão" diventa "r leao". Ogni parola del nome sta in una lista ordinata
+per la ricerca per prefisso (bisezione), l'intero nome in un indice di
+trigrammi per le sottostringhe ("rella" trova "Barella"). Ruolo e squadra
+reale sono insiemi di id per filtro; la disponibilità si legge dal pool al
+momento della query, quindi le assegnazioni non toccano l'indice. Aggiungere
+un giocatore aggiorna l'indice in modo incrementale (le parole nuove vengono
+ordinate alla ricerca successiva).
+
+I risultati sono ordinati per (rilevanza, nome, id) e paginati con un
+cursore opaco che contiene la chiave dell'ultimo elemento restituito: le
+pagine successive restano coerenti anche se nel frattempo il pool cambia.
+"""
+import base64
+import json
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from core.enums import PlayerRole
+from core.player import Player
+
+# rilevanza: nome che inizia con la query, parole che iniziano con le parole
+# della query, sottostringa qualsiasi
+RANK_NAME_PREFIX = 0
+RANK_WORD_PREFIX = 1
+RANK_SUBSTRING = 2
+
+SortKey = Tuple[int, str, int]
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    ascii_text = "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+    return " ".join(_NON_ALNUM.sub(" ", ascii_text).split())
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class InvalidCursor(ValueError):
+    """Cursore di paginazione non valido."""
+
+
+def encode_cursor(key: SortKey) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key), separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        rank, name, player_id = json.loads(raw)
+        return int(rank), str(name), int(player_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+
+
+@dataclass
+class SearchPage:
+    players: List[Player]
+    next_cursor: Optional[str]
+
+
+class PlayerSearchIndex:
+    def __init__(self):
+        self._players: Dict[int, Player] = {}
+        self._names: Dict[int, str] = {}  # player_id -> nome normalizzato
+        self._words: List[Tuple[str, int]] = []  # (parola, player_id), ordinata alla prima ricerca
+        self._words_sorted = True
+        self._trigrams: Dict[str, Set[int]] = {}
+        self._by_role: Dict[PlayerRole, Set[int]] = {}
+        self._by_real_team: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def add(self, player: Player) -> None:
+        player_id = player.player_id
+        if player_id in self._players:
+            return
+        name = normalize(player.name)
+        self._players[player_id] = player
+        self._names[player_id] = name
+        # le aggiunte si accodano: un import a blocchi non paga un inserimento ordinato per riga
+        self._words.extend((word, player_id) for word in set(name.split()))
+        self._words_sorted = False
+        for trigram in _trigrams(name):
+            self._trigrams.setdefault(trigram, set()).add(player_id)
+        self._by_role.setdefault(player.role, set()).add(player_id)
+        self._by_real_team.setdefault(normalize(player.realTeam), set()).add(player_id)
+
+    # --- ricerca ---------------------------------------------------------------
+
+    def _word_prefix(self, prefix: str) -> Set[int]:
+        words = self._words
+        if not self._words_sorted:
+            # quasi ordinata dopo poche aggiunte: timsort la riordina in tempo lineare
+            words.sort()
+            self._words_sorted = True
+        start = bisect_left(words, (prefix, -1))
+        ids = set()
+        for i in range(start, len(words)):
+            word, player_id = words[i]
+            if not word.startswith(prefix):
+                break
+            ids.add(player_id)
+        return ids
+
+    def _substring(self, query: str) -> Set[int]:
+        trigrams = _trigrams(query)
+        if not trigrams:
+            return set()
+        sets = sorted((self._trigrams.get(t, set()) for t in trigrams), key=len)
+        candidates = set(sets[0]).intersection(*sets[1:])
+        return {player_id for player_id in candidates if query in self._names[player_id]}
+
+    def _matches(self, query: str) -> Dict[int, int]:
+        """player_id -> rilevanza per la query già normalizzata."""
+        words = query.split()
+        matched = self._word_prefix(words[0])
+        for word in words[1:]:
+            if not matched:
+                break
+            matched &= self._word_prefix(word)
+        ranks = {
+            player_id: RANK_NAME_PREFIX if self._names[player_id].startswith(query) else RANK_WORD_PREFIX
+            for player_id in matched
+        }
+        for player_id in self._substring(query):
+            ranks.setdefault(player_id, RANK_SUBSTRING)
+        return ranks
+
+    def search(
+        self,
+        query: str = "",
+        role: Optional[PlayerRole] = None,
+        real_team: Optional[str] = None,
+        is_available: Optional[Callable[[Player], bool]] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> SearchPage:
+        """
+        Una pagina di risultati. `is_available` filtra per disponibilità (es.
+        PlayerPool.is_available); `cursor` è il next_cursor della pagina precedente.
+        """
+        allowed: List[Set[int]] = []
+        if role is not None:
+            allowed.append(self._by_role.get(role, set()))
+        if real_team is not None:
+            allowed.append(self._by_real_team.get(normalize(real_team), set()))
+        allowed.sort(key=len)
+
+        query = normalize(query)
+        if query:
+            ranks = self._matches(query)
+        else:
+            # senza testo si parte dal filtro più selettivo invece che da tutto il pool
+            ranks = dict.fromkeys(allowed.pop(0) if allowed else self._players, RANK_NAME_PREFIX)
+
+        keys: List[SortKey] = []
+        for player_id, rank in ranks.items():
+            if any(player_id not in ids for ids in allowed):
+                continue
+            if is_available is not None and not is_available(self._players[player_id]):
+                continue
+            keys.append((rank, self._names[player_id], player_id))
+        keys.sort()
+
+        start = bisect_right(keys, decode_cursor(cursor)) if cursor else 0
+        page = keys[start:start + limit]
+        next_cursor = encode_cursor(page[-1]) if page and start + limit < len(keys) else None
+        return SearchPage([self._players[key[2]] for key in page], next_cursor)
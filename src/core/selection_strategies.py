@@ -11,8 +11,12 @@ class SelectionStrategy(ABC):
         pass
 
 class RandomSelection(SelectionStrategy):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # generatore dedicato (es. random.Random(seed)) per scelte riproducibili
+        self.rng = rng or random
+
     def select_player(self, available_players: List[Player]) -> Optional[Player]:
-        return random.choice(available_players) if available_players else None
+        return self.rng.choice(available_players) if available_players else None
 
 class AlphabeticalSelection(SelectionStrategy):
     def select_player(self, available_players: List[Player]) -> Optional[Player]:
@@ -0,0 +1,324 @@
+# core/simulation.py
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.bid import Bid
+from core.bidder import IBidder
+from core.budget_strategies import BudgetStrategy, LimitedBudgetStrategy
+from core.caller import ICaller
+from core.enums import PlayerRole
+from core.event_bus import EventBus
+from core.events import PlayerAssigned
+from core.market_rules import MarketRule, UniquePlayerMarket
+from core.ownership_policies import NoDuplicatesOwnershipPolicy, OwnershipPolicy
+from core.player import Player
+from core.selection_strategies import RandomSelection, SelectionStrategy
+from core.team import Team
+from core.team_building_strategies.base import TeamBuildingStrategy
+from core.team_building_strategies.fixed_max_strategy import FixedMaxStrategy
+
+ROLES = (PlayerRole.GOALKEEPER, PlayerRole.DEFENDER, PlayerRole.MIDFIELDER, PlayerRole.FORWARD)
+
+# rosa classica: 3 portieri, 8 difensori, 8 centrocampisti, 6 attaccanti
+DEFAULT_ROSTER: Dict[PlayerRole, int] = {
+    PlayerRole.GOALKEEPER: 3,
+    PlayerRole.DEFENDER: 8,
+    PlayerRole.MIDFIELDER: 8,
+    PlayerRole.FORWARD: 6,
+}
+
+
+def generate_players(count_by_role: Dict[PlayerRole, int], seed: int = 0) -> List[Player]:
+    """Listone sintetico per simulazioni e test."""
+    rng = random.Random(seed)
+    players: List[Player] = []
+    player_id = 1
+    for role, count in count_by_role.items():
+        for i in range(count):
+            players.append(Player(player_id, f"{role.name.title()} {i + 1}", role, f"Club {rng.randint(1, 20)}"))
+            player_id += 1
+    return players
+
+
+class BotParticipant(ICaller, IBidder):
+    """
+    Partecipante locale: chiama con una SelectionStrategy e offre una frazione
+    casuale del budget medio per posto libero, tenendo da parte il prezzo minimo
+    per ogni altro posto da riempire. select() e bid() sono il percorso sincrono
+    usato dalla simulazione; choose_player() e get_bid() le versioni async.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        team: Team,
+        rng: random.Random,
+        selection: Optional[SelectionStrategy] = None,
+        aggressiveness: float = 1.0,
+        min_price: float = 1,
+    ):
+        ICaller.__init__(self, name)
+        self._team = team
+        self.rng = rng
+        self.selection = selection or RandomSelection(rng)
+        self.aggressiveness = aggressiveness
+        self.min_price = min_price
+        # posti ancora da riempire, aggiornato dal motore prima di chiedere un'offerta
+        self.slots_left = 1
+
+    @property
+    def team(self) -> Optional[Team]:
+        return self._team
+
+    def select(self, candidates: List[Player]) -> Optional[Player]:
+        return self.selection.select_player(candidates)
+
+    def bid(self, player: Player) -> Optional[float]:
+        team = self._team
+        max_bid = team.max_bid_for(player.role)
+        if max_bid < self.min_price:
+            return None
+        amount = int(team.remaining / max(self.slots_left, 1) * self.rng.uniform(0.3, 1.8) * self.aggressiveness)
+        return float(min(max(amount, self.min_price), max_bid))
+
+    async def choose_player(self, player_pool: List[Player]) -> Optional[Player]:
+        return self.select(player_pool)
+
+    async def get_bid(self, player: Player) -> Optional[float]:
+        return self.bid(player)
+
+    def place_bid(self, player: Player, amount: float) -> Bid:
+        return Bid(player=player, amount=amount, team=self._team)
+
+
+@dataclass
+class SimulationResult:
+    seed: int
+    teams: List[Team]
+    lots: int
+    # True se tutte le squadre hanno completato la rosa
+    complete: bool
+
+    def summary(self) -> dict:
+        return {
+            "seed": self.seed,
+            "lots": self.lots,
+            "complete": self.complete,
+            "teams": [
+                {
+                    "id": team.id,
+                    "name": team.name,
+                    "spent": team.spent,
+                    "roster": [p.player_id for p in team.roster],
+                    "roles": {role.name: team.count_by_role(role) for role in ROLES},
+                }
+                for team in self.teams
+            ],
+        }
+
+
+class AuctionSimulation:
+    """
+    Asta completa in-process, senza rete: a turno un partecipante chiama un
+    giocatore tra quelli che gli servono (con un'offerta d'apertura al prezzo
+    minimo), gli altri partecipanti idonei offrono a busta chiusa e vince l'offerta
+    più alta (a parità, il primo nell'ordine di chiamata). Le regole sono oggetti
+    sostituibili: MarketRule, OwnershipPolicy, BudgetStrategy e TeamBuildingStrategy.
+    Con lo stesso seed il risultato è sempre lo stesso.
+    """
+
+    def __init__(
+        self,
+        players: Sequence[Player],
+        teams: int = 8,
+        seed: int = 0,
+        budget: float = 500,
+        min_price: float = 1,
+        market_rule: Optional[MarketRule] = None,
+        ownership_policy: Optional[OwnershipPolicy] = None,
+        budget_strategy: Optional[BudgetStrategy] = None,
+        team_building: Optional[TeamBuildingStrategy] = None,
+        participants: Optional[Sequence] = None,
+        events: Optional[EventBus] = None,
+        max_lots: Optional[int] = None,
+    ):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.min_price = min_price
+        self.market_rule = market_rule or UniquePlayerMarket()
+        # la policy di default legge le bitset della regola di mercato
+        self.ownership_policy = ownership_policy or NoDuplicatesOwnershipPolicy(self.market_rule.store)
+        self.budget_strategy = budget_strategy or LimitedBudgetStrategy(budget)
+        self.team_building = team_building or FixedMaxStrategy(dict(DEFAULT_ROSTER))
+        self.events = events
+        self.max_lots = max_lots
+
+        if participants:
+            # partecipanti esterni: ICaller + IBidder con la propria squadra
+            self.participants = list(participants)
+        else:
+            self.participants = []
+            for i in range(1, teams + 1):
+                team = Team(i, f"Team {i}")
+                team.budget = budget
+                self.participants.append(BotParticipant(f"Bot {i}", team, self.rng, min_price=min_price))
+        self.teams = [p.team for p in self.participants]
+
+        # giocatori ancora disponibili per ruolo, nell'ordine del listone
+        self._available: Dict[PlayerRole, List[Player]] = {}
+        for player in players:
+            self._available.setdefault(player.role, []).append(player)
+        self._next_caller = 0
+        self.lots = 0
+        # stato di rosa per partecipante: cambia solo per chi vince un lotto
+        self._remaining: List[Dict[PlayerRole, int]] = []
+        self._complete: List[bool] = []
+        for participant in self.participants:
+            # riserva per gli slot ancora vuoti: l'offerta massima resta in cache nella squadra
+            participant.team.set_requirements(self.team_building.roles_remaining(participant.team), min_price)
+            self._remaining.append(self.team_building.roles_remaining(participant.team))
+            self._complete.append(self.team_building.is_complete(participant.team))
+
+    # --- passi condivisi tra percorso sincrono e asincrono -------------------
+
+    def _needed_roles(self, index: int) -> List[PlayerRole]:
+        remaining = self._remaining[index]
+        if not remaining:
+            # strategia senza vincoli di ruolo: va bene qualsiasi giocatore
+            return [role for role, players in self._available.items() if players]
+        return [role for role, count in remaining.items() if count > 0 and self._available.get(role)]
+
+    def _slots_left(self, index: int) -> int:
+        return sum(self._remaining[index].values()) or 1
+
+    def _can_take(self, team: Team, player: Player, price: float) -> bool:
+        return (
+            self.ownership_policy.can_own(team, player)
+            and self.team_building.can_assign(team, player, price)
+            and self.budget_strategy.can_afford(team, player, price)
+        )
+
+    def _next_turn(self) -> Optional[Tuple[int, List[Player]]]:
+        """Indice del prossimo partecipante che può chiamare e i giocatori tra cui scegliere."""
+        if self.max_lots is not None and self.lots >= self.max_lots:
+            return None
+        count = len(self.participants)
+        for offset in range(count):
+            index = (self._next_caller + offset) % count
+            if self._complete[index]:
+                continue
+            roles = self._needed_roles(index)
+            if not roles:
+                continue
+            if len(roles) == 1:
+                candidates = self._available[roles[0]]
+            else:
+                candidates = list(chain.from_iterable(self._available[role] for role in roles))
+            participant = self.participants[index]
+            if not self.budget_strategy.can_afford(participant.team, candidates[0], self.min_price):
+                continue
+            self._next_caller = (index + 1) % count
+            return index, candidates
+        return None
+
+    def _valid_choice(self, caller: int, player: Optional[Player], candidates: List[Player]) -> Optional[Player]:
+        team = self.participants[caller].team
+        if player is not None and self._can_take(team, player, self.min_price):
+            return player
+        # scelta non valida (o nessuna scelta): il primo giocatore che il caller può prendere
+        for candidate in candidates:
+            if self._can_take(team, candidate, self.min_price):
+                return candidate
+        return None
+
+    def _bidders(self, start: int, player: Player) -> List[int]:
+        """Indici dei partecipanti che offrono: il caller per primo, poi gli altri in ordine."""
+        count = len(self.participants)
+        bidders = []
+        for offset in range(count):
+            index = (start + offset) % count
+            participant = self.participants[index]
+            if offset and not self._can_take(participant.team, player, self.min_price):
+                continue
+            if isinstance(participant, BotParticipant):
+                participant.slots_left = self._slots_left(index)
+            bidders.append(index)
+        return bidders
+
+    def _award(self, player: Player, bids: List[Tuple[int, Optional[float]]]) -> None:
+        winner, price = bids[0][0], self.min_price  # offerta d'apertura del caller
+        for index, amount in bids:
+            if amount is None or amount <= price:
+                continue
+            if self._can_take(self.participants[index].team, player, amount):
+                winner, price = index, amount
+        team = self.participants[winner].team
+        self.budget_strategy.apply_purchase(team, player, price)
+        self.market_rule.register_assignment(team, player)
+        if not self.market_rule.is_available(player):
+            self._available[player.role].remove(player)
+        self._remaining[winner] = self.team_building.roles_remaining(team)
+        self._complete[winner] = self.team_building.is_complete(team)
+        self.lots += 1
+        if self.events is not None and self.events.has_subscribers(PlayerAssigned):
+            self.events.publish(PlayerAssigned(
+                team_id=team.id, team_name=team.name, player_id=player.player_id, player_name=player.name, price=price,
+            ))
+
+    def _result(self) -> SimulationResult:
+        complete = all(self._complete)
+        return SimulationResult(seed=self.seed, teams=self.teams, lots=self.lots, complete=complete)
+
+    # --- esecuzione ------------------------------------------------------------
+
+    def run(self) -> SimulationResult:
+        """Percorso sincrono: richiede partecipanti con select() e bid() (es. BotParticipant)."""
+        skipped = 0
+        while skipped < len(self.participants):
+            turn = self._next_turn()
+            if turn is None:
+                break
+            caller, candidates = turn
+            player = self._valid_choice(caller, self.participants[caller].select(candidates), candidates)
+            if player is None:
+                # nessuna chiamata valida: dopo un giro intero senza chiamate l'asta finisce
+                skipped += 1
+                continue
+            skipped = 0
+            bidders = self._bidders(caller, player)
+            self._award(player, [(index, self.participants[index].bid(player)) for index in bidders])
+        return self._result()
+
+    async def run_async(self) -> SimulationResult:
+        """Stessa asta con le interfacce async ICaller/IBidder (partecipanti qualsiasi)."""
+        skipped = 0
+        while skipped < len(self.participants):
+            turn = self._next_turn()
+            if turn is None:
+                break
+            caller, candidates = turn
+            player = self._valid_choice(caller, await self.participants[caller].choose_player(candidates), candidates)
+            if player is None:
+                skipped += 1
+                continue
+            skipped = 0
+            bidders = self._bidders(caller, player)
+            self._award(player, [(index, await self.participants[index].get_bid(player)) for index in bidders])
+        return self._result()
+
+
+def _simulate_summary(args: Tuple[Sequence[Player], int, dict]) -> dict:
+    players, seed, options = args
+    return AuctionSimulation(players, seed=seed, **options).run().summary()
+
+
+def simulate_many(players: Sequence[Player], seeds: Sequence[int], processes: int = 1, **options) -> List[dict]:
+    """Esegue una simulazione per seed (in più processi se richiesto) e ne ritorna i riepiloghi."""
+    jobs = [(players, seed, options) for seed in seeds]
+    if processes <= 1:
+        return [_simulate_summary(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(_simulate_summary, jobs, chunksize=max(1, len(jobs) // (processes * 4))))
@@ -4,34 +4,128 @@ from core.player import Player
 
 
 class Team:
+    __slots__ = (
+        "id",
+        "name",
+        "president",
+        "_budget",
+        "_spent",
+        "roster",
+        "_role_counts",
+        "_player_counts",
+        "min_price",
+        "_required",
+        "_required_slots",
+        "_max_bid",
+    )
+
     def __init__(self, id: int, name: str):
         self.id = id
         self.name = name
-        self.president = None  
-        self.budget:float = 500
-        self.spent:float= 0
+        self.president = None
+        self._budget:float = 500
+        self._spent:float= 0
         self.roster: List[Player] = []
+        # contatori aggiornati da add_player: evitano scansioni della rosa
+        self._role_counts: Dict[PlayerRole, int] = {}
+        self._player_counts: Dict[int, int] = {}
+        # slot obbligatori ancora da riempire (vedi set_requirements) e prezzo minimo
+        # di un giocatore: ne derivano la riserva e l'offerta massima, tenute in cache
+        self.min_price: float = 1
+        self._required: Dict[PlayerRole, int] = {}
+        self._required_slots = 0
+        self._max_bid: float = self._budget
+
+    @property
+    def budget(self) -> float:
+        return self._budget
+
+    @budget.setter
+    def budget(self, value: float) -> None:
+        self._budget = value
+        self._refresh_max_bid()
+
+    @property
+    def spent(self) -> float:
+        return self._spent
+
+    @spent.setter
+    def spent(self, value: float) -> None:
+        self._spent = value
+        self._refresh_max_bid()
+
+    def set_requirements(self, required: Dict[PlayerRole, int], min_price: float = 1) -> None:
+        """
+        Slot che la squadra deve ancora riempire per ruolo (di solito
+        TeamBuildingStrategy.roles_remaining). Da qui in poi add_player li scala.
+        """
+        self._required = {role: count for role, count in required.items() if count > 0}
+        self._required_slots = sum(self._required.values())
+        self.min_price = min_price
+        self._refresh_max_bid()
+
+    def _refresh_max_bid(self) -> None:
+        # il giocatore in asta occupa uno degli slot obbligatori: si riservano gli altri
+        reserve = max(self._required_slots - 1, 0) * self.min_price
+        self._max_bid = self._budget - self._spent - reserve
 
     def add_player(self, player: Player, price: float) -> None:
         self.roster.append(player)
+        self._role_counts[player.role] = self._role_counts.get(player.role, 0) + 1
+        self._player_counts[player.player_id] = self._player_counts.get(player.player_id, 0) + 1
+        required = self._required.get(player.role)
+        if required:
+            if required == 1:
+                del self._required[player.role]
+            else:
+                self._required[player.role] = required - 1
+            self._required_slots -= 1
+            self._refresh_max_bid()
+
+    @property
+    def remaining(self) -> float:
+        return self._budget - self._spent
+
+    @property
+    def required_slots(self) -> int:
+        return self._required_slots
+
+    @property
+    def max_bid(self) -> float:
+        """Offerta massima per un giocatore che riempie uno slot obbligatorio."""
+        return self._max_bid
+
+    def reserve_for(self, role: Optional[PlayerRole] = None) -> float:
+        """Crediti da tenere da parte per gli slot obbligatori se si compra un giocatore di `role`."""
+        slots = self._required_slots
+        if slots and (role is None or role in self._required):
+            slots -= 1
+        return slots * self.min_price
+
+    def max_bid_for(self, role: Optional[PlayerRole] = None) -> float:
+        if role is None or not self._required_slots or role in self._required:
+            return self._max_bid
+        # un giocatore fuori dagli slot obbligatori non ne libera nessuno
+        return self._max_bid - self.min_price
 
     # Utility robuste
     def has_player(self, player: Player) -> bool:
-        return any(p.player_id == player.player_id for p in self.roster)
+        return player.player_id in self._player_counts
 
     def player_count(self, player: Player) -> int:
-        return sum(1 for p in self.roster if p.player_id == player.player_id)
+        return self._player_counts.get(player.player_id, 0)
 
     def count_by_role(self, role: PlayerRole) -> int:
-        return sum(1 for p in self.roster if p.role == role)
+        return self._role_counts.get(role, 0)
 
     def get_roster_by_role(self) -> Dict[PlayerRole, List[Player]]:
         grouped: Dict[PlayerRole, List[Player]] = {}
         for p in self.roster:
             grouped.setdefault(p.role, []).append(p)
         return grouped
-    def can_afford(self, amount: float) -> bool:
-        return (self.budget - self.spent) >= amount
+
+    def can_afford(self, amount: float, role: Optional[PlayerRole] = None) -> bool:
+        return amount <= self.max_bid_for(role)
 
     def __repr__(self) -> str:
-        return f"<Team {self.name} spent={self.spent} size={len(self.roster)}>"
\ No newline at end of file
+        return f"<Team {self.name} spent={self.spent} size={len(self.roster)}>"
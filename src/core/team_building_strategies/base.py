@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from core.enums import PlayerRole
 from core.player import Player
@@ -11,4 +12,8 @@ class TeamBuildingStrategy(ABC):
     @abstractmethod
     def is_complete(self, team: Team) -> bool: ...
     @abstractmethod
-    def roles_remaining(self, team: Team) -> dict[PlayerRole, int]: ...
\ No newline at end of file
+    def roles_remaining(self, team: Team) -> dict[PlayerRole, int]: ...
+
+    def role_capacity(self, team: Team, role: PlayerRole) -> Optional[int]:
+        """Posti ancora liberi per il ruolo; None se il ruolo non ha un massimo."""
+        return None
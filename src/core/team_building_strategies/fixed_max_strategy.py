@@ -17,3 +17,6 @@ class FixedMaxStrategy(TeamBuildingStrategy):
 
     def roles_remaining(self, team):
         return {r: max(0, m - team.count_by_role(r)) for r, m in self.max_slots.items()}
+
+    def role_capacity(self, team, role):
+        return max(0, self.max_slots.get(role, 0) - team.count_by_role(role))
@@ -24,3 +24,6 @@ class MinMaxStrategy(TeamBuildingStrategy):
 
     def roles_remaining(self, team):
         return {r: max(0, self.min_slots[r] - team.count_by_role(r)) for r in self.min_slots}
+
+    def role_capacity(self, team, role):
+        return max(0, self.max_slots.get(role, 0) - team.count_by_role(role))
@@ -0,0 +1,221 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+
+
+@pytest.fixture
+def client():
+    # il context manager tiene un solo event loop: il loop d'asta sopravvive alle richieste
+    with TestClient(app) as client:
+        yield client
+
+
+def _create_auction(client, **options) -> str:
+    response = client.post("/auctions/", json={"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4, **options})
+    return response.json()["auction_id"]
+
+
+def _join(client, auction_id, ws, name, team_id) -> str:
+    ws.send_json({"type": "join", "payload": {"name": name}})
+    participant_id = _receive_until(ws, "joined")["payload"]["id"]
+    client.post(f"/auctions/{auction_id}/assign", json={"participant_id": participant_id, "team_id": team_id})
+    return participant_id
+
+
+def _answer(ws, participant_id, request, **fields):
+    ws.send_json({
+        "type": request["type"].replace("_request", "_response"),
+        "participant_id": participant_id,
+        "request_id": request["request_id"],
+        **fields,
+    })
+
+
+def _receive_until(ws, msg_type):
+    while True:
+        message = ws.receive_json()
+        if message["type"] == msg_type:
+            return message
+
+
+def test_join_and_assign_are_broadcast_as_versioned_deltas(client):
+    auction_id = _create_auction(client)
+    with client.websocket_connect(f"/auctions/{auction_id}/ws") as ws:
+        _receive_until(ws, "auction_snapshot")
+        ws.send_json({"type": "join", "payload": {"name": "Mario"}})
+        participant_id = _receive_until(ws, "joined")["payload"]["id"]
+
+        delta = _receive_until(ws, "auction_delta")["payload"]
+        assert delta["version"] == 1
+        assert delta["changes"][0]["op"] == "participant_joined"
+
+        response = client.post(f"/auctions/{auction_id}/assign", json={"participant_id": participant_id, "team_id": 2})
+        assert response.status_code == 200
+
+        delta = _receive_until(ws, "auction_delta")["payload"]
+        assert delta == {
+            "version": 2,
+            "changes": [{"op": "participant_assigned", "participant_id": participant_id, "team_id": 2}],
+        }
+
+
+def test_resync_returns_full_snapshot_with_version(client):
+    auction_id = _create_auction(client)
+    with client.websocket_connect(f"/auctions/{auction_id}/ws") as ws:
+        _receive_until(ws, "auction_snapshot")
+        ws.send_json({"type": "join", "payload": {"name": "Mario"}})
+        _receive_until(ws, "auction_delta")
+        _receive_until(ws, "auction_snapshot")
+
+        ws.send_json({"type": "resync"})
+        snapshot = _receive_until(ws, "auction_snapshot")
+        assert snapshot["payload"]["version"] == 1
+        assert len(snapshot["payload"]["auction"]["teams"]) == 4
+
+
+def test_turns_reference_cached_pool_and_send_removed_ids(client):
+    auction_id = _create_auction(client)
+    with client.websocket_connect(f"/auctions/{auction_id}/ws") as ws:
+        pool = _receive_until(ws, "player_pool_snapshot")["payload"]
+        assert len(pool["players"]) == 8
+
+        ws.send_json({"type": "join", "payload": {"name": "Mario"}})
+        participant_id = _receive_until(ws, "joined")["payload"]["id"]
+        client.post(f"/auctions/{auction_id}/assign", json={"participant_id": participant_id, "team_id": 1})
+        assert client.post(f"/auctions/{auction_id}/start").status_code == 200
+
+        turn = _receive_until(ws, "turn_waiting_for_player")["payload"]
+        assert turn["pool"] == {"version": pool["version"], "base_version": pool["version"], "added": [], "removed_ids": []}
+
+        request = _receive_until(ws, "choose_player_request")
+        assert request["pool_version"] == pool["version"]
+        assert "player_pool" not in request
+        ws.send_json({
+            "type": "choose_player_response",
+            "participant_id": participant_id,
+            "request_id": request["request_id"],
+            "player_id": 5,
+        })
+
+        bid_request = _receive_until(ws, "place_bid_request")
+        ws.send_json({
+            "type": "place_bid_response",
+            "participant_id": participant_id,
+            "request_id": bid_request["request_id"],
+            "amount": 12,
+        })
+        assert _receive_until(ws, "bidding_result")["payload"]["status"] == "won"
+
+        turn = _receive_until(ws, "turn_waiting_for_player")["payload"]
+        assert turn["pool"]["removed_ids"] == [5]
+        assert turn["pool"]["base_version"] == pool["version"]
+
+        assert len(client.get(f"/auctions/{auction_id}/pool").json()["players"]) == 7
+
+
+def test_start_resends_the_pool_changed_after_connecting(client):
+    auction_id = _create_auction(client, seed_players=False)
+    with client.websocket_connect(f"/auctions/{auction_id}/ws") as ws:
+        assert _receive_until(ws, "player_pool_snapshot")["payload"]["players"] == []
+        _join(client, auction_id, ws, "Mario", 1)
+
+        csv = "id,name,role,team\n1,G. Donnarumma,P,PSG\n2,N. Barella,C,Inter\n"
+        assert client.post(f"/auctions/{auction_id}/players/import", content=csv).json()["imported"] == 2
+        assert client.post(f"/auctions/{auction_id}/start").status_code == 200
+
+        pool = _receive_until(ws, "player_pool_snapshot")["payload"]
+        assert sorted(p["player_id"] for p in pool["players"]) == [1, 2]
+        turn = _receive_until(ws, "turn_waiting_for_player")["payload"]
+        assert turn["pool"]["base_version"] == pool["version"]
+
+
+def test_silent_bidder_is_treated_as_pass_after_deadline(client):
+    auction_id = _create_auction(client, bid_timeout=0.3)
+    with client.websocket_connect(f"/auctions/{auction_id}/ws") as fast, \
+            client.websocket_connect(f"/auctions/{auction_id}/ws") as afk:
+        fast_id = _join(client, auction_id, fast, "Mario", 1)
+        _join(client, auction_id, afk, "Luigi", 2)
+        client.post(f"/auctions/{auction_id}/start")
+
+        # il primo chiamante è Mario: Luigi non risponderà a nulla
+        _answer(fast, fast_id, _receive_until(fast, "choose_player_request"), player_id=7)
+        started = _receive_until(fast, "bidding_started")["payload"]
+        assert started["deadline_seconds"] == 0.3
+        assert len(started["bidders"]) == 2
+
+        _answer(fast, fast_id, _receive_until(fast, "place_bid_request"), amount=20)
+        result = _receive_until(fast, "bidding_result")["payload"]
+        assert result["status"] == "won"
+        assert result["winner"]["id"] == fast_id
+
+
+def test_expired_choice_falls_back_to_automatic_pick(client):
+    auction_id = _create_auction(client, choose_timeout=0.2, choose_fallback="alphabetical")
+    with client.websocket_connect(f"/auctions/{auction_id}/ws") as ws:
+        participant_id = _join(client, auction_id, ws, "Mario", 1)
+        client.post(f"/auctions/{auction_id}/start")
+
+        request = _receive_until(ws, "choose_player_request")
+        assert request["deadline_seconds"] == 0.2
+        # nessuna risposta: allo scadere la stanza sceglie al posto del partecipante
+        started = _receive_until(ws, "bidding_started")["payload"]
+        assert started["player"]["name"] == "D. Berardi"
+
+        _answer(ws, participant_id, request, player_id=5)
+        _answer(ws, participant_id, _receive_until(ws, "place_bid_request"), amount=3)
+        assert _receive_until(ws, "bidding_result")["payload"]["status"] == "won"
+
+        stats = client.get(f"/auctions/{auction_id}/requests").json()
+        assert stats["expired"] == 1
+        assert stats["late"] == 1
+
+
+def test_bids_above_the_reserved_max_bid_are_rejected(client):
+    auction_id = _create_auction(client, budget=10, roster={"P": 1, "D": 2, "C": 2, "A": 3})
+    team = client.get(f"/auctions/{auction_id}").json()["auction"]["teams"][0]
+    assert team["max_bid"] == 3
+
+    with client.websocket_connect(f"/auctions/{auction_id}/ws") as ws:
+        participant_id = _join(client, auction_id, ws, "Mario", 1)
+        client.post(f"/auctions/{auction_id}/start")
+
+        _answer(ws, participant_id, _receive_until(ws, "choose_player_request"), player_id=7)
+        bid_request = _receive_until(ws, "place_bid_request")
+        assert bid_request["team"]["max_bid"] == 3
+        _answer(ws, participant_id, bid_request, amount=4)
+        assert _receive_until(ws, "bidding_result")["payload"]["status"] == "no_bids"
+
+        _answer(ws, participant_id, _receive_until(ws, "choose_player_request"), player_id=7)
+        _answer(ws, participant_id, _receive_until(ws, "place_bid_request"), amount=3)
+        change = _receive_until(ws, "auction_delta")["payload"]["changes"][0]
+        assert change["op"] == "player_assigned"
+        assert change["spent"] == 3 and change["max_bid"] == 1
+
+
+def test_choosing_a_player_nobody_can_bid_for_is_rejected(client):
+    # nessuna squadra ha posti da portiere: Donnarumma resta nel pool ma non si può chiamare
+    auction_id = _create_auction(client, roster={"P": 0, "D": 2, "C": 2, "A": 3})
+    with client.websocket_connect(f"/auctions/{auction_id}/ws") as ws:
+        participant_id = _join(client, auction_id, ws, "Mario", 1)
+        client.post(f"/auctions/{auction_id}/start")
+
+        request = _receive_until(ws, "choose_player_request")
+        _answer(ws, participant_id, request, player_id=1)
+        rejected = _receive_until(ws, "choose_player_rejected")
+        assert rejected["request_id"] == request["request_id"]
+        assert rejected["payload"] == {"player_id": 1, "reason": "not_callable"}
+
+        # il turno viene riproposto e una scelta valida passa
+        _answer(ws, participant_id, _receive_until(ws, "choose_player_request"), player_id=7)
+        assert _receive_until(ws, "bidding_started")["payload"]["player"]["name"] == "V. Osimhen"
+
+
+def test_unknown_roster_role_is_rejected(client):
+    response = client.post("/auctions/", json={"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4, "roster": {"X": 1}})
+    assert response.status_code == 400
+
+
+def test_unknown_choose_fallback_is_rejected(client):
+    response = client.post("/auctions/", json={"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4, "choose_fallback": "coin"})
+    assert response.status_code == 400
@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+import pytest
+
+from core.auctioneer import Auctioneer
+from core.bid import Bid
+from core.enums import PlayerRole
+from core.player import Player
+from core.team import Team
+
+
+PLAYER = Player(7, "V. Osimhen", PlayerRole.FORWARD, "Napoli")
+
+
+@pytest.mark.asyncio
+async def test_countdown_ticks_on_the_loop_and_awards_best_bid():
+    ticks = []
+    finished = []
+    auctioneer = Auctioneer(countdown_seconds=0.1, tick_interval=0.03, tick_callback=ticks.append)
+    auctioneer.on_finish = lambda player, team, amount: finished.append((player, team, amount))
+    team = Team(1, "Team 1")
+    threads_before = threading.active_count()
+
+    auctioneer.start(PLAYER)
+    auctioneer.register_bid(Bid(team=team, amount=5, player=PLAYER))
+    auctioneer.register_bid(Bid(team=Team(2, "Team 2"), amount=3, player=PLAYER))
+    outcome = await auctioneer.wait()
+
+    assert outcome == (PLAYER, team, 5)
+    assert finished == [outcome]
+    assert ticks[0] == 0.1
+    assert len(ticks) >= 3
+    assert threading.active_count() == threads_before
+
+
+@pytest.mark.asyncio
+async def test_late_bid_extends_deadline():
+    auctioneer = Auctioneer(countdown_seconds=0.05, tick_interval=None, late_bid_window=0.05, late_bid_extension=0.2)
+    loop = asyncio.get_running_loop()
+
+    auctioneer.start(PLAYER)
+    started = loop.time()
+    await asyncio.sleep(0.02)
+    auctioneer.register_bid(Bid(team=Team(1, "Team 1"), amount=1, player=PLAYER))
+    await auctioneer.wait()
+
+    assert loop.time() - started >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_without_awarding():
+    finished = []
+    auctioneer = Auctioneer(countdown_seconds=0.05, tick_interval=None)
+    auctioneer.on_finish = lambda *args: finished.append(args)
+
+    auctioneer.start(PLAYER)
+    auctioneer.stop()
+    await asyncio.sleep(0.08)
+
+    assert finished == []
+    assert not auctioneer.running
+    assert not auctioneer.register_bid(Bid(team=Team(1, "Team 1"), amount=1, player=PLAYER))
+    with pytest.raises(asyncio.CancelledError):
+        await auctioneer.wait()
+
+
+@pytest.mark.asyncio
+async def test_failing_callbacks_are_logged_and_do_not_stop_the_countdown(caplog):
+    def broken_tick(remaining):
+        raise RuntimeError("tick")
+
+    async def broken_finish(*args):
+        raise RuntimeError("finish")
+
+    auctioneer = Auctioneer(countdown_seconds=0.05, tick_interval=0.01, tick_callback=broken_tick)
+    auctioneer.on_finish = broken_finish
+
+    auctioneer.start(PLAYER)
+    assert await asyncio.wait_for(auctioneer.wait(), 1) == (PLAYER, None, 0)
+    await asyncio.sleep(0)
+
+    assert not auctioneer._tasks
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("failed" in m for m in messages if "broken_tick" in m)
+    assert "Auctioneer callback task failed" in messages
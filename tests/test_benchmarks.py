@@ -0,0 +1,72 @@
+import importlib.util
+import json
+import os
+import random
+
+import pytest
+
+BENCH_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+
+
+def _load(name: str):
+    spec = importlib.util.spec_from_file_location(f"bench_{name}", os.path.join(BENCH_DIR, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_suite():
+    return _load("suite")
+
+
+def test_suite_writes_json_and_flags_regressions(tmp_path):
+    suite = _load_suite()
+    out = tmp_path / "results.json"
+
+    code = suite.main(["-k", "pool.get_available", "-k", "bidding.closed", "--min-time", "0.001", "--rounds", "1", "--json", str(out)])
+
+    assert code == 0
+    results = json.loads(out.read_text())
+    assert set(results["results"]) == {"pool.get_available", "pool.get_available_by_role", "bidding.closed[8 bidders]"}
+    assert all(r["ns_per_op"] > 0 for r in results["results"].values())
+
+    # una baseline 10 volte più veloce fa fallire il confronto
+    faster = {"results": {name: {"ns_per_op": r["ns_per_op"] / 10} for name, r in results["results"].items()}}
+    assert len(suite.compare(results, faster, tolerance=1.5)) == 3
+    assert suite.compare(results, results, tolerance=1.5) == []
+
+
+def test_baseline_covers_every_case():
+    suite = _load_suite()
+    with open(suite.BASELINE_PATH) as f:
+        baseline = json.load(f)
+
+    assert {c.name for c in suite.CASES} == set(baseline["results"])
+
+
+def test_ws_load_think_times_and_percentiles():
+    ws_load = _load("ws_load")
+    rng = random.Random(0)
+
+    assert ws_load.parse_think("const:0.5")(rng) == 0.5
+    assert 0.1 <= ws_load.parse_think("uniform:0.1:0.2")(rng) <= 0.2
+    assert ws_load.parse_think("exp:0")(rng) == 0.0
+    with pytest.raises(ValueError):
+        ws_load.parse_think("gamma:1")
+
+    values = [float(i) for i in range(1, 101)]
+    assert ws_load.percentile(values, 50) == 50.0
+    assert ws_load.percentile(values, 99) == 99.0
+    assert ws_load.percentile([], 99) == 0.0
+
+
+def test_ws_load_runs_a_small_auction_in_process():
+    ws_load = _load("ws_load")
+
+    summary = ws_load.main(["--auctions", "2", "--participants", "3", "--players", "4", "--think", "const:0", "--json", "-"])
+
+    assert summary["auctions"] == 2 and summary["timed_out"] == 0
+    # solo i 4 giocatori importati: le aste di carico nascono senza quelli d'esempio
+    assert summary["lots"] == 2 * 4
+    assert summary["bids"] > 0 and summary["latency_ms"]["p99"] >= summary["latency_ms"]["p50"] > 0
+    assert len(summary["per_process"]) == 1
@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+from core.calling_strategy.sequential_calling_strategy import SequentialCallingStrategy
+
+
+def _callers(*ids):
+    return [SimpleNamespace(id=caller_id) for caller_id in ids]
+
+
+def test_update_callers_keeps_the_rotation_position():
+    callers = _callers("a", "b", "c")
+    strategy = SequentialCallingStrategy(callers)
+    assert strategy.next_caller()[0].id == "a"
+    assert strategy.next_caller()[0].id == "b"
+
+    strategy.update_callers(callers)
+
+    assert strategy.last_caller_id == "b"
+    assert strategy.next_caller()[0].id == "c"
+
+
+def test_resume_after_restores_position_by_caller_id():
+    strategy = SequentialCallingStrategy(_callers("a", "b", "c"))
+
+    strategy.resume_after("c")
+    assert strategy.next_caller()[0].id == "a"
+
+    strategy.resume_after("gone")
+    assert strategy.next_caller()[0].id == "a"
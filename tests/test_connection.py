@@ -0,0 +1,103 @@
+import asyncio
+import json
+
+import pytest
+
+from api.connection import OutboundConnection
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+        self.closed_with = None
+
+    async def send_text(self, frame):
+        await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(frame))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+@pytest.mark.asyncio
+async def test_send_is_queued_and_flushed_by_writer_task():
+    ws = FakeWebSocket()
+    connection = OutboundConnection(ws)
+    connection.start()
+
+    for i in range(5):
+        assert connection.send({"type": "tick", "n": i})
+    await asyncio.sleep(0.01)
+
+    assert [m["n"] for m in ws.sent] == [0, 1, 2, 3, 4]
+    assert connection.stats()["sent"] == 5
+    assert connection.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_overflow_replaces_backlog_with_resync_but_keeps_requests():
+    ws = FakeWebSocket(delay=0.05)
+    connection = OutboundConnection(ws, max_queue=3, resync_factory=lambda: {"type": "auction_snapshot"})
+
+    connection.send({"type": "delta", "n": 1})
+    connection.send({"type": "place_bid_request", "request_id": "r1"})
+    connection.send({"type": "delta", "n": 2})
+    connection.send({"type": "delta", "n": 3})  # coda piena
+    connection.start()
+    await asyncio.sleep(0.2)
+
+    assert [m["type"] for m in ws.sent] == ["auction_snapshot", "place_bid_request"]
+    assert connection.stats()["resyncs"] == 1
+    assert connection.stats()["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_overflowing_request_is_queued_after_resync():
+    ws = FakeWebSocket()
+    connection = OutboundConnection(ws, max_queue=2, resync_factory=lambda: {"type": "auction_snapshot"})
+
+    connection.send({"type": "delta", "n": 1})
+    connection.send({"type": "delta", "n": 2})
+    assert connection.send({"type": "choose_player_request", "request_id": "r1"})  # coda piena
+    connection.start()
+    await asyncio.sleep(0.05)
+
+    assert [m["type"] for m in ws.sent] == ["auction_snapshot", "choose_player_request"]
+    assert ws.sent[1]["request_id"] == "r1"
+    assert connection.stats()["resyncs"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_dropped():
+    closed = []
+    ws = FakeWebSocket(delay=1.0)
+    connection = OutboundConnection(ws, send_timeout=0.01, on_close=closed.append)
+    connection.start()
+
+    connection.send({"type": "bidding_started"})
+    await asyncio.sleep(0.05)
+
+    assert connection.closed
+    assert closed == [connection]
+    assert ws.closed_with == 1013
+    assert not connection.send({"type": "late"})
+
+
+@pytest.mark.asyncio
+async def test_broadcast_shares_one_encoded_frame():
+    from api.auction_room import AuctionRoom
+    from api.remote_participant import RemoteParticipant
+    from core.auction import Auction
+
+    room = AuctionRoom(Auction("a1", "Lega", 2))
+    sockets = [FakeWebSocket(), FakeWebSocket()]
+    for i, ws in enumerate(sockets):
+        room.join(RemoteParticipant(f"p{i}", f"Player {i}", ws))
+
+    queues = [p.connection._queue for p in room.participants.values()]
+    await room.broadcast({"type": "bidding_started", "payload": {"player": {"name": "N. Barella"}}})
+
+    first, second = (queue.get_nowait() for queue in queues)
+    assert isinstance(first, str)
+    assert first is second
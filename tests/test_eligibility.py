@@ -0,0 +1,91 @@
+from core.eligibility import EligibilityEngine
+from core.enums import PlayerRole
+from core.event_bus import EventBus
+from core.events import PlayerAssigned
+from core.player import Player
+from core.player_pool import PlayerPool
+from core.player_pool_builders.role_sequential_pool_builder import RoleSequentialPoolBuilder
+from core.team import Team
+from core.team_building_strategies.fixed_max_strategy import FixedMaxStrategy
+
+ROSTER = {PlayerRole.P: 1, PlayerRole.D: 1, PlayerRole.C: 0, PlayerRole.A: 1}
+PLAYERS = [
+    Player(1, "G. Donnarumma", PlayerRole.GOALKEEPER, "PSG"),
+    Player(2, "M. Maignan", PlayerRole.GOALKEEPER, "Milan"),
+    Player(3, "T. Hernandez", PlayerRole.DEFENDER, "Milan"),
+    Player(4, "N. Barella", PlayerRole.MIDFIELDER, "Inter"),
+    Player(5, "V. Osimhen", PlayerRole.FORWARD, "Napoli"),
+]
+
+
+def _setup(allow_duplicates: bool = False):
+    pool = PlayerPool(PLAYERS, allow_duplicates=allow_duplicates)
+    teams = [Team(1, "Team 1"), Team(2, "Team 2")]
+    strategy = FixedMaxStrategy(ROSTER)
+    for team in teams:
+        team.budget = 10
+        team.set_requirements(strategy.roles_remaining(team))
+    return pool, teams, EligibilityEngine(teams, pool, strategy)
+
+
+def _assign(pool, bus, team, player, price):
+    pool.assign_to_team(player, team, price)
+    team.spent += price
+    bus.publish(PlayerAssigned(team_id=team.id, team_name=team.name, player_id=player.player_id, player_name=player.name, price=price))
+
+
+def test_masks_follow_assignments_published_on_the_bus():
+    pool, (first, second), engine = _setup()
+    bus = EventBus()
+    engine.attach(bus)
+    keeper, other_keeper = PLAYERS[0], PLAYERS[1]
+
+    assert engine.eligible_teams(other_keeper) == [first, second]
+    # nessuna squadra ha posti da centrocampista
+    assert PLAYERS[3] not in engine.callable_players()
+
+    _assign(pool, bus, first, keeper, 3)
+    assert engine.capacity(first, PlayerRole.P) == 0
+    assert engine.eligible_teams(other_keeper) == [second]
+    assert engine.bidder_mask(keeper) == 0
+
+    # alla seconda resta 1 credito per due slot: non può più offrire il minimo
+    _assign(pool, bus, second, PLAYERS[2], 9)
+    assert not engine.can_bid(second, PLAYERS[4])
+    assert engine.can_bid(first, PLAYERS[4])
+    # il portiere servirebbe solo alla seconda, che non ha più crediti
+    assert engine.callable_roles() == [PlayerRole.DEFENDER, PlayerRole.FORWARD]
+
+
+def test_duplicates_exclude_only_the_teams_that_own_the_player():
+    pool, (first, second), engine = _setup(allow_duplicates=True)
+    bus = EventBus()
+    engine.attach(bus)
+    forward = PLAYERS[4]
+
+    _assign(pool, bus, first, forward, 1)
+    assert engine.eligible_teams(forward) == [second]
+    assert forward in engine.callable_players(PlayerRole.FORWARD)
+
+    pool.assign_to_team(forward, second, 1)
+    engine.rebuild()
+    assert forward not in engine.callable_players(PlayerRole.FORWARD)
+
+
+def test_role_sequential_builder_skips_closed_roles_without_recursion():
+    pool, teams, engine = _setup()
+    order = [PlayerRole.C, PlayerRole.P, PlayerRole.A]
+
+    builder = RoleSequentialPoolBuilder(order, engine.team_building, engine)
+    assert [p.player_id for p in builder.build_pool(pool.get_available(), teams)] == [1, 2]
+
+    for team, keeper in zip(teams, PLAYERS[:2]):
+        pool.assign_to_team(keeper, team, 1)
+        engine.record_assignment(team, keeper)
+    assert [p.player_id for p in builder.build_pool(pool.get_available(), teams)] == [5]
+
+    # senza motore lo stesso ordine, e nessun ruolo rimasto restituisce un pool vuoto
+    plain = RoleSequentialPoolBuilder(order, engine.team_building)
+    assert [p.player_id for p in plain.build_pool(pool.get_available(), teams)] == [5]
+    plain.current_role_index = len(order)
+    assert plain.build_pool(pool.get_available(), teams) == []
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from core.auction import Auction
+from core.event_bus import EventBus
+from core.events import AuctionEvent, BidPlaced, PlayerCalled
+
+
+def test_dispatch_by_string_class_and_wildcard():
+    auction = Auction("a1", "Lega", 2)
+    seen = []
+    auction.subscribe("bid_placed", lambda e: seen.append(("str", e.type)))
+    auction.subscribe(AuctionEvent, lambda e: seen.append(("base", e.type)))
+    auction.subscribe("*", lambda e: seen.append(("all", e.type)))
+
+    auction._publish(BidPlaced(team_id=1, team_name="Team 1", amount=5))
+    auction._publish(PlayerCalled(player_id=7, player_name="V. Osimhen", role="A"))
+
+    assert seen == [
+        ("str", "bid_placed"), ("base", "bid_placed"), ("all", "bid_placed"),
+        ("base", "player_called"), ("all", "player_called"),
+    ]
+
+
+def test_unsubscribe_invalidates_dispatch_table():
+    bus = EventBus()
+    seen = []
+    callback = seen.append
+    bus.subscribe(BidPlaced, callback)
+    bus.publish(BidPlaced(team_id=1, team_name="Team 1", amount=5))
+    bus.unsubscribe(BidPlaced, callback)
+    bus.publish(BidPlaced(team_id=1, team_name="Team 1", amount=6))
+
+    assert [e.amount for e in seen] == [5]
+    assert not bus.has_subscribers(BidPlaced)
+
+
+def test_events_are_slotted_with_lazy_payload():
+    event = BidPlaced(team_id=1, team_name="Team 1", amount=5)
+
+    assert not hasattr(event, "__dict__")
+    assert event.type == "bid_placed"
+    assert event.payload == {"team_id": 1, "team": "Team 1", "amount": 5}
+
+
+@pytest.mark.asyncio
+async def test_async_subscriber_receives_one_batch_per_tick_and_drops_oldest():
+    bus = EventBus()
+    batches = []
+
+    async def handler(events):
+        batches.append([e.amount for e in events])
+
+    subscriber = bus.subscribe_async("bid_placed", handler, max_queue=3)
+    for amount in range(5):
+        bus.publish(BidPlaced(team_id=1, team_name="Team 1", amount=amount))
+    assert batches == []
+
+    await asyncio.sleep(0)
+    await subscriber.drain()
+
+    assert batches == [[2, 3, 4]]
+    assert subscriber.stats() == {"pending": 0, "delivered": 3, "batches": 1, "dropped": 2, "errors": 0}
@@ -0,0 +1,56 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from api import metrics
+from api.main import app
+
+
+def test_histogram_and_counters_render_prometheus_text():
+    registry = metrics.Registry()
+    phases = metrics.Histogram("test_phase_seconds", "Phases.", ["phase"], buckets=(0.1, 1.0), registry=registry)
+    lots = metrics.Counter("test_lots_total", "Lots.", ["status"], registry=registry)
+    metrics.Gauge("test_rooms", "Rooms.", collect=lambda: 3, registry=registry)
+
+    turn = phases.labels("turn")
+    for value in (0.05, 0.5, 0.5, 5.0):
+        turn.observe(value)
+    lots.labels("won").inc()
+    lots.labels("won").inc(2)
+
+    text = registry.render()
+
+    assert "# TYPE test_phase_seconds histogram" in text
+    assert 'test_phase_seconds_bucket{phase="turn",le="0.1"} 1' in text
+    assert 'test_phase_seconds_bucket{phase="turn",le="1"} 3' in text
+    assert 'test_phase_seconds_bucket{phase="turn",le="+Inf"} 4' in text
+    assert 'test_phase_seconds_count{phase="turn"} 4' in text
+    assert 'test_lots_total{status="won"} 3' in text
+    assert "test_rooms 3" in text
+
+
+def test_metrics_endpoint_reports_rooms_connections_and_phases():
+    with TestClient(app) as client:
+        auction_id = client.post("/auctions/", json={"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4}).json()["auction_id"]
+        disconnects = metrics.DISCONNECTS.value()
+        with client.websocket_connect(f"/auctions/{auction_id}/ws") as ws:
+            ws.send_json({"type": "join", "payload": {"name": "Mario"}})
+            while ws.receive_json()["type"] != "joined":
+                pass
+            response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert 'fantapy_connections{kind="participant"} 1' in text
+        assert 'fantapy_rooms{state="idle"}' in text
+        assert "fantapy_pending_requests 0" in text
+        # join: un delta in broadcast e uno snapshot completo
+        assert 'fantapy_phase_seconds_count{phase="broadcast"}' in text
+        assert 'fantapy_phase_seconds_count{phase="snapshot"}' in text
+
+        # l'uscita del partecipante viene contata quando il server chiude il socket
+        deadline = time.monotonic() + 2
+        while metrics.DISCONNECTS.value() == disconnects and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert metrics.DISCONNECTS.value() == disconnects + 1
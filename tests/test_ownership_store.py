@@ -0,0 +1,99 @@
+from api.routers import auctions as auctions_router
+from core.eligibility import EligibilityEngine
+from core.enums import PlayerRole
+from core.market_rules import MultiCopyMarket, UniquePlayerMarket
+from core.ownership_policies import MaxCopiesOwnershipPolicy, NoDuplicatesOwnershipPolicy
+from core.ownership_store import OwnershipStore
+from core.player import Player
+from core.player_pool import PlayerPool
+from core.team import Team
+
+PLAYERS = [Player(pid, f"Player {pid}", PlayerRole.FORWARD, "Milan") for pid in (10, 20, 30)]
+
+
+def test_copy_and_team_bitsets_follow_registrations():
+    store = OwnershipStore([10, 20, 30])
+    store.register(1, 20)
+    store.register(2, 20)
+    store.register(1, 20)
+
+    assert store.copies(20) == 3 and store.team_copies(1, 20) == 2
+    assert store.player_ids(store.owned_mask(3)) == [20]
+    assert store.player_ids(store.available_mask()) == [10, 30]
+    assert store.player_ids(store.team_mask(1, 2)) == [20]
+    assert not store.can_own(1, 20, max_copies=2)
+    assert store.can_own(2, 20, max_copies=2)
+    # un giocatore mai visto non ha copie
+    assert store.is_available(99) and store.can_own(1, 99)
+    # can_take: entrambi i controlli in una volta, senza limite totale con None
+    assert not store.can_take(3, 20) and store.can_take(3, 20, max_copies=None)
+    assert not store.can_take(1, 20, max_copies=None) and store.can_take(1, 10)
+
+
+def test_market_rules_and_policies_share_the_store():
+    first, second = Team(1, "Team 1"), Team(2, "Team 2")
+    market = MultiCopyMarket(2)
+    policy = NoDuplicatesOwnershipPolicy(market.store)
+    player = PLAYERS[0]
+
+    market.register_assignment(first, player)
+    assert market.is_available(player)
+    assert not policy.can_own(first, player) and policy.can_own(second, player)
+    assert market.available_for_any_team(player, [first, second], policy)
+    assert not market.available_for_any_team(player, [first], policy)
+    assert market.available_for_any_team(player, [first], MaxCopiesOwnershipPolicy(2, market.store))
+
+    market.register_assignment(second, player)
+    assert not market.is_available(player)
+    assert not market.available_for_any_team(player, [first, second])
+
+
+def test_bulk_availability_covers_the_whole_pool():
+    first, second = Team(1, "Team 1"), Team(2, "Team 2")
+    unique = UniquePlayerMarket()
+    unique.register_assignment(first, PLAYERS[1])
+    assert unique.available_players(PLAYERS, [first, second]) == [PLAYERS[0], PLAYERS[2]]
+
+    multi = MultiCopyMarket(3)
+    for team in (first, second):
+        multi.register_assignment(team, PLAYERS[0])
+    multi.register_assignment(first, PLAYERS[2])
+    # il primo è già di entrambe: nessuna delle due può prenderlo di nuovo
+    assert multi.available_players(PLAYERS, [first, second]) == PLAYERS[1:]
+    assert multi.available_players(PLAYERS, [first]) == [PLAYERS[1]]
+    assert multi.available_players(PLAYERS, []) == []
+
+
+def test_room_pool_rules_and_eligibility_share_one_store():
+    data = auctions_router.AuctionCreate(name="Lega", nickname="host", budget=500, max_teams=2)
+    room = auctions_router._build_room("shared-store", data)
+    pool = room.auction.player_pool
+    first, second = room.auction.teams[1], room.auction.teams[2]
+    player = pool.get(7)
+
+    assert room.market_rule.store is pool.ownership is room.ownership_policy.store
+    assert pool.assign_to_team(player, first, 10)
+    room.eligibility.record_assignment(first, player)
+
+    # una sola registrazione, vista da tutti
+    assert pool.assigned_players == {7: [1]}
+    assert not room.market_rule.is_available(player)
+    assert not room.ownership_policy.can_own(first, player) and room.ownership_policy.can_own(second, player)
+    assert room.eligibility.bidder_mask(player) == 0
+    assert not pool.is_available_for_team(player, second)
+    assert player not in room.market_rule.available_players(pool.get_all(), [first, second])
+
+
+def test_clones_stay_callable_until_every_team_owns_one():
+    store = OwnershipStore()
+    pool = PlayerPool(PLAYERS, allow_duplicates=True, store=store)
+    first, second = Team(1, "Team 1"), Team(2, "Team 2")
+    engine = EligibilityEngine([first, second], pool, market_rule=MultiCopyMarket(2, store))
+
+    pool.assign_to_team(PLAYERS[0], first)
+    assert engine.eligible_teams(PLAYERS[0]) == [second]
+    assert PLAYERS[0] in engine.callable_players()
+    pool.assign_to_team(PLAYERS[0], second)
+    assert engine.eligible_teams(PLAYERS[0]) == []
+    assert PLAYERS[0] not in engine.callable_players()
+    assert store.owners(PLAYERS[0].player_id) == [1, 2]
@@ -0,0 +1,48 @@
+import pytest
+
+from core.enums import PlayerRole
+from core.player import Player
+from core.player_catalog import PlayerCatalog
+from core.player_pool import PlayerPool
+from core.team import Team
+
+
+def _catalog():
+    return PlayerCatalog.from_players([
+        Player(7, "V. Osimhen", PlayerRole.FORWARD, "Napoli"),
+        Player(2, "T. Hernandez", PlayerRole.DEFENDER, "Milan"),
+        Player(8, "R. Leão", PlayerRole.FORWARD, "Milan"),
+    ])
+
+
+def test_views_expose_player_attributes():
+    catalog = _catalog()
+    leao = catalog.get(8)
+
+    assert (leao.player_id, leao.name, leao.role, leao.realTeam) == (8, "R. Leão", PlayerRole.FORWARD, "Milan")
+    assert catalog.get(99) is None
+    assert catalog.real_teams == ["Napoli", "Milan"]
+
+
+def test_column_filters():
+    catalog = _catalog()
+
+    assert [p.player_id for p in catalog.filter(role=PlayerRole.A)] == [7, 8]
+    assert [p.player_id for p in catalog.filter(real_team="Milan")] == [2, 8]
+    assert [p.player_id for p in catalog.filter(role=PlayerRole.A, real_team="Milan")] == [8]
+    assert catalog.filter(real_team="Inter") == []
+
+
+def test_duplicate_ids_are_rejected():
+    catalog = _catalog()
+    with pytest.raises(ValueError):
+        catalog.add(7, "Altro", PlayerRole.FORWARD, "Napoli")
+
+
+def test_views_work_inside_player_pool():
+    pool = PlayerPool(_catalog().players())
+    team = Team(1, "Team 1")
+
+    assert pool.assign_to_team(pool.get(2), team, 5)
+    assert [p.name for p in pool.get_available_by_role(PlayerRole.FORWARD)] == ["V. Osimhen", "R. Leão"]
+    assert team.count_by_role(PlayerRole.DEFENDER) == 1
@@ -0,0 +1,137 @@
+import io
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.routers.auctions as auctions_router
+from api.main import app
+from core.enums import PlayerRole
+from core.player_import import (
+    MAX_RECORD_CHARS,
+    CsvRowReader,
+    JsonRowReader,
+    PlayerImportError,
+    PlayerImporter,
+    import_players,
+)
+from core.player_pool import PlayerPool
+
+
+CSV_LISTONE = (
+    "Id;R;Nome;Squadra\r\n"
+    "1;P;G. Donnarumma;PSG\r\n"
+    "2;Df;T. Hernandez;Milan\r\n"
+    "3;Cc;N. Barella;Inter\r\n"
+    "4;X;Sconosciuto;Inter\r\n"
+    "3;A;Duplicato;Inter\r\n"
+    "8;attaccante;R. Leão;Milan\r\n"
+)
+
+
+def test_csv_import_maps_role_aliases_and_reports_errors():
+    pool = PlayerPool()
+    report = import_players(pool, io.StringIO(CSV_LISTONE), read_size=7, chunk_size=2)
+
+    assert report.imported == 4
+    assert report.rejected == 2
+    assert report.errors == ["row 5: unknown role 'X'", "row 6: duplicate id 3"]
+    assert [p.role for p in pool.get_all()] == [
+        PlayerRole.GOALKEEPER,
+        PlayerRole.DEFENDER,
+        PlayerRole.MIDFIELDER,
+        PlayerRole.FORWARD,
+    ]
+    assert pool.get(8).realTeam == "Milan"
+
+
+def test_json_array_split_across_chunks():
+    pool = PlayerPool()
+    importer = PlayerImporter(pool, JsonRowReader())
+    document = '[{"id": 7, "name": "V. Osimhen", "role": "A", "team": "Napoli"}, {"id": 5, "nome": "N. Barella", "ruolo": "C", "squadra": "Inter"}]'
+    for i in range(0, len(document), 10):
+        importer.feed(document[i:i + 10])
+    report = importer.close()
+
+    assert report.imported == 2
+    assert [p.name for p in pool.get_all()] == ["V. Osimhen", "N. Barella"]
+
+
+def test_json_lines_import():
+    pool = PlayerPool()
+    lines = '{"id": 1, "name": "A", "role": "P", "team": "X"}\n{"id": 2, "name": "B", "role": "D", "team": "Y"}\n'
+    report = import_players(pool, io.StringIO(lines), fmt="jsonl")
+    assert report.imported == 2
+
+
+def test_missing_columns_and_truncated_documents_fail():
+    with pytest.raises(PlayerImportError):
+        CsvRowReader().feed("Id;Nome\n1;Mario\n")
+
+    reader = JsonRowReader()
+    reader.feed('[{"id": 1, "name": "A"')
+    with pytest.raises(PlayerImportError):
+        reader.close()
+
+
+def test_csv_quoted_field_may_contain_newlines_across_chunks():
+    pool = PlayerPool()
+    document = 'id,name,role,team\n1,"Donnarumma\nGianluigi",P,PSG\n2,"T. ""Theo"" Hernandez",D,Milan\n'
+    report = import_players(pool, io.StringIO(document), read_size=5)
+
+    assert report.imported == 2 and report.rejected == 0
+    assert pool.get(1).name == "Donnarumma\nGianluigi"
+    assert pool.get(2).name == 'T. "Theo" Hernandez'
+
+
+def test_unterminated_records_do_not_buffer_the_whole_upload():
+    reader = JsonRowReader()
+    reader.feed('[{"id": 1, "name": "A" ')
+    with pytest.raises(PlayerImportError):
+        for _ in range(MAX_RECORD_CHARS // 1000 + 1):
+            reader.feed(" " * 1000)
+
+    reader = CsvRowReader()
+    reader.feed('id,name,role,team\n1,"A')
+    with pytest.raises(PlayerImportError):
+        reader.feed("x" * MAX_RECORD_CHARS)
+
+
+def test_bad_item_stops_the_import_after_the_committed_batches():
+    pool = PlayerPool()
+    importer = PlayerImporter(pool, JsonRowReader(), chunk_size=2)
+    importer.feed('[{"id": 1, "name": "A", "role": "P", "team": "X"}, {"id": 2, "name": "B", "role": "D", "team": "X"},')
+    importer.feed('{"id": 3, "name": "C", "role": "C", "team": "X"},')
+    with pytest.raises(PlayerImportError):
+        importer.feed("7]")
+
+    # il blocco completo è nel pool, quello in corso è scartato
+    assert importer.report.imported == 2
+    assert [p.player_id for p in pool.get_all()] == [1, 2]
+
+
+def test_route_reports_a_partial_import():
+    with TestClient(app) as client:
+        auction_id = client.post("/auctions/", json={"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4}).json()["auction_id"]
+        response = client.post(f"/auctions/{auction_id}/players/import?format=json", content='[{"id": 1, "name": "A", "role": "P", "team": "X"}, 7]')
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == {
+        "error": "Expected a JSON object at item 2",
+        "partial": True,
+        "imported": 0,
+        "rejected": 0,
+        "errors": [],
+    }
+
+
+def test_auction_created_for_import_starts_with_an_empty_pool():
+    with TestClient(app) as client:
+        auction_id = client.post("/auctions/", json={"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4, "seed_players": False}).json()["auction_id"]
+        csv = "id,name,role,team\n" + "".join(f"{i},Giocatore {i},A,X\n" for i in range(1, 13))
+        response = client.post(f"/auctions/{auction_id}/players/import", content=csv)
+        pool = auctions_router.auctions[auction_id].auction.player_pool
+
+    assert response.status_code == 200
+    assert response.json()["imported"] == 12
+    assert response.json()["rejected"] == 0
+    assert sorted(p.player_id for p in pool.get_all()) == list(range(1, 13))
@@ -0,0 +1,76 @@
+from core.enums import PlayerRole
+from core.player import Player
+from core.player_pool import PlayerPool
+from core.team import Team
+
+
+def _players():
+    return [
+        Player(1, "G. Donnarumma", PlayerRole.GOALKEEPER, "PSG"),
+        Player(2, "T. Hernandez", PlayerRole.DEFENDER, "Milan"),
+        Player(3, "N. Barella", PlayerRole.MIDFIELDER, "Inter"),
+        Player(4, "R. Leão", PlayerRole.FORWARD, "Milan"),
+    ]
+
+
+def test_assign_removes_player_from_available_indexes():
+    pool = PlayerPool(_players())
+    team = Team(1, "Team 1")
+
+    assert pool.assign_to_team(pool.get(2), team, 10)
+
+    assert [p.player_id for p in pool.get_available()] == [1, 3, 4]
+    assert pool.get_available_by_role(PlayerRole.DEFENDER) == []
+    assert not pool.is_available(pool.get(2))
+    assert pool.available_count() == 3
+    assert [p.player_id for p in pool.get_team_players(team.id)] == [2]
+    # gli indici statici non cambiano
+    assert [p.player_id for p in pool.get_by_role(PlayerRole.D)] == [2]
+    assert [p.player_id for p in pool.get_by_real_team("Milan")] == [2, 4]
+
+
+def test_assign_rejects_duplicates_without_allow_duplicates():
+    pool = PlayerPool(_players())
+    first, second = Team(1, "Team 1"), Team(2, "Team 2")
+
+    assert pool.assign_to_team(pool.get(4), first)
+    assert not pool.assign_to_team(pool.get(4), second)
+    assert not pool.is_available_for_team(pool.get(4), second)
+    assert pool.assigned_players == {4: [1]}
+
+
+def test_allow_duplicates_keeps_players_available():
+    pool = PlayerPool(_players(), allow_duplicates=True)
+    first, second = Team(1, "Team 1"), Team(2, "Team 2")
+
+    assert pool.assign_to_team(pool.get(4), first)
+    assert pool.assign_to_team(pool.get(4), second)
+    assert not pool.assign_to_team(pool.get(4), first)
+
+    assert len(pool.get_available()) == 4
+    assert pool.is_available(pool.get(4))
+    assert not pool.is_available_for_team(pool.get(4), first)
+    assert pool.assigned_players == {4: [1, 2]}
+
+
+def test_changes_since_reports_availability_diffs():
+    pool = PlayerPool(_players())
+    team = Team(1, "Team 1")
+    base = pool.version
+
+    pool.assign_to_team(pool.get(3), team)
+    pool.add_player(Player(9, "D. Frattesi", PlayerRole.MIDFIELDER, "Inter"))
+
+    assert pool.changes_since(base) == ([9], [3])
+    assert pool.changes_since(pool.version) == ([], [])
+    assert pool.changes_since(pool.version + 1) is None
+
+
+def test_changes_since_needs_full_pool_when_journal_is_truncated():
+    pool = PlayerPool()
+    pool.JOURNAL_SIZE = 2
+    pool._journal = type(pool._journal)(maxlen=2)
+    pool.add_players(_players())
+
+    assert pool.changes_since(0) is None
+    assert pool.changes_since(2) == ([3, 4], [])
@@ -0,0 +1,80 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from core.enums import PlayerRole
+from core.player import Player
+from core.player_pool import PlayerPool
+from core.player_search import InvalidCursor, normalize
+from core.team import Team
+
+
+def _pool():
+    return PlayerPool([
+        Player(1, "G. Donnarumma", PlayerRole.GOALKEEPER, "PSG"),
+        Player(2, "T. Hernandez", PlayerRole.DEFENDER, "Milan"),
+        Player(3, "N. Barella", PlayerRole.MIDFIELDER, "Inter"),
+        Player(4, "R. Leão", PlayerRole.FORWARD, "Milan"),
+        Player(5, "Rafael Leão Jr", PlayerRole.FORWARD, "Lille"),
+    ])
+
+
+def _ids(page):
+    return [p.player_id for p in page.players]
+
+
+def test_prefix_and_substring_matches_are_ranked():
+    pool = _pool()
+
+    assert normalize("R. Leão") == "r leao"
+    # nome che inizia con la query, poi parole che iniziano con la query
+    assert _ids(pool.search("leao")) == [4, 5]
+    assert _ids(pool.search("r. le")) == [4, 5]
+    assert _ids(pool.search("rella")) == [3]
+    assert _ids(pool.search("xyz")) == []
+
+
+def test_filters_and_incremental_updates():
+    pool = _pool()
+    assert _ids(pool.search("", real_team="milan")) == [4, 2]
+    assert _ids(pool.search("", role=PlayerRole.A, real_team="Lille")) == [5]
+
+    pool.assign_to_team(pool.get(4), Team(1, "Team 1"), 10)
+    assert _ids(pool.search("leao", available=True)) == [5]
+    assert _ids(pool.search("leao", available=False)) == [4]
+
+    # un giocatore importato dopo la prima ricerca entra nell'indice
+    pool.add_player(Player(6, "L. Leoni", PlayerRole.DEFENDER, "Liverpool"))
+    assert _ids(pool.search("le")) == [6, 4, 5]
+
+
+def test_cursor_pages_cover_every_result_once():
+    pool = _pool()
+    seen, cursor = [], None
+    while True:
+        page = pool.search("", limit=2, cursor=cursor)
+        seen.extend(_ids(page))
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert sorted(seen) == [1, 2, 3, 4, 5] and len(seen) == 5
+
+    with pytest.raises(InvalidCursor):
+        pool.search("", cursor="not-a-cursor")
+
+
+def test_players_route_searches_the_auction_pool():
+    with TestClient(app) as client:
+        auction_id = client.post("/auctions/", json={"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4}).json()["auction_id"]
+
+        body = client.get(f"/auctions/{auction_id}/players", params={"q": "ber", "role": "A", "limit": 5}).json()
+        assert [p["name"] for p in body["players"]] == ["D. Berardi"]
+        assert body["players"][0]["available"] is True and body["next_cursor"] is None
+
+        first = client.get(f"/auctions/{auction_id}/players", params={"team": "milan", "limit": 1}).json()
+        second = client.get(f"/auctions/{auction_id}/players", params={"team": "milan", "limit": 1, "cursor": first["next_cursor"]}).json()
+        assert [p["name"] for p in first["players"] + second["players"]] == ["R. Leão", "T. Hernandez"]
+
+        assert client.get(f"/auctions/{auction_id}/players", params={"role": "X"}).status_code == 400
+        assert client.get(f"/auctions/{auction_id}/players", params={"cursor": "!!"}).status_code == 400
+        assert client.get("/auctions/missing/players").status_code == 404
@@ -0,0 +1,90 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from api import profiler
+from api.main import app
+from api.routers import admin
+from core.simulation import DEFAULT_ROSTER, AuctionSimulation, generate_players
+
+TOKEN = "segreto"
+
+PLAYERS = generate_players({role: count * 8 * 2 for role, count in DEFAULT_ROSTER.items()})
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.process_time() + seconds
+    seed = 0
+    while time.process_time() < deadline:
+        AuctionSimulation(PLAYERS, seed=seed).run()
+        seed += 1
+
+
+def test_samples_are_collapsed_and_tagged_by_auction():
+    sampler = profiler.SamplingProfiler(interval=0.001)
+    token = profiler.current_auction_id.set("lega-1")
+    sampler.start()
+    try:
+        _busy(0.3)
+    finally:
+        sampler.stop()
+        profiler.current_auction_id.reset(token)
+
+    assert sampler.total > 0
+    lines = sampler.collapsed().splitlines()
+    assert any(line.startswith("auction:lega-1;") and "core.simulation:AuctionSimulation.run" in line for line in lines)
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert sampler.by_auction().keys() == {"lega-1"}
+
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    monkeypatch.setattr(admin, "admin_token", TOKEN)
+    return TOKEN
+
+
+async def test_admin_profile_route_returns_stacks_of_running_auctions(admin_token):
+    async def auction_task():
+        profiler.current_auction_id.set("lega-2")
+        for _ in range(20):
+            _busy(0.02)
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(auction_task())
+    result = await admin.profile(seconds=0.3, interval=0.001, fmt="json", x_admin_token=admin_token)
+    await task
+
+    assert result["samples"] > 0
+    assert result["by_auction"]["lega-2"] > 0
+    assert "auction:lega-2;" in result["collapsed"]
+    # a profilo concluso l'handler è rimosso e se ne può avviare un altro
+    profiler.stop(profiler.start())
+
+
+async def test_admin_profile_rejects_concurrent_profiles(admin_token):
+    running = profiler.start()
+    try:
+        with pytest.raises(HTTPException) as exc:
+            await admin.profile(seconds=0.1, interval=0.01, fmt="collapsed", x_admin_token=admin_token)
+        assert exc.value.status_code == 409
+    finally:
+        profiler.stop(running)
+
+
+def test_admin_profile_is_off_without_a_token_and_checks_it_when_set(monkeypatch):
+    with TestClient(app) as client:
+        assert client.post("/admin/profile?seconds=0.01").status_code == 404
+
+        monkeypatch.setattr(admin, "admin_token", TOKEN)
+        assert client.post("/admin/profile?seconds=0.01").status_code == 403
+        assert client.post("/admin/profile?seconds=0.01", headers={"X-Admin-Token": "altro"}).status_code == 403
+        # token giusto: si arriva alla validazione dei parametri (il profilo vero e
+        # proprio richiede il thread principale, vedi i test sopra)
+        response = client.post("/admin/profile?seconds=0.01&format=svg", headers={"X-Admin-Token": TOKEN})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unsupported format: svg"
@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.checkpoint import read_checkpoint
+from api.event_log import EventLog, read_log
+from api.main import app
+from api.recovery import recover_auctions
+from api.routers import auctions as auctions_router
+from core.event_bus import EventBus
+from core.events import BidPlaced, ParticipantJoined
+
+
+def _receive_until(ws, msg_type):
+    while True:
+        message = ws.receive_json()
+        if message["type"] == msg_type:
+            return message
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(auctions_router, "event_log_dir", str(tmp_path))
+    monkeypatch.setattr(auctions_router, "auctions", {})
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_events_published_in_a_burst_share_one_commit(tmp_path):
+    bus = EventBus()
+    log = EventLog(str(tmp_path / "a.jsonl"))
+    log.attach(bus)
+
+    for amount in range(50):
+        bus.publish(BidPlaced(team_id=1, team_name="Team 1", amount=amount))
+    await asyncio.sleep(0)
+    bus.publish(ParticipantJoined(participant_id="p1", name="Mario"))
+    await log.close()
+
+    events, end = read_log(str(tmp_path / "a.jsonl"))
+    assert [seq for seq, _ in events] == list(range(1, 52))
+    assert events[-1][1] == ParticipantJoined(participant_id="p1", name="Mario")
+    assert log.commits == 2
+    assert end == (tmp_path / "a.jsonl").stat().st_size
+
+
+def test_read_log_skips_a_torn_last_line(tmp_path):
+    path = tmp_path / "a.jsonl"
+    record = {"seq": 1, "type": "participant_left", "data": {"participant_id": "p1"}}
+    path.write_text(json.dumps(record) + "\n" + '{"seq": 2, "ty')
+
+    events, end = read_log(str(path))
+
+    assert len(events) == 1
+    assert end == len(json.dumps(record)) + 1
+
+
+def test_restart_rebuilds_rosters_and_lets_participants_resume(log_dir):
+    with TestClient(app) as client:
+        auction_id = client.post("/auctions/", json={"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4, "bid_timeout": 5}).json()["auction_id"]
+        client.post(f"/auctions/{auction_id}/players/import?format=csv", content="id,name,role,team\n20,K. Yildiz,A,Juventus\n")
+        with client.websocket_connect(f"/auctions/{auction_id}/ws") as ws:
+            ws.send_json({"type": "join", "payload": {"name": "Mario"}})
+            participant_id = _receive_until(ws, "joined")["payload"]["id"]
+            client.post(f"/auctions/{auction_id}/assign", json={"participant_id": participant_id, "team_id": 2})
+            client.post(f"/auctions/{auction_id}/start")
+
+            request = _receive_until(ws, "choose_player_request")
+            ws.send_json({"type": "choose_player_response", "participant_id": participant_id, "request_id": request["request_id"], "player_id": 20})
+            request = _receive_until(ws, "place_bid_request")
+            ws.send_json({"type": "place_bid_response", "participant_id": participant_id, "request_id": request["request_id"], "amount": 42})
+            assert _receive_until(ws, "bidding_result")["payload"]["status"] == "won"
+
+    # riavvio: la stanza viene ricostruita solo dal log
+    auctions_router.auctions.clear()
+    with TestClient(app) as client:
+        snapshot = client.get(f"/auctions/{auction_id}").json()["auction"]
+        team = next(t for t in snapshot["teams"] if t["id"] == 2)
+        assert [p["name"] for p in team["players"]] == ["K. Yildiz"]
+        assert team["budget"] == 42
+        assert snapshot["started"] is False
+        assert len(client.get(f"/auctions/{auction_id}/pool").json()["players"]) == 8
+
+        with client.websocket_connect(f"/auctions/{auction_id}/ws") as ws:
+            ws.send_json({"type": "join", "payload": {"name": "Mario", "participant_id": participant_id}})
+            joined = _receive_until(ws, "joined")["payload"]
+            assert joined == {"id": participant_id, "name": "Mario", "resumed": True}
+            assert client.get(f"/auctions/{auction_id}").json()["participants"][0]["assigned_teams"] == ["2"]
+
+
+def test_restart_loads_checkpoint_and_replays_only_the_tail(log_dir, monkeypatch):
+    monkeypatch.setattr(auctions_router, "checkpoint_every", 2)
+    with TestClient(app) as client:
+        auction_id = client.post("/auctions/", json={"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4}).json()["auction_id"]
+        with client.websocket_connect(f"/auctions/{auction_id}/ws") as ws:
+            ws.send_json({"type": "join", "payload": {"name": "Mario"}})
+            participant_id = _receive_until(ws, "joined")["payload"]["id"]
+            client.post(f"/auctions/{auction_id}/assign", json={"participant_id": participant_id, "team_id": 3})
+
+    log_path = log_dir / f"{auction_id}.jsonl"
+    state = read_checkpoint(str(log_dir / f"{auction_id}.ckpt"))
+    # lo shutdown scrive un checkpoint finale allineato alla fine del log
+    assert state["seq"] == len(log_path.read_text().splitlines())
+    assert state["offset"] == log_path.stat().st_size
+    assert state["participants"][participant_id] == {"name": "Mario", "team_ids": [3]}
+
+    # un evento scritto dopo il checkpoint viene riletto dalla coda del log
+    tail = {"seq": state["seq"] + 1, "type": "player_assigned", "data": {"team_id": 3, "team_name": "Team 3", "player_id": 5, "player_name": "N. Barella", "price": 17}}
+    with open(log_path, "a") as f:
+        f.write(json.dumps(tail) + "\n")
+
+    auctions_router.auctions.clear()
+    with TestClient(app) as client:
+        team = next(t for t in client.get(f"/auctions/{auction_id}").json()["auction"]["teams"] if t["id"] == 3)
+        assert [p["name"] for p in team["players"]] == ["N. Barella"]
+        assert team["budget"] == 17
+        assert auctions_router.auctions[auction_id].event_log.seq == state["seq"] + 1
+
+
+def test_auction_ids_cannot_escape_the_log_directory(log_dir, monkeypatch):
+    monkeypatch.setattr(auctions_router, "event_log_dir", str(log_dir / "logs"))
+    body = {"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4}
+
+    with TestClient(app) as client:
+        for auction_id in ("../../pwned", "a/b", "..", "", "x" * 65):
+            assert client.post("/auctions/", json={**body, "auction_id": auction_id}).status_code == 422
+        assert client.post("/auctions/", json={**body, "auction_id": "Lega_2025-a"}).status_code == 200
+
+    # solo il log dell'asta valida, dentro la directory configurata
+    assert sorted(str(p.relative_to(log_dir)) for p in log_dir.rglob("*") if p.is_file()) == [
+        "logs/Lega_2025-a.ckpt",
+        "logs/Lega_2025-a.jsonl",
+    ]
+    with pytest.raises(ValueError):
+        auctions_router.event_log_base_path("../pwned")
+
+
+def test_recovery_skips_files_that_are_not_auction_ids(log_dir):
+    record = {"seq": 1, "type": "auction_created", "data": {"auction_id": "x.y", "name": "Lega", "max_teams": 2, "options": {}}}
+    (log_dir / "x.y.jsonl").write_text(json.dumps(record) + "\n")
+
+    assert recover_auctions() == []
+    assert auctions_router.auctions == {}
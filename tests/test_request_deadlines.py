@@ -0,0 +1,74 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from api.request_deadlines import EXPIRED, RequestDeadlines
+from api.routers import auctions as auctions_router
+
+
+@pytest.mark.asyncio
+async def test_sweep_expires_only_unanswered_requests_in_deadline_order():
+    deadlines = RequestDeadlines()
+    loop = asyncio.get_running_loop()
+    slow, answered, fast = loop.create_future(), loop.create_future(), loop.create_future()
+
+    deadlines.register("slow", slow, 0.1)
+    deadlines.register("answered", answered, 0.02)
+    deadlines.register("fast", fast, 0.03)
+    answered.set_result({"type": "place_bid_response"})
+
+    assert await fast is EXPIRED
+    assert not slow.done()
+    assert deadlines.stats() == {"pending": 1, "expired": 1, "late": 0, "orphaned": 0}
+
+    assert await slow is EXPIRED
+    assert deadlines.expired == 2
+    assert deadlines.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_unmatched_responses_are_counted_as_late_or_orphaned():
+    deadlines = RequestDeadlines()
+    future = asyncio.get_running_loop().create_future()
+    deadlines.register("r1", future, 0.01)
+    await future
+
+    deadlines.note_unmatched("r1")
+    deadlines.note_unmatched("never-sent")
+
+    assert (deadlines.late, deadlines.orphaned) == (1, 1)
+    deadlines.close()
+
+
+class _SilentBidder:
+    """Partecipante senza scadenze per richiesta (es. aggiunto fuori da auction_ws)."""
+
+    def __init__(self, team):
+        self.id, self.name, self.team = "silent", "Silent", team
+        self.frames = []
+        self.connection = SimpleNamespace(send=self.frames.append)
+        self.cancelled = False
+
+    async def get_bid(self, player):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+@pytest.mark.asyncio
+async def test_lot_is_closed_by_the_backstop_without_request_deadlines(monkeypatch):
+    monkeypatch.setattr(auctions_router, "BID_DEADLINE_GRACE", 0.05)
+    data = auctions_router.AuctionCreate(name="Lega", nickname="host", budget=500, max_teams=2, bid_timeout=0.05)
+    room = auctions_router._build_room("backstop", data)
+    bidder = _SilentBidder(next(iter(room.auction.teams.values())))
+    room.participants[bidder.id] = bidder
+    player = room.auction.player_pool.get_available()[0]
+
+    winner = await asyncio.wait_for(auctions_router._run_bidding_phase(room, player), 1)
+
+    assert winner is None
+    assert bidder.cancelled
+    assert '"no_bids"' in bidder.frames[-1]
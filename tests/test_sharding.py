@@ -0,0 +1,118 @@
+import threading
+import time
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.routers import auctions as auctions_router
+from api.sharding import ShardConfig, create_proxy_app, shard_for
+
+
+def _fake_shard(index: int) -> FastAPI:
+    shard_app = FastAPI()
+    created = {}
+
+    @shard_app.get("/auctions/")
+    def list_auctions():
+        return [{"auction_id": auction_id, "shard": index} for auction_id in created]
+
+    @shard_app.post("/auctions/")
+    async def create_auction(request: Request):
+        body = await request.json()
+        created[body["auction_id"]] = body
+        return {"auction_id": body["auction_id"], "shard": index}
+
+    @shard_app.post("/auctions/{auction_id}/players/import")
+    async def import_players(auction_id: str, request: Request, format: str = "csv"):
+        return {"auction_id": auction_id, "shard": index, "format": format, "bytes": len(await request.body())}
+
+    return shard_app
+
+
+def test_shard_for_is_stable_and_spreads_ids():
+    ids = [f"auction-{i}" for i in range(200)]
+
+    assert [shard_for(i, 4) for i in ids] == [shard_for(i, 4) for i in ids]
+    assert {shard_for(i, 4) for i in ids} == {0, 1, 2, 3}
+    assert ShardConfig(1, 4).owns("x") == (shard_for("x", 4) == 1)
+    assert ShardConfig().owns("x")
+
+
+def test_proxy_routes_by_auction_id_and_aggregates_lists():
+    shards = [_fake_shard(i) for i in range(3)]
+    proxy = create_proxy_app(
+        ["unused"] * 3,
+        transports=[httpx.ASGITransport(app=shard_app) for shard_app in shards],
+    )
+    with TestClient(proxy) as client:
+        created = [client.post("/auctions/", json={"name": f"Lega {i}"}).json() for i in range(12)]
+        for auction in created:
+            assert auction["shard"] == shard_for(auction["auction_id"], 3)
+
+        listed = client.get("/auctions/").json()
+        assert sorted(a["auction_id"] for a in listed) == sorted(a["auction_id"] for a in created)
+
+        auction_id = created[0]["auction_id"]
+        response = client.post(f"/auctions/{auction_id}/players/import?format=json", content=b"[]")
+        assert response.json() == {"auction_id": auction_id, "shard": shard_for(auction_id, 3), "format": "json", "bytes": 2}
+
+
+def test_proxy_rejects_auction_ids_that_are_not_safe_file_names():
+    shards = [_fake_shard(i) for i in range(2)]
+    proxy = create_proxy_app(["unused"] * 2, transports=[httpx.ASGITransport(app=shard_app) for shard_app in shards])
+    with TestClient(proxy) as client:
+        assert client.post("/auctions/", json={"name": "Lega", "auction_id": "../../pwned"}).status_code == 422
+        assert client.post("/auctions/", json=["not", "an", "object"]).status_code == 422
+        assert client.post("/auctions/", json={"name": "Lega", "auction_id": "lega-1"}).json()["auction_id"] == "lega-1"
+        assert client.get("/auctions/").json() == [{"auction_id": "lega-1", "shard": shard_for("lega-1", 2)}]
+
+
+@pytest.fixture
+def ws_shard(tmp_path):
+    """Shard vero su socket unix: i WebSocket del proxy passano da unix_connect."""
+    shard_app = FastAPI()
+
+    @shard_app.websocket("/auctions/{auction_id}/{channel}")
+    async def echo(ws: WebSocket, auction_id: str, channel: str):
+        await ws.accept()
+        await ws.send_json({"auction_id": auction_id, "channel": channel, "query": ws.url.query})
+        await ws.send_json({"echo": await ws.receive_json()})
+        await ws.close()
+
+    socket_path = str(tmp_path / "shard.sock")
+    server = uvicorn.Server(uvicorn.Config(shard_app, uds=socket_path, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not server.started and time.monotonic() < deadline:
+        time.sleep(0.01)
+    yield socket_path
+    server.should_exit = True
+    thread.join(5)
+
+
+def test_proxy_forwards_participant_and_spectator_sockets(ws_shard):
+    proxy = create_proxy_app([ws_shard])
+    with TestClient(proxy) as client:
+        for channel in ("ws", "spectate"):
+            with client.websocket_connect(f"/auctions/lega-1/{channel}?fps=5") as ws:
+                assert ws.receive_json() == {"auction_id": "lega-1", "channel": channel, "query": "fps=5"}
+                ws.send_json({"type": "resync"})
+                assert ws.receive_json() == {"echo": {"type": "resync"}}
+
+
+def test_worker_rejects_auctions_owned_by_another_shard(monkeypatch):
+    monkeypatch.setattr(auctions_router, "shard", ShardConfig(0, 2))
+    foreign = next(f"id-{i}" for i in range(100) if shard_for(f"id-{i}", 2) == 1)
+    own = next(f"id-{i}" for i in range(100) if shard_for(f"id-{i}", 2) == 0)
+    body = {"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4}
+
+    with TestClient(app) as client:
+        assert client.post("/auctions/", json={**body, "auction_id": foreign}).status_code == 421
+        assert client.post("/auctions/", json={**body, "auction_id": own}).json()["auction_id"] == own
+        assert client.post("/auctions/", json={**body, "auction_id": own}).status_code == 409
+    auctions_router.auctions.pop(own, None)
@@ -0,0 +1,76 @@
+from core.enums import PlayerRole
+from core.event_bus import EventBus
+from core.events import PlayerAssigned
+from core.market_rules import MultiCopyMarket
+from core.ownership_policies import MaxCopiesOwnershipPolicy
+from core.simulation import DEFAULT_ROSTER, AuctionSimulation, generate_players, simulate_many
+from core.team_building_strategies.fixed_max_strategy import FixedMaxStrategy
+
+PLAYERS = generate_players({role: count * 8 * 2 for role, count in DEFAULT_ROSTER.items()})
+
+
+def test_same_seed_same_auction():
+    first = AuctionSimulation(PLAYERS, seed=42).run().summary()
+    second = AuctionSimulation(PLAYERS, seed=42).run().summary()
+    other = AuctionSimulation(PLAYERS, seed=43).run().summary()
+
+    assert first == second
+    assert first != other
+
+
+def test_every_team_completes_its_roster_within_budget():
+    result = AuctionSimulation(PLAYERS, seed=1).run()
+
+    assert result.complete
+    assert result.lots == 8 * sum(DEFAULT_ROSTER.values())
+    owned = [p.player_id for team in result.teams for p in team.roster]
+    assert len(owned) == len(set(owned))
+    for team in result.teams:
+        assert team.spent <= team.budget
+        assert all(team.count_by_role(role) == count for role, count in DEFAULT_ROSTER.items())
+
+
+async def test_async_path_matches_sync_path():
+    sync = AuctionSimulation(PLAYERS, seed=5).run().summary()
+    async_ = (await AuctionSimulation(PLAYERS, seed=5).run_async()).summary()
+
+    assert sync == async_
+
+
+def test_multi_copy_market_allows_the_same_player_on_two_teams():
+    # un solo giocatore per ruolo, ma due copie: ogni squadra ha un posto per ruolo
+    players = generate_players({role: 1 for role in DEFAULT_ROSTER})
+    simulation = AuctionSimulation(
+        players,
+        teams=2,
+        market_rule=MultiCopyMarket(2),
+        ownership_policy=MaxCopiesOwnershipPolicy(1),
+        team_building=FixedMaxStrategy({role: 1 for role in DEFAULT_ROSTER}),
+    )
+
+    result = simulation.run()
+
+    assert result.complete
+    assert len(result.teams[0].roster) == 4
+    assert sorted(p.player_id for p in result.teams[0].roster) == sorted(p.player_id for p in result.teams[1].roster)
+
+
+def test_assignments_are_published_and_lots_can_be_capped():
+    events = EventBus()
+    assigned = []
+    events.subscribe(PlayerAssigned, assigned.append)
+
+    result = AuctionSimulation(PLAYERS, seed=2, events=events, max_lots=10).run()
+
+    assert result.lots == 10
+    assert not result.complete
+    assert len(assigned) == 10
+    assert sum(e.price for e in assigned) == sum(team.spent for team in result.teams)
+
+
+def test_simulate_many_returns_one_summary_per_seed():
+    summaries = simulate_many(PLAYERS, range(3))
+
+    assert [s["seed"] for s in summaries] == [0, 1, 2]
+    assert summaries[1] == AuctionSimulation(PLAYERS, seed=1).run().summary()
+    assert all(s["teams"][0]["roles"][PlayerRole.GOALKEEPER.name] == 3 for s in summaries)
@@ -0,0 +1,61 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.spectators import SpectatorRelay
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, frame):
+        self.frames.append(frame)
+
+    async def close(self, code=1000):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_updates_are_coalesced_and_encoded_once_for_all_viewers():
+    snapshots = []
+    relay = SpectatorRelay(lambda: snapshots.append(1) or {"type": "auction_snapshot"}, max_fps=20)
+    viewers = [FakeWebSocket() for _ in range(50)]
+    for ws in viewers:
+        relay.add(ws)
+
+    for n in range(30):
+        relay.publish({"type": "tick", "n": n})
+    await asyncio.sleep(0.01)
+    relay.publish({"type": "tick", "n": 30})
+    await asyncio.sleep(0.08)
+
+    first = viewers[0].frames
+    assert json.loads(first[0])["type"] == "auction_snapshot"
+    batches = [json.loads(frame)["payload"]["messages"] for frame in first[1:]]
+    assert [len(batch) for batch in batches] == [30, 1]
+    # stesso oggetto str per tutti: il frame è serializzato una sola volta
+    assert all(ws.frames[1] is first[1] for ws in viewers)
+    assert len(snapshots) == 1
+    assert relay.stats()["frames"] == 2
+
+
+def test_spectator_endpoint_is_read_only():
+    with TestClient(app) as client:
+        auction_id = client.post("/auctions/", json={"name": "Lega", "nickname": "host", "budget": 500, "max_teams": 4, "spectator_fps": 50}).json()["auction_id"]
+        with client.websocket_connect(f"/auctions/{auction_id}/spectate") as viewer, \
+                client.websocket_connect(f"/auctions/{auction_id}/ws") as player:
+            assert viewer.receive_json()["type"] == "auction_snapshot"
+            assert viewer.receive_json()["type"] == "player_pool_snapshot"
+
+            viewer.send_json({"type": "join", "payload": {"name": "Intruso"}})
+            player.send_json({"type": "join", "payload": {"name": "Mario"}})
+
+            batch = viewer.receive_json()
+            assert batch["type"] == "spectator_batch"
+            assert batch["payload"]["messages"][0]["payload"]["changes"][0]["participant"]["name"] == "Mario"
+            assert [p["name"] for p in client.get(f"/auctions/{auction_id}").json()["participants"]] == ["Mario"]
+            assert client.get(f"/auctions/{auction_id}/spectators").json()["viewers"] == 1
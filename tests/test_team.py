@@ -0,0 +1,99 @@
+import pytest
+
+from core.budget_strategies import LimitedBudgetStrategy, UnlimitedBudgetStrategy
+from core.enums import PlayerRole
+from core.ownership_policies import MaxCopiesOwnershipPolicy, NoDuplicatesOwnershipPolicy
+from core.player import Player
+from core.team import Team
+from core.team_building_strategies.fixed_max_strategy import FixedMaxStrategy
+
+
+def test_per_player_and_role_counters_follow_add_player():
+    team = Team(1, "Team 1")
+    leao = Player(8, "R. Leão", PlayerRole.FORWARD, "Milan")
+
+    team.add_player(leao, 20)
+    team.add_player(leao, 20)
+    team.add_player(Player(2, "T. Hernandez", PlayerRole.DEFENDER, "Milan"), 10)
+
+    assert team.has_player(leao)
+    assert team.player_count(leao) == 2
+    # contati per id, non per istanza
+    assert team.player_count(Player(8, "R. Leão", PlayerRole.FORWARD, "Milan")) == 2
+    assert team._player_counts == {8: 2, 2: 1}
+    assert team.count_by_role(PlayerRole.A) == 2
+    assert team.count_by_role(PlayerRole.GOALKEEPER) == 0
+    assert not NoDuplicatesOwnershipPolicy().can_own(team, leao)
+    assert not MaxCopiesOwnershipPolicy(2).can_own(team, leao)
+
+
+def test_fixed_max_strategy_uses_role_counters():
+    strategy = FixedMaxStrategy({PlayerRole.P: 1, PlayerRole.D: 0, PlayerRole.C: 0, PlayerRole.A: 0})
+    team = Team(1, "Team 1")
+    keeper = Player(1, "G. Donnarumma", PlayerRole.GOALKEEPER, "PSG")
+
+    assert strategy.can_assign(team, keeper, 1)
+    team.add_player(keeper, 1)
+    assert not strategy.can_assign(team, keeper, 1)
+    assert strategy.is_complete(team)
+
+
+def test_max_bid_keeps_one_min_price_per_required_slot():
+    team = Team(1, "Team 1")
+    team.budget = 100
+    strategy = FixedMaxStrategy({PlayerRole.P: 1, PlayerRole.D: 2, PlayerRole.C: 0, PlayerRole.A: 0})
+    team.set_requirements(strategy.roles_remaining(team), min_price=2)
+
+    # tre slot da riempire: chi compra un difensore ne deve riservare due
+    assert team.required_slots == 3
+    assert team.max_bid == 96
+    assert team.can_afford(96, PlayerRole.D)
+    assert not team.can_afford(97, PlayerRole.D)
+    # un attaccante non riempie slot obbligatori: riserva anche il terzo
+    assert team.max_bid_for(PlayerRole.A) == 94
+
+    team.add_player(Player(2, "T. Hernandez", PlayerRole.DEFENDER, "Milan"), 30)
+    team.spent += 30
+    assert team.required_slots == 2
+    assert team.max_bid == 68
+    assert team.reserve_for(PlayerRole.P) == 2
+
+    team.add_player(Player(1, "G. Donnarumma", PlayerRole.GOALKEEPER, "PSG"), 10)
+    team.spent += 10
+    team.add_player(Player(3, "M. de Ligt", PlayerRole.DEFENDER, "Bayern"), 58)
+    team.spent += 58
+    assert team.required_slots == 0
+    assert team.max_bid == team.remaining == 2
+
+
+def test_limited_budget_strategy_respects_the_reserve():
+    team = Team(1, "Team 1")
+    team.set_requirements({PlayerRole.D: 2}, min_price=1)
+    defender = Player(2, "T. Hernandez", PlayerRole.DEFENDER, "Milan")
+
+    assert LimitedBudgetStrategy(10).can_afford(team, defender, 9)
+    assert not LimitedBudgetStrategy(10).can_afford(team, defender, 10)
+
+
+def test_team_has_no_instance_dict():
+    with pytest.raises(AttributeError):
+        Team(1, "Team 1").nickname = "x"
+
+
+def test_player_role_hashes_by_identity():
+    # alias e nome canonico sono lo stesso membro: stessa chiave nei contatori
+    assert hash(PlayerRole.A) == object.__hash__(PlayerRole.FORWARD)
+    counts = {PlayerRole.FORWARD: 2}
+    assert counts[PlayerRole.A] == 2 and counts[PlayerRole.Fw] == 2
+    assert PlayerRole.P not in counts
+
+
+def test_unlimited_budget_records_the_purchase_on_the_team():
+    team = Team(1, "Team 1")
+    keeper = Player(1, "G. Donnarumma", PlayerRole.GOALKEEPER, "PSG")
+
+    UnlimitedBudgetStrategy().apply_purchase(team, keeper, 700)
+
+    # come LimitedBudgetStrategy: il giocatore entra in rosa e la spesa è tracciata
+    assert team.roster == [keeper] and team.count_by_role(PlayerRole.P) == 1
+    assert team.spent == 700